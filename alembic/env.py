@@ -17,6 +17,7 @@ from app.core.database import Base
 
 # Import all models to register them with Base.metadata
 from app.models.book import Book  # noqa: F401
+from app.models.book_trigram import BookTrigram  # noqa: F401
 from app.models.cart import Cart  # noqa: F401
 from app.models.favorite import Favorite  # noqa: F401
 from app.models.order import Order  # noqa: F401
@@ -0,0 +1,52 @@
+"""Add book full-text search index
+
+Revision ID: 4f8a1c2e9b37
+Revises: c2b12e2d60d3
+Create Date: 2026-10-17 10:12:04.118532+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.models.book_search import BOOK_SEARCH_TABLE, SQLITE_BOOK_SEARCH_DDL
+
+# revision identifiers, used by Alembic.
+revision: str = "4f8a1c2e9b37"
+down_revision: Union[str, None] = "c2b12e2d60d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "mysql":
+        op.create_index(
+            "ftBookSearch",
+            "book",
+            ["title", "author", "publisher"],
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        )
+    elif dialect == "sqlite":
+        for statement in SQLITE_BOOK_SEARCH_DDL:
+            op.execute(statement)
+        # 기존 도서 데이터로 색인 재구성
+        op.execute(
+            f"INSERT INTO \"{BOOK_SEARCH_TABLE}\"(\"{BOOK_SEARCH_TABLE}\") "
+            "VALUES ('rebuild')"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "mysql":
+        op.drop_index("ftBookSearch", table_name="book")
+    elif dialect == "sqlite":
+        for trigger in ("bookSearchInsert", "bookSearchDelete", "bookSearchUpdate"):
+            op.execute(f'DROP TRIGGER IF EXISTS "{trigger}"')
+        op.execute(f'DROP TABLE IF EXISTS "{BOOK_SEARCH_TABLE}"')
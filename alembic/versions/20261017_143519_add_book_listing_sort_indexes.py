@@ -0,0 +1,37 @@
+"""Add book listing sort indexes
+
+Revision ID: 9d3e6b0a7c21
+Revises: 4f8a1c2e9b37
+Create Date: 2026-10-17 14:35:19.402716+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3e6b0a7c21"
+down_revision: Union[str, None] = "4f8a1c2e9b37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스명, 정렬 컬럼) - 모두 (status, <정렬 컬럼>, id) 복합 인덱스
+BOOK_SORT_INDEXES = [
+    ("ixBookStatusPrice", "price"),
+    ("ixBookStatusCreatedAt", "createdAt"),
+    ("ixBookStatusAverageRating", "averageRating"),
+    ("ixBookStatusPurchaseCount", "purchaseCount"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    for index_name, column in BOOK_SORT_INDEXES:
+        op.create_index(index_name, "book", ["status", column, "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for index_name, _ in reversed(BOOK_SORT_INDEXES):
+        op.drop_index(index_name, table_name="book")
@@ -0,0 +1,35 @@
+"""Add book category column
+
+Revision ID: 6b1d4e8f2a90
+Revises: 9d3e6b0a7c21
+Create Date: 2026-10-17 17:08:42.531904+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6b1d4e8f2a90"
+down_revision: Union[str, None] = "9d3e6b0a7c21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.add_column("book", sa.Column("category", sa.String(length=20), nullable=True))
+    op.create_index(
+        "ixBookStatusCategoryCreatedAt",
+        "book",
+        ["status", "category", "createdAt", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ixBookStatusCategoryCreatedAt", table_name="book")
+    op.drop_column("book", "category")
@@ -0,0 +1,63 @@
+"""Add book trigram index for fuzzy search
+
+Revision ID: 2c7e9a4d1f63
+Revises: 6b1d4e8f2a90
+Create Date: 2026-10-17 20:15:17.264081+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from app.utils.trigram import trigrams
+
+# revision identifiers, used by Alembic.
+revision: str = "2c7e9a4d1f63"
+down_revision: Union[str, None] = "6b1d4e8f2a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    book_trigram = op.create_table(
+        "bookTrigram",
+        sa.Column(
+            "trigram",
+            sa.String(length=3).with_variant(
+                mysql.VARCHAR(length=3, collation="utf8mb4_bin"), "mysql"
+            ),
+            nullable=False,
+        ),
+        sa.Column("bookId", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["bookId"], ["book.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("trigram", "bookId"),
+    )
+    op.create_index("ixBookTrigramBookId", "bookTrigram", ["bookId"], unique=False)
+
+    # 기존 도서 색인 생성
+    connection = op.get_bind()
+    books = connection.execute(sa.text("SELECT id, title, author FROM book"))
+    rows = []
+    for book_id, title, author in books:
+        rows.extend(
+            {"trigram": trigram, "bookId": book_id}
+            for trigram in trigrams(title) | trigrams(author)
+        )
+        if len(rows) >= BACKFILL_BATCH_SIZE:
+            op.bulk_insert(book_trigram, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(book_trigram, rows)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_index("ixBookTrigramBookId", table_name="bookTrigram")
+    op.drop_table("bookTrigram")
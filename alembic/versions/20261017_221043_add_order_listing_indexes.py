@@ -0,0 +1,36 @@
+"""Add order listing indexes
+
+Revision ID: 8e5f0c3a7b12
+Revises: 2c7e9a4d1f63
+Create Date: 2026-10-17 22:10:43.518204+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8e5f0c3a7b12"
+down_revision: Union[str, None] = "2c7e9a4d1f63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스명, 컬럼) - 목록 정렬 키 (createdAt, id) 앞에 필터 컬럼
+ORDER_LISTING_INDEXES = [
+    ("ixOrderUserIdCreatedAt", ["userId", "createdAt", "id"]),
+    ("ixOrderStatusCreatedAt", ["status", "createdAt", "id"]),
+    ("ixOrderCreatedAt", ["createdAt", "id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    for index_name, columns in ORDER_LISTING_INDEXES:
+        op.create_index(index_name, "order", columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    for index_name, _ in reversed(ORDER_LISTING_INDEXES):
+        op.drop_index(index_name, table_name="order")
@@ -0,0 +1,32 @@
+"""Add purchase count batch marker table
+
+Revision ID: 3a9c5e7b1d48
+Revises: 8e5f0c3a7b12
+Create Date: 2026-10-17 23:45:12.604318+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3a9c5e7b1d48"
+down_revision: Union[str, None] = "8e5f0c3a7b12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    op.create_table(
+        "purchaseCountBatch",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    op.drop_table("purchaseCountBatch")
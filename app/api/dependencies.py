@@ -12,17 +12,19 @@ from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
 from app.core.security import decode_token
 from app.exceptions.auth_exceptions import ForbiddenException, UnauthorizedException
-from app.models.user import User
+from app.repositories.user_repository import UserRepository
 from app.services.auth_service import AuthService
 from app.services.book_service import BookService
 from app.services.cart_service import CartService
 from app.services.favorite_service import FavoriteService
 from app.services.order_service import OrderService
+from app.services.principal_cache import Principal, PrincipalCache
 from app.services.ranking_service import RankingService
 from app.services.review_service import ReviewService
 from app.services.sale_service import SaleService
 from app.services.seller_service import SellerService
 from app.services.settlement_service import SettlementService
+from app.services.token_revocation import token_revocation
 from app.services.user_service import UserService
 
 
@@ -43,49 +45,74 @@ def get_db() -> Generator[Session, None, None]:
 
 
 # ============ Auth Dependencies ============
-def get_current_user(
-    authorization: Optional[str] = Header(None), db: Session = Depends(get_db)
-) -> User:
-    """Extract and validate current user from JWT token.
-
-    Args:
-        authorization: Bearer token from Authorization header.
-        db: Database session dependency.
-
-    Returns:
-        User: Authenticated user object.
+def get_access_token(authorization: Optional[str] = Header(None)) -> str:
+    """Return the bearer token of the request.
 
     Raises:
-        UnauthorizedException: If token is invalid or user not found.
+        UnauthorizedException: If the Authorization header is missing.
     """
     if not authorization or not authorization.startswith("Bearer "):
         raise UnauthorizedException()
+    return authorization.split(" ")[1]
+
 
-    token = authorization.split(" ")[1]
+def _authenticate(authorization: Optional[str], db: Session) -> Principal:
+    token = get_access_token(authorization)
     payload = decode_token(token)
 
     if not payload or payload.get("type") != "access":
         raise UnauthorizedException("Invalid or expired token")
 
-    user_id = payload.get("sub")
-    from app.repositories.user_repository import UserRepository
+    # 폐기(로그아웃)된 토큰 확인 - Bloom filter 적중 시에만 Redis 조회
+    jti = payload.get("jti")
+    if jti and token_revocation.is_revoked(jti):
+        raise UnauthorizedException("Token has been revoked")
+
+    user_id = int(payload.get("sub"))
+
+    def load(user_id: int) -> Optional[Principal]:
+        row = UserRepository(db).get_principal_row(user_id)
+        if row is None:
+            return None
+        return Principal(id=row.id, role=row.role, is_active=row.is_active)
 
-    user_repo = UserRepository(db)
-    user = user_repo.get_by_id(int(user_id))
+    # 캐시 적중 시 DB 조회 없음 (세션은 지연 연결이므로 커넥션도 사용하지 않음)
+    principal = PrincipalCache.get_or_load(user_id, load)
 
-    if not user:
+    if not principal:
         raise UnauthorizedException("User not found")
 
     # 계정 비활성화 여부 확인
-    if not user.is_active:
+    if not principal.is_active:
         raise UnauthorizedException("Account is deactivated")
 
-    return user
+    return principal
+
+
+def get_current_user(
+    authorization: Optional[str] = Header(None), db: Session = Depends(get_db)
+) -> Principal:
+    """Extract and validate current user from JWT token.
+
+    The user's role and activation status are served from the principal
+    cache, so the hot path does not query the user table.
+
+    Args:
+        authorization: Bearer token from Authorization header.
+        db: Database session dependency (used only on a cache miss).
+
+    Returns:
+        Principal: Authenticated user (id, role, is_active).
+
+    Raises:
+        UnauthorizedException: If token is invalid or revoked, or user not found.
+    """
+    return _authenticate(authorization, db)
 
 
 def get_current_user_optional(
     authorization: Optional[str] = Header(None), db: Session = Depends(get_db)
-) -> Optional[User]:
+) -> Optional[Principal]:
     """Extract current user from JWT token without raising exceptions.
 
     Args:
@@ -93,30 +120,20 @@ def get_current_user_optional(
         db: Database session dependency.
 
     Returns:
-        Optional[User]: User object if valid token, None otherwise.
+        Optional[Principal]: Active user if valid token, None otherwise.
     """
     if not authorization or not authorization.startswith("Bearer "):
         return None
 
     try:
-        token = authorization.split(" ")[1]
-        payload = decode_token(token)
-
-        if not payload or payload.get("type") != "access":
-            return None
-
-        user_id = payload.get("sub")
-        from app.repositories.user_repository import UserRepository
-
-        user_repo = UserRepository(db)
-        return user_repo.get_by_id(int(user_id))
+        return _authenticate(authorization, db)
     except Exception:
         # Silently handle any token parsing or database errors
         return None
 
 
 def require_role(*allowed_roles: str):
-    def role_checker(current_user: User = Depends(get_current_user)) -> User:
+    def role_checker(current_user: Principal = Depends(get_current_user)) -> Principal:
         if current_user.role not in allowed_roles:
             raise ForbiddenException(f"Required role: {', '.join(allowed_roles)}")
         return current_user
@@ -124,7 +141,7 @@ def require_role(*allowed_roles: str):
     return role_checker
 
 
-def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
+def get_admin_user(current_user: Principal = Depends(get_current_user)) -> Principal:
     """Verify current user has admin role.
 
     This is a convenience dependency for endpoints requiring admin access.
@@ -134,7 +151,7 @@ def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
         current_user: Authenticated user from get_current_user dependency.
 
     Returns:
-        User: The admin user object.
+        Principal: The admin user.
 
     Raises:
         ForbiddenException: If user is not an admin.
@@ -144,7 +161,7 @@ def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
-def get_seller_user(current_user: User = Depends(get_current_user)) -> User:
+def get_seller_user(current_user: Principal = Depends(get_current_user)) -> Principal:
     """Verify current user has seller or admin role.
 
     This is a convenience dependency for endpoints requiring seller access.
@@ -154,7 +171,7 @@ def get_seller_user(current_user: User = Depends(get_current_user)) -> User:
         current_user: Authenticated user from get_current_user dependency.
 
     Returns:
-        User: The seller or admin user object.
+        Principal: The seller or admin user.
 
     Raises:
         ForbiddenException: If user is neither seller nor admin.
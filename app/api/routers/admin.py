@@ -3,11 +3,11 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query
 
 from app.api.dependencies import get_admin_user, get_order_service, get_settlement_service
-from app.models.user import User
 from app.schemas.order import OrderListResponse
 from app.schemas.response import SuccessResponse
 from app.schemas.settlement import SettlementCalculateResponse
 from app.services.order_service import OrderService
+from app.services.principal_cache import Principal
 from app.services.settlement_service import SettlementService
 
 router = APIRouter()
@@ -18,11 +18,23 @@ def get_all_orders(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     status: Optional[str] = None,
-    admin_user: User = Depends(get_admin_user),
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    admin_user: Principal = Depends(get_admin_user),
     service: OrderService = Depends(get_order_service),
 ):
-    """전체 주문 현황 조회 (관리자용)"""
-    result = service.get_all_orders(page=page, size=size, status=status)
+    """전체 주문 현황 조회 (관리자용)
+
+    - cursor: 이전 응답의 next_cursor (지정 시 page 대신 keyset 페이지네이션)
+    - include_total: false이면 전체 개수 집계를 생략 (total: null)
+    """
+    result = service.get_all_orders(
+        page=page,
+        size=size,
+        status=status,
+        cursor=cursor,
+        include_total=include_total,
+    )
     return SuccessResponse(data=result)
 
 
@@ -31,7 +43,7 @@ def get_all_orders(
     response_model=SuccessResponse[SettlementCalculateResponse],
 )
 def calculate_settlements(
-    admin_user: User = Depends(get_admin_user),
+    admin_user: Principal = Depends(get_admin_user),
     service: SettlementService = Depends(get_settlement_service),
 ):
     """정산 데이터 생성 (관리자 트리거)
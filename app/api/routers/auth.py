@@ -1,19 +1,21 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, Request
 
-from app.api.dependencies import get_auth_service, get_current_user
+from app.api.dependencies import get_access_token, get_auth_service, get_current_user
 from app.core.limiter import limiter
-from app.models.user import User
-from app.schemas.auth import TokenRefresh, TokenResponse
+from app.schemas.auth import LogoutRequest, TokenRefresh, TokenResponse
 from app.schemas.response import SuccessResponse
 from app.schemas.user import UserCreate, UserLogin, UserResponse
 from app.services.auth_service import AuthService
+from app.services.principal_cache import Principal
 
 router = APIRouter()
 
 
 @router.post("/signup", response_model=SuccessResponse[UserResponse], status_code=201)
 @limiter.limit("10/minute")
-def signup(
+async def signup(
     request: Request,
     user_data: UserCreate,
     auth_service: AuthService = Depends(get_auth_service)
@@ -22,7 +24,7 @@ def signup(
 
     Rate Limit: 분당 10회
     """
-    user = auth_service.signup(user_data)
+    user = await auth_service.signup(user_data)
     return SuccessResponse(
         data=UserResponse.model_validate(user), message="User registered successfully"
     )
@@ -30,7 +32,7 @@ def signup(
 
 @router.post("/login", response_model=SuccessResponse[TokenResponse])
 @limiter.limit("5/minute")
-def login(
+async def login(
     request: Request,
     login_data: UserLogin,
     auth_service: AuthService = Depends(get_auth_service)
@@ -39,7 +41,7 @@ def login(
 
     Rate Limit: 분당 5회 (Brute Force 방지)
     """
-    tokens = auth_service.login(login_data.email, login_data.password)
+    tokens = await auth_service.login(login_data.email, login_data.password)
     return SuccessResponse(data=tokens, message="Login successful")
 
 
@@ -60,9 +62,13 @@ def refresh_token(
 
 @router.post("/logout", response_model=SuccessResponse)
 def logout(
-    current_user: User = Depends(get_current_user),
+    logout_data: Optional[LogoutRequest] = None,
+    current_user: Principal = Depends(get_current_user),
+    access_token: str = Depends(get_access_token),
     auth_service: AuthService = Depends(get_auth_service),
 ):
-    """로그아웃"""
-    auth_service.logout()
+    """로그아웃 (액세스 토큰 폐기, 리프레시 토큰을 함께 보내면 같이 폐기)"""
+    auth_service.logout(
+        access_token, logout_data.refresh_token if logout_data else None
+    )
     return SuccessResponse(message="Logged out successfully")
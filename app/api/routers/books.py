@@ -1,18 +1,25 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, File, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import get_book_service, get_seller_user
-from app.models.user import User
 from app.schemas.book import (
+    BookCategory,
     BookCreate,
+    BookFileFormat,
+    BookImportResponse,
     BookListResponse,
     BookResponse,
     BookSortBy,
+    BookSuggestResponse,
     BookUpdate,
 )
 from app.schemas.response import SuccessResponse
 from app.services.book_service import BookService
+from app.services.principal_cache import Principal
+from app.utils.book_import import detect_import_format
+from app.utils.http_cache import conditional_response
 
 router = APIRouter()
 
@@ -20,7 +27,7 @@ router = APIRouter()
 @router.post("/", response_model=SuccessResponse[BookResponse], status_code=201)
 def create_book(
     book_data: BookCreate,
-    current_user: User = Depends(get_seller_user),
+    current_user: Principal = Depends(get_seller_user),
     service: BookService = Depends(get_book_service),
 ):
     """도서 등록 (Seller only)"""
@@ -30,34 +37,126 @@ def create_book(
     )
 
 
+@router.post("/import", response_model=SuccessResponse[BookImportResponse])
+def import_books(
+    file: UploadFile = File(...),
+    format: Optional[BookFileFormat] = None,
+    current_user: Principal = Depends(get_seller_user),
+    service: BookService = Depends(get_book_service),
+):
+    """도서 대량 등록 (Seller only)
+
+    - file: CSV(헤더 포함) 또는 NDJSON 파일, 필드는 도서 등록 요청과 동일
+    - format: csv / ndjson (생략 시 파일 확장자나 Content-Type으로 판단)
+    - 유효한 행만 배치 단위로 등록하고, 실패한 행은 errors에 행 번호와 함께 보고
+    """
+    import_format = format or detect_import_format(file.filename, file.content_type)
+    result = service.import_books(current_user.id, file.file, import_format)
+    return SuccessResponse(
+        data=result,
+        message=f"Imported {result.created} of {result.total_rows} books",
+    )
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_books(
+    format: BookFileFormat = BookFileFormat.NDJSON,
+    seller_id: Optional[int] = None,
+    gzip: bool = False,
+    current_user: Principal = Depends(get_seller_user),
+    service: BookService = Depends(get_book_service),
+):
+    """도서 카탈로그 내보내기 (Seller - 본인 도서, Admin - 전체)
+
+    - format: ndjson (기본) 또는 csv (헤더 포함)
+    - seller_id: 특정 판매자 도서만 내보내기 (Admin only, Seller는 무시)
+    - gzip: true이면 gzip 압축 파일로 전송
+    - 한 번의 요청으로 전체 카탈로그를 스트리밍 (카탈로그 크기와 무관하게 메모리 일정)
+    """
+    chunks = service.export_books(
+        current_user.id,
+        is_admin=current_user.role == "admin",
+        fmt=format,
+        seller_id=seller_id,
+        compress=gzip,
+    )
+
+    filename = f"books.{format.value}" + (".gz" if gzip else "")
+    media_type = {
+        BookFileFormat.NDJSON: "application/x-ndjson",
+        BookFileFormat.CSV: "text/csv; charset=utf-8",
+    }[format]
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip" if gzip else media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/suggest", response_model=SuccessResponse[BookSuggestResponse])
+def suggest_books(
+    q: str = Query(..., min_length=1, max_length=20),
+    limit: int = Query(10, ge=1, le=20),
+    service: BookService = Depends(get_book_service),
+):
+    """검색어 자동완성 (판매 중 도서, 판매량 순)
+
+    - q: 입력 중인 검색어 (제목/저자/출판사의 시작 또는 단어 시작과 일치)
+    - DB를 조회하지 않고 메모리 색인에서 응답
+    """
+    return SuccessResponse(data=service.suggest_books(q, limit))
+
+
 @router.get("/", response_model=SuccessResponse[BookListResponse])
 def get_books(
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     keyword: Optional[str] = None,
-    category: Optional[str] = None,
+    category: Optional[BookCategory] = None,
     sort: BookSortBy = BookSortBy.DATE_DESC,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    facets: bool = False,
+    fuzzy: bool = False,
     service: BookService = Depends(get_book_service),
 ):
-    """도서 목록 조회 (검색, 정렬, 필터)"""
+    """도서 목록 조회 (검색, 정렬, 필터)
+
+    - cursor: 이전 응답의 next_cursor (지정 시 page 대신 keyset 페이지네이션)
+    - include_total: false이면 전체 개수 집계를 생략 (total: null)
+    - facets: true이면 출판사/가격대/평점대/판매 상태별 도서 수를 함께 반환
+    - fuzzy: true이면 오타를 허용하는 유사도(trigram) 검색 (sort=relevance 시 유사도순)
+    - If-None-Match가 현재 ETag와 일치하면 304 (본문 없음)
+    """
     result = service.get_books(
-        page=page, size=size, keyword=keyword, category=category, sort=sort
+        page=page,
+        size=size,
+        keyword=keyword,
+        category=category,
+        sort=sort,
+        cursor=cursor,
+        include_total=include_total,
+        facets=facets,
+        fuzzy=fuzzy,
     )
-    return SuccessResponse(data=result)
+    return conditional_response(request, SuccessResponse(data=result))
 
 
 @router.get("/{book_id}", response_model=SuccessResponse[BookResponse])
-def get_book(book_id: int, service: BookService = Depends(get_book_service)):
-    """도서 상세 조회"""
+def get_book(
+    request: Request, book_id: int, service: BookService = Depends(get_book_service)
+):
+    """도서 상세 조회 (If-None-Match가 현재 ETag와 일치하면 304)"""
     book = service.get_book(book_id)
-    return SuccessResponse(data=BookResponse.model_validate(book))
+    return conditional_response(request, SuccessResponse(data=book))
 
 
 @router.put("/{book_id}", response_model=SuccessResponse[BookResponse])
 def update_book(
     book_id: int,
     update_data: BookUpdate,
-    current_user: User = Depends(get_seller_user),
+    current_user: Principal = Depends(get_seller_user),
     service: BookService = Depends(get_book_service),
 ):
     """도서 정보 수정 (Seller - 본인 책만)"""
@@ -70,7 +169,7 @@ def update_book(
 @router.delete("/{book_id}", response_model=SuccessResponse)
 def delete_book(
     book_id: int,
-    current_user: User = Depends(get_seller_user),
+    current_user: Principal = Depends(get_seller_user),
     service: BookService = Depends(get_book_service),
 ):
     """도서 삭제 (상태 변경: SOLDOUT) (Seller - 본인 책만)"""
@@ -1,17 +1,17 @@
 from fastapi import APIRouter, Depends
 
 from app.api.dependencies import get_cart_service, get_current_user
-from app.models.user import User
 from app.schemas.cart import CartCreate, CartItemResponse, CartListResponse, CartUpdate
 from app.schemas.response import SuccessResponse
 from app.services.cart_service import CartService
+from app.services.principal_cache import Principal
 
 router = APIRouter()
 
 
 @router.get("/", response_model=SuccessResponse[CartListResponse])
 def get_my_cart(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: CartService = Depends(get_cart_service),
 ):
     """내 장바구니 목록 조회"""
@@ -22,7 +22,7 @@ def get_my_cart(
 @router.post("/", response_model=SuccessResponse[CartItemResponse], status_code=201)
 def add_to_cart(
     cart_data: CartCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: CartService = Depends(get_cart_service),
 ):
     """장바구니 담기"""
@@ -34,7 +34,7 @@ def add_to_cart(
 def update_cart_quantity(
     cart_id: int,
     update_data: CartUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: CartService = Depends(get_cart_service),
 ):
     """수량 변경"""
@@ -45,7 +45,7 @@ def update_cart_quantity(
 @router.delete("/{cart_id}", response_model=SuccessResponse)
 def remove_from_cart(
     cart_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: CartService = Depends(get_cart_service),
 ):
     """장바구니 아이템 삭제"""
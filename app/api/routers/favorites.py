@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends
 
 from app.api.dependencies import get_current_user, get_favorite_service
-from app.models.user import User
 from app.schemas.favorite import FavoriteBookResponse, FavoriteListResponse
 from app.schemas.response import SuccessResponse
 from app.services.favorite_service import FavoriteService
+from app.services.principal_cache import Principal
 
 router = APIRouter()
 
@@ -16,7 +16,7 @@ router = APIRouter()
 )
 def add_favorite(
     book_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: FavoriteService = Depends(get_favorite_service),
 ):
     """찜하기 등록"""
@@ -27,7 +27,7 @@ def add_favorite(
 @router.delete("/books/{book_id}/favorites", response_model=SuccessResponse)
 def remove_favorite(
     book_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: FavoriteService = Depends(get_favorite_service),
 ):
     """찜하기 취소"""
@@ -37,7 +37,7 @@ def remove_favorite(
 
 @router.get("/favorites", response_model=SuccessResponse[FavoriteListResponse])
 def get_my_favorites(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: FavoriteService = Depends(get_favorite_service),
 ):
     """내가 찜한 목록 조회"""
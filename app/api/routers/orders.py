@@ -1,12 +1,12 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 
 from app.api.dependencies import get_admin_user, get_current_user, get_order_service
-from app.models.user import User
 from app.schemas.order import OrderCreate, OrderListResponse, OrderResponse
 from app.schemas.response import SuccessResponse
 from app.services.order_service import OrderService
+from app.services.principal_cache import Principal
 
 router = APIRouter()
 
@@ -14,11 +14,16 @@ router = APIRouter()
 @router.post("/", response_model=SuccessResponse[OrderResponse], status_code=201)
 def create_order(
     order_data: OrderCreate,
-    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    current_user: Principal = Depends(get_current_user),
     service: OrderService = Depends(get_order_service),
 ):
-    """주문 생성 (장바구니 결제)"""
-    order = service.create_order(current_user.id, order_data)
+    """주문 생성 (장바구니 결제)
+
+    - Idempotency-Key 헤더: 같은 키로 재시도하면 주문을 다시 만들지 않고 첫 요청의
+      결과를 반환 (처리 중이면 409, 다른 요청 본문이면 422)
+    """
+    order = service.create_order(current_user.id, order_data, idempotency_key)
     return SuccessResponse(data=order, message="Order created successfully")
 
 
@@ -26,18 +31,30 @@ def create_order(
 def get_my_orders(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    current_user: Principal = Depends(get_current_user),
     service: OrderService = Depends(get_order_service),
 ):
-    """내 주문 내역 조회 (페이지네이션)"""
-    result = service.get_my_orders(current_user.id, page=page, size=size)
+    """내 주문 내역 조회 (페이지네이션)
+
+    - cursor: 이전 응답의 next_cursor (지정 시 page 대신 keyset 페이지네이션)
+    - include_total: false이면 전체 개수 집계를 생략 (total: null)
+    """
+    result = service.get_my_orders(
+        current_user.id,
+        page=page,
+        size=size,
+        cursor=cursor,
+        include_total=include_total,
+    )
     return SuccessResponse(data=result)
 
 
 @router.get("/{order_id}", response_model=SuccessResponse[OrderResponse])
 def get_order(
     order_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: OrderService = Depends(get_order_service),
 ):
     """주문 상세 조회 (주문 상품 포함)"""
@@ -48,7 +65,7 @@ def get_order(
 @router.post("/{order_id}/cancel", response_model=SuccessResponse[OrderResponse])
 def cancel_order(
     order_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: OrderService = Depends(get_order_service),
 ):
     """주문 취소"""
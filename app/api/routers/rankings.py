@@ -1,17 +1,19 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 
 from app.api.dependencies import get_ranking_service
 from app.schemas.ranking import RankingListResponse, RankingType
 from app.schemas.response import SuccessResponse
 from app.services.ranking_service import RankingService
+from app.utils.http_cache import conditional_response
 
 router = APIRouter()
 
 
 @router.get("/", response_model=SuccessResponse[RankingListResponse])
 async def get_rankings(
+    request: Request,
     type: RankingType = Query(RankingType.PURCHASE_COUNT, alias="type"),
     age_group: Optional[str] = Query(None, alias="ageGroup"),
     gender: Optional[str] = None,
@@ -24,8 +26,9 @@ async def get_rankings(
     - ageGroup: 연령대 필터링 (선택)
     - gender: 성별 필터링 (선택)
     - limit: 반환할 항목 수 (기본값: 10, 최대: 100)
+    - If-None-Match가 현재 ETag와 일치하면 304 (본문 없음)
     """
     result = await service.get_rankings_cached(
         ranking_type=type, age_group=age_group, gender=gender, limit=limit
     )
-    return SuccessResponse(data=result)
+    return conditional_response(request, SuccessResponse(data=result))
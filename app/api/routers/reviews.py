@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends
 
 from app.api.dependencies import get_current_user, get_review_service
-from app.models.user import User
 from app.schemas.response import SuccessResponse
 from app.schemas.review import ReviewCreate, ReviewListResponse, ReviewResponse, ReviewUpdate
+from app.services.principal_cache import Principal
 from app.services.review_service import ReviewService
 
 router = APIRouter()
@@ -17,7 +17,7 @@ router = APIRouter()
 def create_review(
     book_id: int,
     review_data: ReviewCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: ReviewService = Depends(get_review_service),
 ):
     """리뷰 작성 (OrderItems 확인 필수 - 구매자만)"""
@@ -44,7 +44,7 @@ def update_review_by_book(
     book_id: int,
     review_id: int,
     update_data: ReviewUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: ReviewService = Depends(get_review_service),
 ):
     """리뷰 수정 (작성자 본인만 가능) - 책 ID 포함 경로"""
@@ -56,7 +56,7 @@ def update_review_by_book(
 def update_review(
     review_id: int,
     update_data: ReviewUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: ReviewService = Depends(get_review_service),
 ):
     """리뷰 수정 (작성자 본인만 가능) - 레거시 경로"""
@@ -67,7 +67,7 @@ def update_review(
 @router.delete("/reviews/{review_id}", response_model=SuccessResponse)
 def delete_review(
     review_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: ReviewService = Depends(get_review_service),
 ):
     """리뷰 삭제 (작성자 또는 Admin)"""
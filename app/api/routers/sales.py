@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends
 
 from app.api.dependencies import get_sale_service, get_seller_user
-from app.models.user import User
 from app.schemas.response import SuccessResponse
 from app.schemas.sale import SaleBookAdd, SaleCreate, SaleResponse
+from app.services.principal_cache import Principal
 from app.services.sale_service import SaleService
 
 router = APIRouter()
@@ -12,7 +12,7 @@ router = APIRouter()
 @router.post("/", response_model=SuccessResponse[SaleResponse], status_code=201)
 def create_sale(
     sale_data: SaleCreate,
-    current_user: User = Depends(get_seller_user),
+    current_user: Principal = Depends(get_seller_user),
     service: SaleService = Depends(get_sale_service),
 ):
     """타임 세일 이벤트 생성 (Seller only)"""
@@ -24,7 +24,7 @@ def create_sale(
 def add_book_to_sale(
     sale_id: int,
     book_data: SaleBookAdd,
-    current_user: User = Depends(get_seller_user),
+    current_user: Principal = Depends(get_seller_user),
     service: SaleService = Depends(get_sale_service),
 ):
     """세일 적용 도서 추가 (Seller only)"""
@@ -4,9 +4,9 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query
 
 from app.api.dependencies import get_seller_user, get_settlement_service
-from app.models.user import User
 from app.schemas.response import SuccessResponse
 from app.schemas.settlement import SettlementListResponse
+from app.services.principal_cache import Principal
 from app.services.settlement_service import SettlementService
 
 router = APIRouter()
@@ -16,7 +16,7 @@ router = APIRouter()
 def get_my_settlements(
     start_date: Optional[date] = Query(None, alias="startDate"),
     end_date: Optional[date] = Query(None, alias="endDate"),
-    current_user: User = Depends(get_seller_user),
+    current_user: Principal = Depends(get_seller_user),
     service: SettlementService = Depends(get_settlement_service),
 ):
     """정산 내역 조회 (기간별) - Seller only"""
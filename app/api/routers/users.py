@@ -3,7 +3,6 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Query
 
 from app.api.dependencies import get_admin_user, get_current_user, get_user_service
-from app.models.user import User
 from app.schemas.response import SuccessResponse
 from app.schemas.user import (
     PasswordChange,
@@ -12,6 +11,7 @@ from app.schemas.user import (
     UserRoleUpdate,
     UserUpdate,
 )
+from app.services.principal_cache import Principal
 from app.services.user_service import UserService
 
 router = APIRouter()
@@ -19,7 +19,7 @@ router = APIRouter()
 
 @router.get("/me", response_model=SuccessResponse[UserResponse])
 def get_my_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: UserService = Depends(get_user_service),
 ):
     """내 프로필 조회"""
@@ -30,7 +30,7 @@ def get_my_profile(
 @router.patch("/me", response_model=SuccessResponse[UserResponse])
 def update_my_profile(
     update_data: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: UserService = Depends(get_user_service),
 ):
     """내 프로필 수정 (주소, 전화번호 등)"""
@@ -41,13 +41,13 @@ def update_my_profile(
 
 
 @router.post("/me/password", response_model=SuccessResponse)
-def change_password(
+async def change_password(
     password_data: PasswordChange,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: UserService = Depends(get_user_service),
 ):
     """비밀번호 변경"""
-    service.change_password(current_user.id, password_data)
+    await service.change_password(current_user.id, password_data)
     return SuccessResponse(message="Password changed successfully")
 
 
@@ -56,11 +56,17 @@ def get_all_users(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     keyword: Optional[str] = None,
-    admin_user: User = Depends(get_admin_user),
+    include_total: bool = True,
+    admin_user: Principal = Depends(get_admin_user),
     service: UserService = Depends(get_user_service),
 ):
-    """전체 회원 목록 조회 (페이지네이션, 검색) - Admin only"""
-    result = service.get_all_users(page=page, size=size, keyword=keyword)
+    """전체 회원 목록 조회 (페이지네이션, 검색) - Admin only
+
+    - include_total: false이면 전체 개수 집계를 생략 (total: null)
+    """
+    result = service.get_all_users(
+        page=page, size=size, keyword=keyword, include_total=include_total
+    )
     return SuccessResponse(data=result)
 
 
@@ -68,7 +74,7 @@ def get_all_users(
 def update_user_role(
     user_id: int,
     role_data: UserRoleUpdate,
-    admin_user: User = Depends(get_admin_user),
+    admin_user: Principal = Depends(get_admin_user),
     service: UserService = Depends(get_user_service),
 ):
     """회원 권한 변경 (User ↔ Seller ↔ Admin) - Admin only"""
@@ -81,7 +87,7 @@ def update_user_role(
 @router.patch("/{user_id}/deactivate", response_model=SuccessResponse[UserResponse])
 def deactivate_user(
     user_id: int,
-    admin_user: User = Depends(get_admin_user),
+    admin_user: Principal = Depends(get_admin_user),
     service: UserService = Depends(get_user_service),
 ):
     """사용자 계정 비활성화 - Admin only
@@ -17,7 +17,31 @@ class Settings(BaseSettings):
         APP_VERSION: Application version.
         DEBUG: Debug mode flag.
         DATABASE_URL: Database connection string.
+        REDIS_URL: Redis connection string.
+        REDIS_SOCKET_TIMEOUT: Socket timeout for the sync Redis client.
+        COUNT_ESTIMATE_THRESHOLD: Minimum table size to use estimated counts.
+        BOOK_CACHE_LOCAL_MAXSIZE: Max entries of the per-worker book detail cache.
+        BOOK_CACHE_LOCAL_TTL: Lifetime of per-worker book detail cache entries.
+        PRINCIPAL_CACHE_LOCAL_MAXSIZE: Max entries of the per-worker principal cache.
+        PRINCIPAL_CACHE_LOCAL_TTL: Lifetime of per-worker principal cache entries.
+        BOOK_FACET_PUBLISHER_LIMIT: Max publisher buckets returned as facets.
+        SUGGEST_INDEX_REFRESH_SECONDS: Interval of the suggest index rebuild job.
+        BOOK_IMPORT_BATCH_SIZE: Rows inserted per transaction in bulk imports.
+        BOOK_IMPORT_MAX_ERRORS: Max row errors listed in a bulk import report.
+        RATE_LIMIT_STORAGE_URI: Rate limit storage (default: leased Redis storage).
+        RATE_LIMIT_LEASE_FRACTION: Share of a limit a worker may pre-acquire.
+        RATE_LIMIT_LEASE_SECONDS: Lifetime of pre-acquired rate limit hits.
+        ORDER_EVENT_BACKEND: Order event dispatch (inline, queue or redis).
+        ORDER_EVENT_BATCH_SIZE: Max order events applied per batch.
+        ORDER_EVENT_FLUSH_SECONDS: Max wait for more events before applying a batch.
+        PURCHASE_COUNT_WRITE_BEHIND: Aggregate purchase counts in Redis first.
+        PURCHASE_COUNT_FLUSH_SECONDS: Interval of the purchase count flush job.
         SECRET_KEY: JWT secret key for token generation.
+        TOKEN_CACHE_MAXSIZE: Max verified tokens cached per worker (0 disables).
+        TOKEN_REVOCATION_BLOOM_CAPACITY: Expected revoked tokens per Bloom filter.
+        TOKEN_REVOCATION_REFRESH_SECONDS: Interval of the Bloom filter rebuild job.
+        PASSWORD_HASH_WORKERS: Argon2 threads per worker (0 hashes inline).
+        PASSWORD_HASH_MAX_PENDING: Max running + queued Argon2 ops (0 is unbounded).
         ACCESS_TOKEN_EXPIRE_MINUTES: Access token expiration time.
         REFRESH_TOKEN_EXPIRE_DAYS: Refresh token expiration time.
         LOG_LEVEL: Logging level.
@@ -37,11 +61,62 @@ class Settings(BaseSettings):
 
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
+    REDIS_SOCKET_TIMEOUT: float = 0.5  # 동기 클라이언트 타임아웃 (초)
+
+    # Pagination
+    # 필터 없는 목록에서 이 값 이상이면 테이블 통계 기반 추정치를 total로 사용
+    COUNT_ESTIMATE_THRESHOLD: int = 100_000
+
+    # Cache
+    # 워커별 도서 상세 LRU (0이면 비활성화). 다른 워커의 변경은 TTL 내에 반영
+    BOOK_CACHE_LOCAL_MAXSIZE: int = 1024
+    BOOK_CACHE_LOCAL_TTL: float = 5.0
+
+    # 워커별 인증 주체(role/is_active) LRU. 다른 워커의 권한 변경/정지는 TTL 내에 반영
+    PRINCIPAL_CACHE_LOCAL_MAXSIZE: int = 10000
+    PRINCIPAL_CACHE_LOCAL_TTL: float = 5.0
+
+    # 검색 패싯에 노출할 출판사 수 (도서 수 상위)
+    BOOK_FACET_PUBLISHER_LIMIT: int = 20
+
+    # 자동완성 색인 재구축 주기 (다른 워커의 변경, 판매량 반영)
+    SUGGEST_INDEX_REFRESH_SECONDS: int = 300
+
+    # Bulk import
+    BOOK_IMPORT_BATCH_SIZE: int = 5000
+    BOOK_IMPORT_MAX_ERRORS: int = 1000
+
+    # Rate limiting (비어 있으면 leased+{REDIS_URL}, memory:// 로 워커별 카운터)
+    RATE_LIMIT_STORAGE_URI: str = ""
+    # 한도의 이 비율만큼 워커가 미리 선점 (1건 이하이면 매 요청 Redis에서 정확히 처리)
+    RATE_LIMIT_LEASE_FRACTION: float = 0.1
+    RATE_LIMIT_LEASE_SECONDS: float = 1.0
+
+    # 주문 도메인 이벤트 (판매량 반영 등 주문 후속 처리)
+    # inline: 요청 내 즉시 처리, queue: 워커 프로세스 내 큐 + 백그라운드 스레드,
+    # redis: Redis Streams 소비자 그룹 (워커 재시작에도 유실 없음)
+    ORDER_EVENT_BACKEND: str = "queue"
+    ORDER_EVENT_BATCH_SIZE: int = 500
+    ORDER_EVENT_FLUSH_SECONDS: float = 1.0
+
+    # 판매량 write-behind: 주문/취소 수량을 Redis 해시에 누적하고 주기적으로 한 번에
+    # DB에 반영 (인기 도서 행 잠금 경합 제거). 조회 시 미반영 수량을 더해 응답
+    PURCHASE_COUNT_WRITE_BEHIND: bool = False
+    PURCHASE_COUNT_FLUSH_SECONDS: int = 10
 
     # JWT
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # 워커별 검증 완료 토큰 캐시 (항목은 토큰 exp까지만 유지)
+    TOKEN_CACHE_MAXSIZE: int = 10000
+    # 폐기 토큰(jti) Bloom filter. 주기적 재구축으로 만료된 항목 제거
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = 100000
+    TOKEN_REVOCATION_REFRESH_SECONDS: int = 300
+
+    # Password hashing (Argon2id) 전용 스레드 풀. 대기 한도 초과 시 503 (0 이하는 무제한)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16
 
     # Logging
     LOG_LEVEL: str = "DEBUG"
@@ -2,10 +2,26 @@
 
 slowapi를 사용한 Rate Limiting 설정.
 순환 참조를 피하기 위해 별도 모듈로 분리.
+
+카운터는 Redis에 sliding window로 저장되어 모든 워커가 같은 한도를 공유합니다
+(LeasedRedisStorage: 워커 로컬 선점으로 Redis 왕복 최소화). Redis 장애 시에는
+워커별 in-memory 카운터로 대체되고, 복구되면 자동으로 Redis로 돌아갑니다.
 """
 
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from app.core import rate_limit_storage  # noqa: F401  (leased+redis 스킴 등록)
+from app.core.config import settings
+
 # Rate Limiter 초기화 (IP 주소 기반)
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI or f"leased+{settings.REDIS_URL}",
+    storage_options={
+        "socket_timeout": settings.REDIS_SOCKET_TIMEOUT,
+        "socket_connect_timeout": settings.REDIS_SOCKET_TIMEOUT,
+    },
+    strategy="sliding-window-counter",
+    in_memory_fallback_enabled=True,
+)
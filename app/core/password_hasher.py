@@ -0,0 +1,165 @@
+"""Password hashing executor module.
+
+Argon2id 해싱/검증은 호출당 수십 ms의 CPU를 사용합니다. 인증 라우트(회원가입,
+로그인, 비밀번호 변경)는 async 핸들러에서 hash_async()/verify_async()를 await하므로,
+해싱이 진행되는 동안 요청 스레드풀(AnyIO) 슬롯을 점유하지 않고 카탈로그 조회 등 다른
+sync 라우트가 스레드풀을 그대로 사용할 수 있습니다.
+
+해싱은 전용 스레드 풀(PASSWORD_HASH_WORKERS)에서 실행됩니다. argon2-cffi는 해싱 중
+GIL을 해제하므로 프로세스 풀과 달리 인자 직렬화/IPC 비용 없이 병렬로 실행됩니다.
+
+동시에 진행할 수 있는 작업 수(실행 + 대기)를 PASSWORD_HASH_MAX_PENDING으로
+제한합니다. 한도를 넘는 요청은 대기하지 않고 즉시 503(SERVICE_UNAVAILABLE)으로
+거절됩니다. 0 이하이면 제한하지 않습니다.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from pwdlib import PasswordHash
+
+from app.core.config import settings
+from app.exceptions.server_exceptions import ServiceUnavailableException
+
+# pwdlib 권장 설정 사용 (Argon2id가 기본)
+pwd_hash = PasswordHash.recommended()
+
+
+def _hash(password: str) -> str:
+    return pwd_hash.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_hash.verify(plain_password, hashed_password)
+
+
+class PasswordHasher:
+    """Bounded executor for Argon2 operations.
+
+    Attributes:
+        workers: Number of hashing threads (0 runs in the calling thread).
+        max_pending: Max operations running or queued before rejecting
+            (0 or less is unbounded).
+        rejected: Number of operations rejected because the executor was full.
+        completed: Number of operations that returned a result (a verify of a
+            wrong password is completed, returning False).
+        failed: Number of operations that raised.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+        self._in_flight = 0
+        self._slots = (
+            threading.BoundedSemaphore(max_pending) if max_pending > 0 else None
+        )
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def hash(self, password: str) -> str:
+        """Hash a password, blocking the calling thread until done."""
+        return self._run(_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash, blocking the calling thread."""
+        return self._run(_verify, plain_password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        """Hash a password in the pool without holding a request thread."""
+        return await self._run_async(_hash, password)
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the pool without holding a request thread."""
+        return await self._run_async(_verify, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        """Return queue depth and throughput counters."""
+        with self._lock:
+            running = (
+                min(self._in_flight, self.workers)
+                if self.workers > 0
+                else self._in_flight
+            )
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "running": running,
+                "queued": self._in_flight - running,
+                "rejected": self.rejected,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the hashing threads (recreated on next use)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+        succeeded = False
+        try:
+            if self.workers <= 0:
+                result = fn(*args)
+            else:
+                result = self._get_executor().submit(fn, *args).result()
+            succeeded = True
+            return result
+        finally:
+            self._release(succeeded)
+
+    async def _run_async(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+        succeeded = False
+        try:
+            if self.workers <= 0:
+                result = fn(*args)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), fn, *args
+                )
+            succeeded = True
+            return result
+        finally:
+            self._release(succeeded)
+
+    def _acquire(self) -> None:
+        if self._slots is not None and not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ServiceUnavailableException(
+                "Too many password operations in progress, please retry shortly"
+            )
+        with self._lock:
+            self._in_flight += 1
+
+    def _release(self, succeeded: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if succeeded:
+                self.completed += 1
+            else:
+                self.failed += 1
+        if self._slots is not None:
+            self._slots.release()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hasher"
+                )
+            return self._executor
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
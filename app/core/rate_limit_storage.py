@@ -0,0 +1,119 @@
+"""Rate limit storage module.
+
+slowapi(limits)의 Redis sliding-window-counter 저장소를 확장하여, 워커 간에 공유되는
+정확한 한도를 유지하면서 요청마다 Redis를 왕복하지 않도록 합니다.
+
+- Lua 스크립트 한 번으로 필요한 1건과 함께 한도 내에서 최대 `limit * 비율`건을
+  미리 선점(lease)합니다. 선점분은 이미 Redis 카운터에 반영되어 있으므로 여러
+  워커가 동시에 선점해도 한도를 넘지 않습니다.
+- 선점분이 남아 있는 동안 같은 키의 요청은 워커 로컬에서 바로 허용됩니다.
+- 한도에 가까워 선점할 여유가 없으면 1건씩 정확히 처리합니다.
+
+사용하지 못한 선점분은 lease 만료(RATE_LIMIT_LEASE_SECONDS) 시 버려지므로, 한도
+근처에서는 워커당 최대 (선점 크기 - 1)건만큼 보수적으로 거절될 수 있습니다.
+Redis 장애 시에는 slowapi의 in-memory fallback으로 전환됩니다(워커별 한도).
+"""
+
+import threading
+import time
+
+from limits.storage import RedisStorage
+
+from app.core.config import settings
+from app.utils.lru_cache import LocalLRUCache
+
+# limits의 sliding window 키(이전/현재 창)를 그대로 사용하여 통계 조회와 호환
+ACQUIRE_SLIDING_WINDOW_LEASE_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local expiry = tonumber(ARGV[2]) * 1000
+local amount = tonumber(ARGV[3])
+local want = tonumber(ARGV[4])
+
+local current_ttl = tonumber(redis.call('pttl', KEYS[2]))
+if current_ttl > 0 and current_ttl < expiry then
+    -- 현재 창이 끝났으면 이전 창으로 이동
+    redis.call('rename', KEYS[2], KEYS[1])
+    redis.call('set', KEYS[2], 0, 'PX', current_ttl + expiry)
+end
+
+local previous_count = tonumber(redis.call('get', KEYS[1])) or 0
+local previous_ttl = math.max(tonumber(redis.call('pttl', KEYS[1])) or 0, 0)
+local current_count = tonumber(redis.call('get', KEYS[2])) or 0
+local weighted_count = math.floor(previous_count * previous_ttl / expiry) + current_count
+
+local granted = math.min(want, limit - weighted_count)
+if granted < amount then
+    return 0
+end
+
+if redis.call('exists', KEYS[2]) == 1 then
+    redis.call('incrby', KEYS[2], granted)
+else
+    redis.call('set', KEYS[2], granted, 'PX', expiry * 2)
+end
+return granted
+"""
+
+
+class LeasedRedisStorage(RedisStorage):
+    """Redis sliding-window storage with per-worker leases of pre-acquired hits.
+
+    Registered for ``leased+redis://`` and ``leased+rediss://`` storage URIs.
+    """
+
+    STORAGE_SCHEME = ["leased+redis", "leased+rediss"]
+
+    def __init__(self, uri: str, **options):
+        super().__init__(uri.replace("leased+", "", 1), **options)
+        self.lease_fraction = settings.RATE_LIMIT_LEASE_FRACTION
+        self.lease_seconds = settings.RATE_LIMIT_LEASE_SECONDS
+        # key -> (만료 시각, 남은 선점 수)
+        self._leases = LocalLRUCache(maxsize=10000, ttl=self.lease_seconds)
+        self._lease_lock = threading.Lock()
+
+    def initialize_storage(self, uri: str) -> None:
+        super().initialize_storage(uri)
+        self.lua_acquire_sliding_window_lease = self.get_connection().register_script(
+            ACQUIRE_SLIDING_WINDOW_LEASE_SCRIPT
+        )
+
+    def acquire_sliding_window_entry(
+        self, key: str, limit: int, expiry: int, amount: int = 1
+    ) -> bool:
+        """Acquire entries from the local lease, or from Redis with a new lease."""
+        with self._lease_lock:
+            lease = self._leases.get(key)
+            if lease is not None and lease[1] >= amount:
+                self._leases.set(
+                    key, (lease[0], lease[1] - amount), ttl=lease[0] - time.monotonic()
+                )
+                return True
+
+        if amount > limit:
+            return False
+        want = max(amount, int(limit * self.lease_fraction))
+        previous_key = self.prefixed_key(self._previous_window_key(key))
+        current_key = self.prefixed_key(self._current_window_key(key))
+        granted = int(
+            self.lua_acquire_sliding_window_lease(
+                [previous_key, current_key], [limit, expiry, amount, want]
+            )
+            or 0
+        )
+        if granted < amount:
+            return False
+
+        if granted > amount:
+            lease_ttl = min(self.lease_seconds, expiry)
+            with self._lease_lock:
+                self._leases.set(
+                    key,
+                    (time.monotonic() + lease_ttl, granted - amount),
+                    ttl=lease_ttl,
+                )
+        return True
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        with self._lease_lock:
+            self._leases.delete(key)
+        super().clear_sliding_window(key, expiry)
@@ -2,17 +2,24 @@
 
 This module provides async Redis client functionality for caching rankings
 and other data that benefits from fast, in-memory access.
+
+A synchronous client is also provided for the service layer, which runs
+in FastAPI's threadpool (sync route handlers) and cannot await.
 """
 
 from typing import Optional
 
 import redis.asyncio as redis
+from redis import Redis as SyncRedis
 
 from app.core.config import settings
 
 # Global Redis client instance
 _redis_client: Optional[redis.Redis] = None
 
+# Global sync Redis client instance (service layer)
+_sync_redis_client: Optional[SyncRedis] = None
+
 
 async def get_redis_client() -> redis.Redis:
     """Get or create async Redis client.
@@ -38,18 +45,46 @@ async def get_redis_client() -> redis.Redis:
     return _redis_client
 
 
+def get_sync_redis_client() -> SyncRedis:
+    """Get or create sync Redis client.
+
+    Used by the synchronous service/repository layer. Socket timeouts are
+    kept short so that a Redis outage degrades to cache misses instead of
+    stalling requests.
+
+    Returns:
+        SyncRedis: Sync Redis client instance.
+    """
+    global _sync_redis_client
+
+    if _sync_redis_client is None:
+        _sync_redis_client = SyncRedis.from_url(
+            settings.REDIS_URL,
+            encoding="utf-8",
+            decode_responses=True,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+
+    return _sync_redis_client
+
+
 async def close_redis_client() -> None:
     """Close the Redis client connection.
 
     Should be called during application shutdown to properly
     release Redis connection resources.
     """
-    global _redis_client
+    global _redis_client, _sync_redis_client
 
     if _redis_client is not None:
         await _redis_client.close()
         _redis_client = None
 
+    if _sync_redis_client is not None:
+        _sync_redis_client.close()
+        _sync_redis_client = None
+
 
 # Redis key constants for rankings
 class RedisKeys:
@@ -57,6 +92,15 @@ class RedisKeys:
 
     RANKING_PURCHASE = "ranking:purchase"
     RANKING_RATING = "ranking:rating"
+    CATALOG_VERSION = "catalog:version"  # 도서 쓰기 시 증가 (검색 결과 캐시 세대)
+    REVOKED_TOKEN_CHANNEL = "revoked:channel"  # 토큰 폐기 알림 (pub/sub)
+    REVOKED_TOKEN_PATTERN = "revoked:jti:*"
+    ORDER_EVENT_STREAM = "events:order"  # 주문 도메인 이벤트 (Redis Streams)
+    ORDER_EVENT_GROUP = "order-projections"  # 판매량 반영 소비자 그룹
+    PURCHASE_COUNT_PENDING = "purchase:pending"  # 미반영 판매량 (book id -> 증감)
+    PURCHASE_COUNT_FLUSHING = "purchase:flushing"  # DB 반영 중인 판매량 (+ 배치 번호)
+    PURCHASE_COUNT_BATCH_SEQ = "purchase:batch:seq"  # 반영 배치 번호 발급
+    PURCHASE_COUNT_FLUSH_LOCK = "purchase:flush:lock"  # 반영 작업 단일 실행
 
     @staticmethod
     def ranking_key(ranking_type: str, age_group: str = "ALL", gender: str = "ALL") -> str:
@@ -72,6 +116,126 @@ class RedisKeys:
         """
         return f"ranking:{ranking_type}:{age_group}:{gender}"
 
+    @staticmethod
+    def count_key(scope: str) -> str:
+        """Generate a count cache key (hash of filter key -> total).
+
+        Args:
+            scope: Listing scope (e.g. book, order, user).
+
+        Returns:
+            str: Formatted Redis key.
+        """
+        return f"count:{scope}"
+
+    @staticmethod
+    def facet_key(scope: str) -> str:
+        """Generate a facet cache key (hash of filter key -> facet buckets).
+
+        Args:
+            scope: Listing scope (e.g. book).
+
+        Returns:
+            str: Formatted Redis key.
+        """
+        return f"facets:{scope}"
+
+    @staticmethod
+    def search_key(version: str, query_hash: str) -> str:
+        """Generate a search result cache key.
+
+        Args:
+            version: Current catalog version (old versions expire by TTL).
+            query_hash: Hash of the normalized search query.
+
+        Returns:
+            str: Formatted Redis key.
+        """
+        return f"search:book:{version}:{query_hash}"
+
+    @staticmethod
+    def book_key(book_id: int) -> str:
+        """Generate a book detail cache key.
+
+        Args:
+            book_id: Book ID.
+
+        Returns:
+            str: Formatted Redis key.
+        """
+        return f"book:{book_id}"
+
+    @staticmethod
+    def book_version_key(book_id: int) -> str:
+        """Generate a book detail cache version key (bumped on invalidation).
+
+        Args:
+            book_id: Book ID.
+
+        Returns:
+            str: Formatted Redis key.
+        """
+        return f"book:version:{book_id}"
+
+    @staticmethod
+    def revoked_token_key(jti: str) -> str:
+        """Generate a revoked token key (TTL = remaining token lifetime).
+
+        Args:
+            jti: Token ID claim.
+
+        Returns:
+            str: Formatted Redis key.
+        """
+        return f"revoked:jti:{jti}"
+
+    @staticmethod
+    def principal_key(user_id: int) -> str:
+        """Generate an authenticated principal cache key.
+
+        Args:
+            user_id: User ID.
+
+        Returns:
+            str: Formatted Redis key.
+        """
+        return f"principal:{user_id}"
+
+    @staticmethod
+    def principal_version_key(user_id: int) -> str:
+        """Generate a principal cache version key (bumped on invalidation).
+
+        Args:
+            user_id: User ID.
+
+        Returns:
+            str: Formatted Redis key.
+        """
+        return f"principal:version:{user_id}"
+
+    @staticmethod
+    def order_idempotency_key(user_id: int, key: str) -> str:
+        """Generate an order idempotency record key.
+
+        Args:
+            user_id: ID of the ordering user (keys are scoped per user).
+            key: Client-supplied Idempotency-Key header value.
+
+        Returns:
+            str: Formatted Redis key.
+        """
+        return f"idempotency:order:{user_id}:{key}"
+
 
 # Cache TTL constants (in seconds)
 RANKING_CACHE_TTL = 720  # 12 minutes (10분 주기 + 2분 여유)
+COUNT_CACHE_TTL = 30  # 목록 total 캐시 (쓰기 시 즉시 무효화, TTL은 상한)
+FACET_CACHE_TTL = 60  # 패싯 집계 캐시 (도서 쓰기 시 무효화, 평점 변동은 TTL로 반영)
+SEARCH_CACHE_TTL = 60  # 검색 결과(id 목록 + total) 캐시 (판매량/평점 정렬 변동 상한)
+BOOK_CACHE_TTL = 600  # 도서 상세 캐시 (쓰기 시 즉시 무효화, TTL은 상한)
+PRINCIPAL_CACHE_TTL = 300  # 인증 주체(role/is_active) 캐시 (권한 변경 시 즉시 무효화)
+IDEMPOTENCY_LOCK_TTL = 30  # 처리 중 표시 (요청 처리 시간 상한, 만료 시 재시도 허용)
+IDEMPOTENCY_RESULT_TTL = 86400  # 완료된 주문 응답 보관 (클라이언트 재시도 기간)
+ORDER_EVENT_STREAM_MAXLEN = 100_000  # 스트림 보관 상한 (처리 완료된 오래된 항목부터 삭제)
+ORDER_EVENT_CLAIM_IDLE_MS = 60_000  # 이 시간 동안 ACK되지 않은 항목은 종료된 소비자의 것으로 보고 회수
+PURCHASE_COUNT_FLUSH_LOCK_TTL = 60  # 판매량 반영 작업 잠금 (작업 시간 상한)
@@ -4,45 +4,95 @@ This module provides password hashing and JWT token management functions
 using modern security best practices (Argon2id for passwords).
 
 Python 3.12+ compliant: Uses datetime.now(UTC) instead of deprecated utcnow().
+
+검증에 성공한 토큰의 payload는 워커별 LRU에 토큰 만료 시각(exp)까지 캐싱되어,
+같은 액세스 토큰을 재사용하는 요청은 서명 검증/클레임 파싱을 생략합니다.
 """
 
+import secrets
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Optional
 
 import jwt
-from pwdlib import PasswordHash
 
 from app.core.config import settings
+from app.core.password_hasher import password_hasher, pwd_hash  # noqa: F401
+from app.utils.lru_cache import LocalLRUCache
 
 ALGORITHM = "HS256"
 
-# pwdlib 권장 설정 사용 (Argon2id가 기본)
-pwd_hash = PasswordHash.recommended()
+# 검증 완료 토큰 -> payload (항목별 TTL은 exp까지 남은 시간)
+_token_cache = LocalLRUCache(maxsize=settings.TOKEN_CACHE_MAXSIZE, ttl=0)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against its hash.
 
+    Runs in the bounded password hashing pool.
+
     Args:
         plain_password: Plain text password to verify.
         hashed_password: Hashed password to compare against.
 
     Returns:
         bool: True if password matches, False otherwise.
+
+    Raises:
+        ServiceUnavailableException: If the hashing pool is saturated.
     """
-    return pwd_hash.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password using Argon2id algorithm.
 
+    Runs in the bounded password hashing pool.
+
+    Args:
+        password: Plain text password to hash.
+
+    Returns:
+        str: Hashed password string.
+
+    Raises:
+        ServiceUnavailableException: If the hashing pool is saturated.
+    """
+    return password_hasher.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against its hash without blocking the event loop.
+
+    Awaits the bounded password hashing pool, so async route handlers do not hold
+    a request threadpool slot while Argon2 runs.
+
+    Args:
+        plain_password: Plain text password to verify.
+        hashed_password: Hashed password to compare against.
+
+    Returns:
+        bool: True if password matches, False otherwise.
+
+    Raises:
+        ServiceUnavailableException: If the hashing pool is saturated.
+    """
+    return await password_hasher.verify_async(plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password using Argon2id without blocking the event loop.
+
     Args:
         password: Plain text password to hash.
 
     Returns:
         str: Hashed password string.
+
+    Raises:
+        ServiceUnavailableException: If the hashing pool is saturated.
     """
-    return pwd_hash.hash(password)
+    return await password_hasher.hash_async(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -62,7 +112,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.now(UTC) + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    to_encode.update({"exp": expire, "type": "access"})
+    # jti: 토큰 폐기(로그아웃) 시 식별자
+    to_encode.update({"exp": expire, "type": "access", "jti": secrets.token_hex(16)})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -82,7 +133,7 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
         expire = datetime.now(UTC) + expires_delta
     else:
         expire = datetime.now(UTC) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({"exp": expire, "type": "refresh", "jti": secrets.token_hex(16)})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -90,16 +141,37 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
 def decode_token(token: str) -> Optional[dict]:
     """Decode and validate JWT token.
 
+    Verified payloads are cached until the token's ``exp``, so a reused token
+    is not verified again. Invalid tokens are never cached.
+
     Args:
         token: JWT token string to decode.
 
     Returns:
         Optional[dict]: Decoded payload if valid, None if expired or invalid.
     """
+    cached = _token_cache.get(token)
+    if cached is not None:
+        return dict(cached)
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
         return None
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _token_cache.set(token, payload, ttl=exp - time.time())
+    return dict(payload)
+
+
+def token_cache_stats() -> dict:
+    """Return hit/miss metrics of the verified-token cache of this worker."""
+    return _token_cache.stats()
+
+
+def clear_token_cache() -> None:
+    """Clear the verified-token cache of this worker."""
+    _token_cache.clear()
@@ -6,6 +6,7 @@ from app.exceptions.auth_exceptions import (
 )
 from app.exceptions.book_exceptions import (
     BookAlreadyExistsException,
+    BookImportFormatException,
     BookNotFoundException,
     BookNotOwnedException,
 )
@@ -23,6 +24,7 @@ from app.exceptions.order_exceptions import (
     OrderItemNotFoundException,
     OrderNotFoundException,
 )
+from app.exceptions.pagination_exceptions import InvalidCursorException
 from app.exceptions.review_exceptions import (
     ReviewAlreadyExistsException,
     ReviewNotAllowedException,
@@ -17,3 +17,8 @@ class BookAlreadyExistsException(BookException):
 class BookNotOwnedException(BookException):
     def __init__(self, message: str = "You don't own this book"):
         super().__init__(message)
+
+
+class BookImportFormatException(BookException):
+    def __init__(self, message: str = "Unsupported import format (use csv or ndjson)"):
+        super().__init__(message)
@@ -16,6 +16,7 @@ from app.exceptions.auth_exceptions import (
 # Book exceptions
 from app.exceptions.book_exceptions import (
     BookAlreadyExistsException,
+    BookImportFormatException,
     BookNotFoundException,
     BookNotOwnedException,
 )
@@ -35,11 +36,16 @@ from app.exceptions.favorite_exceptions import (
 
 # Order exceptions
 from app.exceptions.order_exceptions import (
+    IdempotencyKeyReusedException,
     OrderCancelNotAllowedException,
     OrderItemNotFoundException,
     OrderNotFoundException,
+    OrderRequestInProgressException,
 )
 
+# Pagination exceptions
+from app.exceptions.pagination_exceptions import InvalidCursorException
+
 # Review exceptions
 from app.exceptions.review_exceptions import (
     ReviewAlreadyExistsException,
@@ -367,6 +373,31 @@ async def sale_book_already_exists_handler(request: Request, exc: SaleBookAlread
     )
 
 
+async def order_request_in_progress_handler(
+    request: Request, exc: OrderRequestInProgressException
+):
+    return create_error_response(
+        request=request,
+        status_code=409,
+        code="ORDER_REQUEST_IN_PROGRESS",
+        message=exc.message,
+    )
+
+
+# ============================================
+# 422 Unprocessable Entity handlers
+# ============================================
+async def idempotency_key_reused_handler(
+    request: Request, exc: IdempotencyKeyReusedException
+):
+    return create_error_response(
+        request=request,
+        status_code=422,
+        code="IDEMPOTENCY_KEY_REUSED",
+        message=exc.message,
+    )
+
+
 # ============================================
 # 400 Bad Request handlers
 # ============================================
@@ -388,6 +419,24 @@ async def order_cancel_not_allowed_handler(request: Request, exc: OrderCancelNot
     )
 
 
+async def book_import_format_handler(request: Request, exc: BookImportFormatException):
+    return create_error_response(
+        request=request,
+        status_code=400,
+        code="UNSUPPORTED_IMPORT_FORMAT",
+        message=exc.message,
+    )
+
+
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorException):
+    return create_error_response(
+        request=request,
+        status_code=400,
+        code="INVALID_CURSOR",
+        message=exc.message,
+    )
+
+
 # ============================================
 # 429 Too Many Requests handler (Rate Limiting)
 # ============================================
@@ -459,10 +508,16 @@ def add_exception_handlers(app):
     app.add_exception_handler(ReviewAlreadyExistsException, review_already_exists_handler)
     app.add_exception_handler(FavoriteAlreadyExistsException, favorite_already_exists_handler)
     app.add_exception_handler(SaleBookAlreadyExistsException, sale_book_already_exists_handler)
+    app.add_exception_handler(OrderRequestInProgressException, order_request_in_progress_handler)
+
+    # 422 Unprocessable Entity
+    app.add_exception_handler(IdempotencyKeyReusedException, idempotency_key_reused_handler)
 
     # 400 Bad Request
     app.add_exception_handler(CartEmptyException, cart_empty_handler)
     app.add_exception_handler(OrderCancelNotAllowedException, order_cancel_not_allowed_handler)
+    app.add_exception_handler(InvalidCursorException, invalid_cursor_handler)
+    app.add_exception_handler(BookImportFormatException, book_import_format_handler)
 
     # 500 Server Error
     app.add_exception_handler(InternalServerException, internal_server_handler)
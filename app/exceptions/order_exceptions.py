@@ -17,3 +17,18 @@ class OrderCancelNotAllowedException(OrderException):
 class OrderItemNotFoundException(OrderException):
     def __init__(self, message: str = "Order item not found"):
         super().__init__(message)
+
+
+class OrderRequestInProgressException(OrderException):
+    def __init__(
+        self, message: str = "A request with this Idempotency-Key is in progress"
+    ):
+        super().__init__(message)
+
+
+class IdempotencyKeyReusedException(OrderException):
+    def __init__(
+        self,
+        message: str = "This Idempotency-Key was used with a different request",
+    ):
+        super().__init__(message)
@@ -0,0 +1,9 @@
+class PaginationException(Exception):
+    def __init__(self, message: str = "Pagination error"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class InvalidCursorException(PaginationException):
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        super().__init__(message)
@@ -26,15 +26,21 @@ from app.api.routers import (
 from app.core.config import settings
 from app.core.database import Base, SessionLocal, engine
 from app.core.limiter import limiter
+from app.core.password_hasher import password_hasher
 from app.core.redis import close_redis_client
 from app.exceptions.handlers import add_exception_handlers, rate_limit_exceeded_handler
 from app.middleware import LoggingMiddleware
 from app.schemas.response import HealthResponse
+from app.services.book_suggest import book_suggest_index
+from app.services.order_events import order_event_bus
+from app.services.purchase_counter import PurchaseCounter
 from app.services.ranking_service import RankingService
+from app.services.token_revocation import token_revocation
 
 # 모델 임포트 (테이블 생성을 위해 필요)
 from app.models import (
     Book,
+    BookTrigram,
     Cart,
     Favorite,
     Order,
@@ -68,13 +74,75 @@ async def scheduled_ranking_cache_job():
         db.close()
 
 
+def refresh_suggest_index_job():
+    """도서 자동완성 색인 재구축 (시작 시 및 주기 실행)."""
+    db = SessionLocal()
+    try:
+        book_suggest_index.rebuild(db)
+    except Exception as e:
+        logger.error(f"Suggest index rebuild failed: {e}")
+    finally:
+        db.close()
+
+
+def refresh_token_revocation_job():
+    """폐기 토큰 Bloom filter 재구축 (만료 항목 제거, 누락된 알림 보정)."""
+    try:
+        token_revocation.rebuild()
+    except Exception as e:
+        logger.error(f"Token revocation filter rebuild failed: {e}")
+
+
+def flush_purchase_counts_job():
+    """Redis에 누적된 판매량(write-behind)을 DB에 일괄 반영."""
+    db = SessionLocal()
+    try:
+        PurchaseCounter.flush(db)
+    except Exception as e:
+        logger.error(f"Purchase count flush failed: {e}")
+    finally:
+        db.close()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """FastAPI lifespan context manager for startup and shutdown events."""
     # === Startup ===
     logger.info("Application starting up...")
 
+    # 자동완성 색인 구축 (요청을 받기 전에 완료)
+    await asyncio.to_thread(refresh_suggest_index_job)
+
+    # 폐기 토큰 구독 시작 (구독 직후 Bloom filter 구축)
+    token_revocation.start_listener()
+
+    # 주문 이벤트 처리 워커 시작 (판매량 배치 반영)
+    order_event_bus.start()
+
     # 스케줄러 시작
+    scheduler.add_job(
+        refresh_token_revocation_job,
+        "interval",
+        seconds=settings.TOKEN_REVOCATION_REFRESH_SECONDS,
+        id="token_revocation_job",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        refresh_suggest_index_job,
+        "interval",
+        seconds=settings.SUGGEST_INDEX_REFRESH_SECONDS,
+        id="suggest_index_job",
+        replace_existing=True,
+    )
+    # write-behind를 끈 뒤에도 Redis에 남은 미반영 판매량을 DB에 반영하도록 항상 등록
+    # (누적된 항목이 없으면 잠금 획득과 RENAME 실패만으로 끝남)
+    scheduler.add_job(
+        flush_purchase_counts_job,
+        "interval",
+        seconds=settings.PURCHASE_COUNT_FLUSH_SECONDS,
+        id="purchase_count_flush_job",
+        replace_existing=True,
+    )
     scheduler.add_job(
         scheduled_ranking_cache_job,
         "interval",
@@ -97,6 +165,15 @@ async def lifespan(app: FastAPI):
     scheduler.shutdown(wait=False)
     logger.info("APScheduler shutdown")
 
+    # 폐기 토큰 구독 종료 (Redis 연결 종료 전)
+    await asyncio.to_thread(token_revocation.stop_listener)
+
+    # 주문 이벤트 처리 워커 종료 (로컬 큐에 남은 이벤트 반영 후)
+    await asyncio.to_thread(order_event_bus.stop)
+
+    # 비밀번호 해싱 프로세스 종료
+    await asyncio.to_thread(password_hasher.shutdown)
+
     # Redis 연결 종료
     await close_redis_client()
     logger.info("Redis connection closed")
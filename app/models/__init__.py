@@ -1,8 +1,11 @@
 from app.models.book import Book
+from app.models.book_search import book_search
+from app.models.book_trigram import BookTrigram
 from app.models.cart import Cart
 from app.models.favorite import Favorite
 from app.models.order import Order
 from app.models.order_item import OrderItem
+from app.models.purchase_count_batch import PurchaseCountBatch
 from app.models.ranking import Ranking
 from app.models.review import Review
 from app.models.sale import SaleInform
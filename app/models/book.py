@@ -2,7 +2,17 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import CHAR, DECIMAL, TIMESTAMP, Date, Enum, ForeignKey, Integer, String
+from sqlalchemy import (
+    CHAR,
+    DECIMAL,
+    TIMESTAMP,
+    Date,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -24,6 +34,8 @@ class Book(Base):
         nullable=False,
         default="TOBESOLD",
     )
+    # app.schemas.book.BookCategory 코드값 (미분류 도서는 NULL)
+    category: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     title: Mapped[str] = mapped_column(String(20))
     author: Mapped[str] = mapped_column(String(20))
     publisher: Mapped[str] = mapped_column(String(20))
@@ -43,6 +55,26 @@ class Book(Base):
         "updatedAt", TIMESTAMP, server_default=func.now(), onupdate=func.now()
     )
 
+    __table_args__ = (
+        # 목록 조회 정렬/keyset 페이지네이션용 (status 필터 + 정렬 컬럼 + id)
+        Index("ixBookStatusPrice", "status", "price", "id"),
+        Index("ixBookStatusCreatedAt", "status", "createdAt", "id"),
+        Index("ixBookStatusAverageRating", "status", "averageRating", "id"),
+        Index("ixBookStatusPurchaseCount", "status", "purchaseCount", "id"),
+        # 카테고리별 최신순 목록 (카테고리 브라우징)
+        Index("ixBookStatusCategoryCreatedAt", "status", "category", "createdAt", "id"),
+        # 키워드 검색용 역색인 (MySQL 전용, 한글 검색을 위해 ngram 파서 사용)
+        # SQLite는 app.models.book_search의 FTS5 가상 테이블을 사용
+        Index(
+            "ftBookSearch",
+            "title",
+            "author",
+            "publisher",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
+
     # Relationships
     seller: Mapped["SellerProfile"] = relationship(back_populates="books")
     cart_items: Mapped[list["Cart"]] = relationship(back_populates="book")
@@ -0,0 +1,60 @@
+"""Book full-text search index module.
+
+MySQL은 book 테이블의 FULLTEXT(ngram) 인덱스(ftBookSearch)를 사용하고,
+SQLite(기본 개발/테스트 환경)는 FTS5 가상 테이블(bookSearch)을 사용합니다.
+
+FTS5 테이블은 book 테이블을 external content로 참조하며, INSERT/UPDATE/DELETE
+트리거로 동기화되므로 BookRepository.create/update는 별도 작업 없이 색인이
+갱신됩니다. trigram 토크나이저를 사용하여 ILIKE '%kw%'와 동일한 부분 문자열
+검색 의미를 유지합니다.
+"""
+
+from sqlalchemy import DDL, column, event, table
+
+from app.models.book import Book
+
+BOOK_SEARCH_TABLE = "bookSearch"
+
+# 메타데이터에 등록하지 않는 경량 테이블 표현 (조인/정렬용)
+book_search = table(BOOK_SEARCH_TABLE, column("rowid"), column("rank"))
+
+SQLITE_BOOK_SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS "{BOOK_SEARCH_TABLE}" USING fts5(
+        title, author, publisher,
+        content='book', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS "bookSearchInsert" AFTER INSERT ON book BEGIN
+        INSERT INTO "{BOOK_SEARCH_TABLE}"(rowid, title, author, publisher)
+        VALUES (new.id, new.title, new.author, new.publisher);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS "bookSearchDelete" AFTER DELETE ON book BEGIN
+        INSERT INTO "{BOOK_SEARCH_TABLE}"("{BOOK_SEARCH_TABLE}", rowid, title, author, publisher)
+        VALUES ('delete', old.id, old.title, old.author, old.publisher);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS "bookSearchUpdate"
+    AFTER UPDATE OF title, author, publisher ON book BEGIN
+        INSERT INTO "{BOOK_SEARCH_TABLE}"("{BOOK_SEARCH_TABLE}", rowid, title, author, publisher)
+        VALUES ('delete', old.id, old.title, old.author, old.publisher);
+        INSERT INTO "{BOOK_SEARCH_TABLE}"(rowid, title, author, publisher)
+        VALUES (new.id, new.title, new.author, new.publisher);
+    END
+    """,
+]
+
+for _statement in SQLITE_BOOK_SEARCH_DDL:
+    event.listen(
+        Book.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+
+event.listen(
+    Book.__table__,
+    "after_drop",
+    DDL(f'DROP TABLE IF EXISTS "{BOOK_SEARCH_TABLE}"').execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,31 @@
+from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class BookTrigram(Base):
+    """Trigram inverted index over book title/author (fuzzy search).
+
+    BookRepository keeps the rows in sync on book create/update.
+    """
+
+    __tablename__ = "bookTrigram"
+
+    # MySQL 기본 콜레이션은 대소문자/악센트를 구분하지 않아 PK가 충돌하므로 binary 사용
+    trigram: Mapped[str] = mapped_column(
+        String(3).with_variant(mysql.VARCHAR(3, collation="utf8mb4_bin"), "mysql"),
+        primary_key=True,
+    )
+    book_id: Mapped[int] = mapped_column(
+        "bookId",
+        Integer,
+        ForeignKey("book.id", ondelete="CASCADE", onupdate="CASCADE"),
+        primary_key=True,
+    )
+
+    __table_args__ = (
+        # 도서 수정 시 기존 trigram 삭제용
+        Index("ixBookTrigramBookId", "bookId"),
+    )
@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DECIMAL, DateTime, Enum, ForeignKey, Integer, TIMESTAMP
+from sqlalchemy import DECIMAL, DateTime, Enum, ForeignKey, Index, Integer, TIMESTAMP
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -33,6 +33,14 @@ class Order(Base):
         "updatedAt", TIMESTAMP, server_default=func.now(), onupdate=func.now()
     )
 
+    __table_args__ = (
+        # 주문 목록 최신순/keyset 페이지네이션용 (필터 컬럼 + createdAt + id)
+        Index("ixOrderUserIdCreatedAt", "userId", "createdAt", "id"),
+        Index("ixOrderStatusCreatedAt", "status", "createdAt", "id"),
+        # 상태 필터가 없는 관리자 전체 목록
+        Index("ixOrderCreatedAt", "createdAt", "id"),
+    )
+
     # Relationships
     user: Mapped["User"] = relationship(back_populates="orders")
     items: Mapped[list["OrderItem"]] = relationship(
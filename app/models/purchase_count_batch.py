@@ -0,0 +1,17 @@
+from sqlalchemy import Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class PurchaseCountBatch(Base):
+    """Marker of the last write-behind purchase count batch applied to book.
+
+    Written in the same transaction as the batch's UPDATE, so readers and a
+    restarted flush can tell whether purchase:flushing is already in the DB.
+    """
+
+    __tablename__ = "purchaseCountBatch"
+
+    # Redis에서 발급한 배치 번호 (단조 증가, 최신 배치만 유지)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
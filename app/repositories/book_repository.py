@@ -4,13 +4,80 @@ This module handles all database CRUD operations and queries for books.
 Repositories do NOT commit by default - the service layer manages transactions.
 """
 
-from typing import List, Optional, Tuple
+import math
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple
 
-from sqlalchemy import asc, desc, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    and_,
+    asc,
+    case,
+    delete,
+    desc,
+    false,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    text,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Query, Session
 
 from app.models.book import Book
+from app.models.book_search import BOOK_SEARCH_TABLE, book_search
+from app.models.book_trigram import BookTrigram
+from app.models.purchase_count_batch import PurchaseCountBatch
+from app.models.review import Review
+from app.repositories.count_strategy import CountStrategy
 from app.schemas.book import BookSortBy
+from app.utils.trigram import trigrams
+
+# 역색인을 사용할 수 있는 최소 키워드 길이 (미만이면 LIKE 검색으로 대체)
+# - SQLite FTS5 trigram 토크나이저: 3글자
+# - MySQL ngram 파서: ngram_token_size 기본값 2글자
+FULLTEXT_MIN_KEYWORD_LENGTH = {"sqlite": 3, "mysql": 2}
+
+# 퍼지 검색: 키워드 trigram 중 이 비율 이상을 공유하는 도서만 결과에 포함
+FUZZY_MIN_SIMILARITY = 0.4
+
+# 정렬 옵션별 (정렬 컬럼, 내림차순 여부)
+# 관련도순(RELEVANCE)은 인덱스로 정렬할 수 없어 keyset 페이지네이션 대상이 아님
+BOOK_SORT_KEYS = {
+    BookSortBy.PRICE_ASC: (Book.price, False),
+    BookSortBy.PRICE_DESC: (Book.price, True),
+    BookSortBy.DATE_ASC: (Book.created_at, False),
+    BookSortBy.DATE_DESC: (Book.created_at, True),
+    BookSortBy.RATING: (Book.average_rating, True),
+    BookSortBy.SALES: (Book.purchase_count, True),
+}
+
+# 패싯 구간 (라벨, 하한) - 하한 내림차순, 마지막 구간이 나머지를 포함
+PRICE_FACET_BANDS = [
+    ("50000+", 50000),
+    ("30000-50000", 30000),
+    ("20000-30000", 20000),
+    ("10000-20000", 10000),
+    ("0-10000", 0),
+]
+RATING_FACET_BANDS = [
+    ("4+", 4),
+    ("3-4", 3),
+    ("2-3", 2),
+    ("1-2", 1),
+    ("0-1", 0),
+]
+
+
+def _band_case(column, bands: List[Tuple[str, int]]):
+    """CASE expression mapping a numeric column to its band label."""
+    *upper, (last_label, _) = bands
+    return case(
+        *((column >= lower, label) for label, lower in upper), else_=last_label
+    )
 
 
 class BookRepository:
@@ -27,6 +94,7 @@ class BookRepository:
 
     def __init__(self, db: Session):
         self.db = db
+        self.counter = CountStrategy(db)
 
     def get_by_id(self, book_id: int) -> Optional[Book]:
         return self.db.query(Book).filter(Book.id == book_id).first()
@@ -34,6 +102,16 @@ class BookRepository:
     def get_by_isbn(self, isbn: str) -> Optional[Book]:
         return self.db.query(Book).filter(Book.isbn == isbn).first()
 
+    def get_by_ids(self, book_ids: List[int]) -> List[Book]:
+        """Load books by id in one query, preserving the order of ``book_ids``.
+
+        Ids that no longer exist are skipped.
+        """
+        if not book_ids:
+            return []
+        books = {b.id: b for b in self.db.query(Book).filter(Book.id.in_(book_ids))}
+        return [books[book_id] for book_id in book_ids if book_id in books]
+
     def get_all(
         self,
         skip: int = 0,
@@ -43,11 +121,189 @@ class BookRepository:
         sort: BookSortBy = BookSortBy.DATE_DESC,
         seller_id: Optional[int] = None,
         status: Optional[str] = None,
-    ) -> Tuple[List[Book], int]:
+        after: Optional[Tuple[Any, int]] = None,
+        include_total: bool = True,
+        fuzzy: bool = False,
+    ) -> Tuple[List[Book], Optional[int]]:
+        """Get books with filtering, sorting and pagination.
+
+        Args:
+            skip: Number of rows to skip (offset mode).
+            limit: Maximum number of rows to return.
+            keyword: Search keyword (title, author, publisher).
+            category: Category filter.
+            sort: Sort option.
+            seller_id: Seller filter.
+            status: Book status filter.
+            after: Keyset position (sort value, id) of the last row of the
+                previous page. When given, ``skip`` is ignored and rows are
+                fetched by seeking on (sort column, id).
+            include_total: If False, skip counting and return None as total.
+            fuzzy: If True, match the keyword by trigram similarity
+                (typo-tolerant) instead of substring search.
+
+        Returns:
+            Tuple[List[Book], Optional[int]]: Books of the page and total count.
+        """
+        query, relevance = self._filtered_query(
+            keyword, category, seller_id, status, fuzzy=fuzzy
+        )
+
+        total = None
+        if include_total:
+            total = self.counter.count(
+                query,
+                Book.__tablename__,
+                {
+                    "keyword": keyword,
+                    "category": category,
+                    "seller_id": seller_id,
+                    "status": status,
+                    "fuzzy": fuzzy or None,
+                },
+            )
+
+        # 정렬 (id를 보조 정렬 키로 사용하여 순서를 결정적으로 유지)
+        if sort == BookSortBy.RELEVANCE and relevance is not None:
+            query = query.order_by(relevance, desc(Book.id))
+        else:
+            # 키워드가 없거나 역색인을 쓰지 못한 관련도순은 최신순으로 대체
+            column, descending = BOOK_SORT_KEYS.get(
+                sort, BOOK_SORT_KEYS[BookSortBy.DATE_DESC]
+            )
+            direction = desc if descending else asc
+            query = query.order_by(direction(column), direction(Book.id))
+
+            if after is not None:
+                query = query.filter(self._seek_condition(column, descending, after))
+                skip = 0
+
+        books = query.offset(skip).limit(limit).all()
+        return books, total
+
+    def get_facets(
+        self,
+        keyword: Optional[str] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        fuzzy: bool = False,
+    ) -> dict[str, List[Tuple[str, int]]]:
+        """Count facet buckets of a search in one round trip.
+
+        Publisher, price band, rating band and status buckets are computed
+        as GROUP BY branches of a single UNION ALL over the filtered rows.
+        The status facet ignores the ``status`` filter so that other
+        statuses can still be offered as choices.
+
+        Args:
+            keyword: Search keyword (title, author, publisher).
+            category: Category filter.
+            status: Book status filter (not applied to the status facet).
+            fuzzy: If True, match the keyword by trigram similarity.
+
+        Returns:
+            dict[str, List[Tuple[str, int]]]: Facet name -> (bucket, count) rows.
+        """
+        query, _ = self._filtered_query(keyword, category, fuzzy=fuzzy)
+        rows = query.with_entities(
+            Book.status, Book.publisher, Book.price, Book.average_rating
+        ).cte("facetRows")
+
+        def branch(facet: str, bucket, filtered: bool = True):
+            stmt = select(
+                literal_column(f"'{facet}'").label("facet"),
+                bucket.label("bucket"),
+                func.count().label("count"),
+            )
+            if filtered and status:
+                stmt = stmt.where(rows.c.status == status)
+            # 바인딩 파라미터가 포함된 CASE를 다시 쓰지 않도록 별칭으로 그룹화
+            # (MySQL ONLY_FULL_GROUP_BY에서 SELECT/GROUP BY 식 불일치 방지)
+            return stmt.group_by(literal_column("bucket"))
+
+        statement = union_all(
+            branch("publisher", rows.c.publisher),
+            branch("price", _band_case(rows.c.price, PRICE_FACET_BANDS)),
+            branch("rating", _band_case(rows.c.average_rating, RATING_FACET_BANDS)),
+            branch("status", rows.c.status, filtered=False),
+        )
+
+        facets: dict[str, List[Tuple[str, int]]] = {
+            "publisher": [], "price": [], "rating": [], "status": []
+        }
+        for facet, bucket, count in self.db.execute(statement):
+            facets[facet].append((bucket, count))
+        return facets
+
+    def _filtered_query(
+        self,
+        keyword: Optional[str] = None,
+        category: Optional[str] = None,
+        seller_id: Optional[int] = None,
+        status: Optional[str] = None,
+        fuzzy: bool = False,
+    ) -> Tuple[Query, object]:
+        """Build the filtered book query shared by listing and facets.
+
+        Returns:
+            Tuple[Query, object]: Filtered query and relevance ordering
+            expression (None unless the full-text index is used).
+        """
         query = self.db.query(Book)
 
         # 키워드 검색 (제목, 저자, 출판사)
-        if keyword:
+        relevance = None
+        if keyword and fuzzy:
+            query, relevance = self._apply_fuzzy_search(query, keyword)
+        elif keyword:
+            query, relevance = self._apply_keyword_search(query, keyword)
+
+        # 카테고리 필터
+        if category:
+            query = query.filter(Book.category == category)
+
+        # 판매자 필터
+        if seller_id:
+            query = query.filter(Book.seller_id == seller_id)
+
+        # 상태 필터
+        if status:
+            query = query.filter(Book.status == status)
+
+        return query, relevance
+
+    def _seek_condition(self, column, descending: bool, after: Tuple[Any, int]):
+        """Build the keyset condition "(column, id) after (value, last_id)".
+
+        Expanded into OR/AND form instead of a row-value comparison so that
+        both MySQL and SQLite can use the (status, column, id) index range.
+        """
+        value, last_id = after
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "sqlite" and isinstance(value, datetime):
+            # SQLite는 CURRENT_TIMESTAMP 형식(초 단위 문자열)으로 저장하므로
+            # 바인딩 값(마이크로초 포함 문자열)을 같은 형식으로 맞춘다
+            value = func.datetime(value)
+
+        if descending:
+            return or_(column < value, and_(column == value, Book.id < last_id))
+        return or_(column > value, and_(column == value, Book.id > last_id))
+
+    def _apply_keyword_search(self, query: Query, keyword: str) -> Tuple[Query, object]:
+        """Apply keyword search using the full-text index when available.
+
+        Args:
+            query: Book query to filter.
+            keyword: Search keyword (title, author, publisher).
+
+        Returns:
+            Tuple[Query, object]: Filtered query and relevance ordering
+            expression (None when falling back to LIKE search).
+        """
+        dialect = self.db.get_bind().dialect.name
+        min_length = FULLTEXT_MIN_KEYWORD_LENGTH.get(dialect)
+
+        if min_length is None or len(keyword) < min_length:
             query = query.filter(
                 or_(
                     Book.title.ilike(f"%{keyword}%"),
@@ -55,32 +311,68 @@ class BookRepository:
                     Book.publisher.ilike(f"%{keyword}%"),
                 )
             )
+            return query, None
 
-        # 판매자 필터
-        if seller_id:
-            query = query.filter(Book.seller_id == seller_id)
+        if dialect == "sqlite":
+            # FTS5 구문 연산자를 무력화하기 위해 phrase로 감싼다
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            query = query.join(book_search, book_search.c.rowid == Book.id).filter(
+                text(f'"{BOOK_SEARCH_TABLE}" MATCH :fts_query').bindparams(
+                    fts_query=phrase
+                )
+            )
+            # FTS5 rank(bm25)는 값이 작을수록 관련도가 높음
+            return query, asc(book_search.c.rank)
 
-        # 상태 필터
-        if status:
-            query = query.filter(Book.status == status)
+        # MySQL: BOOLEAN MODE phrase 검색 (ngram 파서)
+        phrase = '"' + keyword.replace('"', " ") + '"'
+        score = match(Book.title, Book.author, Book.publisher, against=phrase)
+        score = score.in_boolean_mode()
+        return query.filter(score), desc(score)
 
-        # 정렬
-        if sort == BookSortBy.PRICE_ASC:
-            query = query.order_by(asc(Book.price))
-        elif sort == BookSortBy.PRICE_DESC:
-            query = query.order_by(desc(Book.price))
-        elif sort == BookSortBy.DATE_ASC:
-            query = query.order_by(asc(Book.created_at))
-        elif sort == BookSortBy.DATE_DESC:
-            query = query.order_by(desc(Book.created_at))
-        elif sort == BookSortBy.RATING:
-            query = query.order_by(desc(Book.average_rating))
-        elif sort == BookSortBy.SALES:
-            query = query.order_by(desc(Book.purchase_count))
-
-        total = query.count()
-        books = query.offset(skip).limit(limit).all()
-        return books, total
+    def _apply_fuzzy_search(self, query: Query, keyword: str) -> Tuple[Query, object]:
+        """Apply typo-tolerant search using the bookTrigram inverted index.
+
+        Books sharing at least FUZZY_MIN_SIMILARITY of the keyword's trigrams
+        (in title or author) match; more shared trigrams rank higher.
+
+        Args:
+            query: Book query to filter.
+            keyword: Search keyword.
+
+        Returns:
+            Tuple[Query, object]: Filtered query and relevance ordering expression.
+        """
+        keyword_trigrams = trigrams(keyword)
+        if not keyword_trigrams:
+            return query.filter(false()), None
+
+        min_shared = max(1, math.ceil(len(keyword_trigrams) * FUZZY_MIN_SIMILARITY))
+        shared = func.count(BookTrigram.trigram).label("shared")
+        similar = (
+            select(BookTrigram.book_id, shared)
+            .where(BookTrigram.trigram.in_(sorted(keyword_trigrams)))
+            .group_by(BookTrigram.book_id)
+            .having(func.count(BookTrigram.trigram) >= min_shared)
+            .subquery("fuzzyMatch")
+        )
+        query = query.join(similar, similar.c.book_id == Book.id)
+        return query, desc(similar.c.shared)
+
+    def _replace_trigrams(self, books: List[Tuple[int, str, str]]) -> None:
+        """Rebuild trigram index rows of (id, title, author) books."""
+        if not books:
+            return
+        self.db.execute(
+            delete(BookTrigram).where(BookTrigram.book_id.in_([b[0] for b in books]))
+        )
+        rows = [
+            {"trigram": trigram, "book_id": book_id}
+            for book_id, title, author in books
+            for trigram in trigrams(title) | trigrams(author)
+        ]
+        if rows:
+            self.db.execute(insert(BookTrigram), rows)
 
     def create(self, book_data: dict, *, commit: bool = False) -> Book:
         """Create a new book.
@@ -95,11 +387,91 @@ class BookRepository:
         db_book = Book(**book_data)
         self.db.add(db_book)
         self.db.flush()
+        self._replace_trigrams([(db_book.id, db_book.title, db_book.author)])
         if commit:
             self.db.commit()
             self.db.refresh(db_book)
         return db_book
 
+    def iter_for_export(
+        self, seller_id: Optional[int] = None, batch_size: int = 1000
+    ) -> Iterator[Book]:
+        """Iterate books in id order without loading the whole result.
+
+        Rows are fetched ``batch_size`` at a time (``yield_per``), which uses a
+        server-side cursor on MySQL, so memory stays bounded.
+
+        Args:
+            seller_id: Restrict to one seller's books (None for all books).
+            batch_size: Rows fetched per round trip.
+
+        Returns:
+            Iterator[Book]: Books ordered by id.
+        """
+        query = self.db.query(Book)
+        if seller_id is not None:
+            query = query.filter(Book.seller_id == seller_id)
+        return iter(query.order_by(Book.id).yield_per(batch_size))
+
+    def iter_suggest_rows(
+        self, batch_size: int = 1000, isbns: Optional[List[str]] = None
+    ) -> Iterator[Any]:
+        """Iterate (id, title, author, publisher, purchase_count) of on-sale books.
+
+        Used to build the in-memory suggest index; only the needed columns
+        are selected and rows are streamed in batches.
+
+        Args:
+            batch_size: Rows fetched per round trip.
+            isbns: If given, only these books (e.g. the rows of an import batch).
+        """
+        query = self.db.query(
+            Book.id, Book.title, Book.author, Book.publisher, Book.purchase_count
+        ).filter(Book.status == "ONSALE")
+        if isbns is not None:
+            query = query.filter(Book.isbn.in_(isbns))
+        return iter(query.yield_per(batch_size))
+
+    def get_existing_isbns(self, isbns: List[str]) -> set[str]:
+        """Return which of the given ISBNs are already registered.
+
+        Args:
+            isbns: ISBNs to check (resolved with a single IN query).
+
+        Returns:
+            set[str]: Already registered ISBNs.
+        """
+        if not isbns:
+            return set()
+        rows = self.db.query(Book.isbn).filter(Book.isbn.in_(isbns)).all()
+        return {row.isbn for row in rows}
+
+    def bulk_create(self, rows: List[dict], *, commit: bool = False) -> int:
+        """Insert many books with a single executemany INSERT.
+
+        ORM instances are not created or refreshed, so this is intended for
+        bulk imports where the inserted rows are not returned.
+
+        Args:
+            rows: Book column values (same keys as create()).
+            commit: If True, commit the transaction. Default False.
+
+        Returns:
+            int: Number of inserted rows.
+        """
+        if rows:
+            self.db.execute(insert(Book), rows)
+            # executemany는 생성된 id를 돌려주지 않으므로 ISBN으로 한 번에 조회
+            inserted = (
+                self.db.query(Book.id, Book.title, Book.author)
+                .filter(Book.isbn.in_([row["isbn"] for row in rows]))
+                .all()
+            )
+            self._replace_trigrams([tuple(row) for row in inserted])
+        if commit:
+            self.db.commit()
+        return len(rows)
+
     def update(self, book: Book, update_data: dict, *, commit: bool = False) -> Book:
         """Update book information.
 
@@ -114,42 +486,105 @@ class BookRepository:
         for key, value in update_data.items():
             if value is not None:
                 setattr(book, key, value)
+        if update_data.get("title") is not None or update_data.get("author") is not None:
+            self._replace_trigrams([(book.id, book.title, book.author)])
         if commit:
             self.db.commit()
             self.db.refresh(book)
         return book
 
-    def update_stats(
+    def increment_purchase_counts(
         self,
-        book: Book,
-        rating: Optional[float] = None,
-        review_count: Optional[int] = None,
-        purchase_count: Optional[int] = None,
+        quantities: dict[int, int],
         *,
+        batch_id: Optional[int] = None,
         commit: bool = False,
-    ) -> Book:
-        """Update book statistics (rating, review count, purchase count).
+    ) -> None:
+        """Atomically add purchased quantities to several books in one UPDATE.
+
+        ``purchaseCount = purchaseCount + CASE id WHEN ... END`` is evaluated
+        in the database, so concurrent orders of the same book never lose an
+        update and no book rows are read or locked beforehand. Negative
+        quantities (cancellations) are not clamped at zero: order events may
+        be applied out of order (a cancel before its create), and only the
+        net result is guaranteed to be non-negative. Book instances already
+        in the session are not synchronized until the commit expires them.
+
+        With ``batch_id``, the batch is recorded as applied in the same
+        transaction (replacing older markers); see purchase_batch_applied().
 
         Args:
-            book: Book instance to update.
-            rating: New average rating value.
-            review_count: New review count value.
-            purchase_count: New purchase count value.
+            quantities: Quantity to add per book id (negative to subtract).
+            batch_id: Write-behind batch the quantities belong to.
             commit: If True, commit the transaction. Default False.
+        """
+        if not quantities:
+            return
+        self.db.execute(
+            update(Book)
+            .where(Book.id.in_(list(quantities)))
+            .values(
+                purchase_count=Book.purchase_count
+                + case(quantities, value=Book.id, else_=0)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if batch_id is not None:
+            # 배치는 하나씩 순서대로 반영되므로 최신 배치 표시만 유지
+            self.db.execute(
+                delete(PurchaseCountBatch).where(PurchaseCountBatch.id < batch_id)
+            )
+            self.db.execute(insert(PurchaseCountBatch).values(id=batch_id))
+        if commit:
+            self.db.commit()
+
+    def purchase_batch_applied(self, batch_id: int) -> bool:
+        """Return whether a write-behind batch is already in the purchase counts.
+
+        Args:
+            batch_id: Batch number from increment_purchase_counts().
 
         Returns:
-            Book: Updated book instance.
+            bool: True if this batch (or a later one) has been committed.
         """
-        if rating is not None:
-            book.average_rating = rating
-        if review_count is not None:
-            book.review_count = review_count
-        if purchase_count is not None:
-            book.purchase_count = purchase_count
+        return (
+            self.db.scalar(
+                select(PurchaseCountBatch.id)
+                .where(PurchaseCountBatch.id >= batch_id)
+                .limit(1)
+            )
+            is not None
+        )
+
+    def refresh_review_stats(self, book_id: int, *, commit: bool = False) -> None:
+        """Recompute a book's average rating and review count in one UPDATE.
+
+        Both values are computed by correlated subqueries over the review
+        table inside the UPDATE, so concurrent review writes cannot overwrite
+        each other's result with a stale Python-side aggregate.
+
+        Args:
+            book_id: ID of the book to update.
+            commit: If True, commit the transaction. Default False.
+        """
+        average_rating = (
+            select(func.coalesce(func.avg(Review.rating), 0))
+            .where(Review.book_id == Book.id)
+            .scalar_subquery()
+        )
+        review_count = (
+            select(func.count(Review.id))
+            .where(Review.book_id == Book.id)
+            .scalar_subquery()
+        )
+        self.db.execute(
+            update(Book)
+            .where(Book.id == book_id)
+            .values(average_rating=average_rating, review_count=review_count)
+            .execution_options(synchronize_session=False)
+        )
         if commit:
             self.db.commit()
-            self.db.refresh(book)
-        return book
 
     def delete(self, book: Book, *, commit: bool = False) -> None:
         """Soft delete a book by setting status to SOLDOUT.
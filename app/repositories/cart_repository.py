@@ -6,6 +6,7 @@ Repositories do NOT commit by default - the service layer manages transactions.
 
 from typing import List, Optional
 
+from sqlalchemy import delete
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.cart import Cart
@@ -101,13 +102,14 @@ class CartRepository:
             self.db.commit()
 
     def delete_multiple(self, carts: List[Cart], *, commit: bool = False) -> None:
-        """Delete multiple cart items.
+        """Delete multiple cart items with a single DELETE statement.
 
         Args:
             carts: List of Cart instances to delete.
             commit: If True, commit the transaction. Default False.
         """
-        for cart in carts:
-            self.db.delete(cart)
+        if carts:
+            cart_ids = [cart.id for cart in carts]
+            self.db.execute(delete(Cart).where(Cart.id.in_(cart_ids)))
         if commit:
             self.db.commit()
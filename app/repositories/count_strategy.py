@@ -0,0 +1,138 @@
+"""Count strategy module for paginated listings.
+
+Paginated listings need a total count, but running ``query.count()`` on the
+full filtered set for every page doubles the database work. This module
+decides how the total is obtained:
+
+1. Unfiltered listings on large MySQL tables use the table statistics
+   estimate (information_schema.TABLES.TABLE_ROWS).
+2. Everything else uses an exact count cached in Redis per normalized
+   filter key. Services invalidate a scope after committing writes.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Query, Session
+
+from app.core.config import settings
+from app.core.redis import COUNT_CACHE_TTL, RedisKeys, get_sync_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_keyword(keyword: Optional[str]) -> Optional[str]:
+    """Normalize a search keyword once, before it is used in a query.
+
+    Services pass the result both to the repository and to the cache keys,
+    so the cached total always describes the query that actually ran.
+    Surrounding whitespace is stripped and a blank keyword means no filter.
+    Case is kept as typed: ILIKE already ignores it, and folding it here
+    could change matches on backends that only fold ASCII.
+    """
+    if keyword is None:
+        return None
+    return keyword.strip() or None
+
+
+def normalize_filters(filters: dict) -> dict:
+    """Normalize filters into a cache key; empty values are dropped.
+
+    Values are not rewritten, since the key must describe exactly the query
+    that ran; callers normalize inputs (e.g. normalize_keyword()) first.
+    """
+    return {
+        key: value
+        for key, value in sorted(filters.items())
+        if value is not None and value != ""
+    }
+
+
+def filter_cache_field(filters: dict) -> str:
+    """Return a stable hash of normalized filters for use as a cache field."""
+    normalized = normalize_filters(filters)
+    return hashlib.sha1(
+        json.dumps(normalized, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class CountStrategy:
+    """Provides total counts for paginated repository queries.
+
+    Attributes:
+        db: SQLAlchemy database session.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def count(self, query: Query, table_name: str, filters: dict) -> int:
+        """Return the total row count for a filtered listing query.
+
+        Args:
+            query: Filtered (unordered, unpaginated) query.
+            table_name: Table being listed; also used as the cache scope.
+            filters: Filter values applied to the query.
+
+        Returns:
+            int: Exact (possibly cached) or estimated total count.
+        """
+        normalized = normalize_filters(filters)
+
+        if not normalized:
+            estimate = self._estimate_rows(table_name)
+            if estimate is not None and estimate >= settings.COUNT_ESTIMATE_THRESHOLD:
+                return estimate
+
+        field = filter_cache_field(filters)
+        cache_key = RedisKeys.count_key(table_name)
+
+        try:
+            cached = get_sync_redis_client().hget(cache_key, field)
+            if cached is not None:
+                return int(cached)
+        except Exception as e:
+            logger.warning(f"Redis count cache read error: {e}")
+
+        total = query.order_by(None).count()
+
+        try:
+            pipe = get_sync_redis_client().pipeline(transaction=False)
+            pipe.hset(cache_key, field, total)
+            pipe.expire(cache_key, COUNT_CACHE_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis count cache write error: {e}")
+
+        return total
+
+    def _estimate_rows(self, table_name: str) -> Optional[int]:
+        """Read the row estimate from table statistics (MySQL only)."""
+        if self.db.get_bind().dialect.name != "mysql":
+            return None
+
+        row: Any = self.db.execute(
+            text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+            ),
+            {"table_name": table_name},
+        ).first()
+        if row is None or row[0] is None:
+            return None
+        return int(row[0])
+
+    @staticmethod
+    def invalidate(table_name: str) -> None:
+        """Drop cached counts of a listing scope after a committed write.
+
+        Args:
+            table_name: Table whose cached counts are stale.
+        """
+        try:
+            get_sync_redis_client().delete(RedisKeys.count_key(table_name))
+        except Exception as e:
+            logger.warning(f"Redis count cache invalidation error: {e}")
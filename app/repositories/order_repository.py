@@ -4,12 +4,15 @@ This module handles all database CRUD operations for orders and order items.
 Repositories do NOT commit by default - the service layer manages transactions.
 """
 
+from datetime import datetime
 from typing import List, Optional, Tuple
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, func, insert, or_, update
+from sqlalchemy.orm import Query, Session, joinedload, selectinload
 
 from app.models.order import Order
 from app.models.order_item import OrderItem
+from app.repositories.count_strategy import CountStrategy
 
 
 class OrderRepository:
@@ -23,6 +26,7 @@ class OrderRepository:
 
     def __init__(self, db: Session):
         self.db = db
+        self.counter = CountStrategy(db)
 
     def get_by_id(self, order_id: int) -> Optional[Order]:
         return (
@@ -33,34 +37,107 @@ class OrderRepository:
         )
 
     def get_by_user_id(
-        self, user_id: int, skip: int = 0, limit: int = 10
-    ) -> Tuple[List[Order], int]:
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 10,
+        include_total: bool = True,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Order], Optional[int]]:
+        """Get a user's orders, newest first.
+
+        Args:
+            user_id: Owner of the orders.
+            skip: Number of rows to skip (offset mode).
+            limit: Maximum number of rows to return.
+            include_total: If False, skip counting and return None as total.
+            after: Keyset position (created_at, id) of the last row of the
+                previous page. When given, ``skip`` is ignored.
+
+        Returns:
+            Tuple[List[Order], Optional[int]]: Orders of the page and total count.
+        """
         query = self.db.query(Order).filter(Order.user_id == user_id)
-        total = query.count()
-        orders = (
-            query.options(joinedload(Order.items).joinedload(OrderItem.book))
-            .order_by(Order.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-        return orders, total
+        total = None
+        if include_total:
+            total = self.counter.count(
+                query, Order.__tablename__, {"user_id": user_id}
+            )
+        return self._get_page(query, skip, limit, after), total
 
     def get_all(
-        self, skip: int = 0, limit: int = 10, status: Optional[str] = None
-    ) -> Tuple[List[Order], int]:
+        self,
+        skip: int = 0,
+        limit: int = 10,
+        status: Optional[str] = None,
+        include_total: bool = True,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Order], Optional[int]]:
+        """Get all orders, newest first (admin).
+
+        Args:
+            skip: Number of rows to skip (offset mode).
+            limit: Maximum number of rows to return.
+            status: Order status filter.
+            include_total: If False, skip counting and return None as total.
+            after: Keyset position (created_at, id) of the last row of the
+                previous page. When given, ``skip`` is ignored.
+
+        Returns:
+            Tuple[List[Order], Optional[int]]: Orders of the page and total count.
+        """
         query = self.db.query(Order)
         if status:
             query = query.filter(Order.status == status)
-        total = query.count()
-        orders = (
-            query.options(joinedload(Order.items).joinedload(OrderItem.book))
-            .order_by(Order.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+        total = None
+        if include_total:
+            total = self.counter.count(query, Order.__tablename__, {"status": status})
+        return self._get_page(query, skip, limit, after), total
+
+    def _get_page(
+        self,
+        query: Query,
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]],
+    ) -> List[Order]:
+        """Load one page of orders with their items and books in two phases.
+
+        1. Select only the page's order ids ordered by (created_at, id), by
+           keyset when ``after`` is given (offset otherwise).
+        2. Load those orders, then their items and books with one IN query
+           each (selectinload), instead of joining every item row into the
+           paged query.
+        """
+        id_query = query.with_entities(Order.id).order_by(
+            Order.created_at.desc(), Order.id.desc()
+        )
+        if after is not None:
+            id_query = id_query.filter(self._seek_condition(after))
+            skip = 0
+        order_ids = [row.id for row in id_query.offset(skip).limit(limit)]
+        if not order_ids:
+            return []
+
+        orders = {
+            order.id: order
+            for order in self.db.query(Order)
+            .options(selectinload(Order.items).selectinload(OrderItem.book))
+            .filter(Order.id.in_(order_ids))
+        }
+        return [orders[order_id] for order_id in order_ids if order_id in orders]
+
+    def _seek_condition(self, after: Tuple[datetime, int]):
+        """Build the keyset condition "(created_at, id) before (value, last_id)"."""
+        value, last_id = after
+        if self.db.get_bind().dialect.name == "sqlite":
+            # SQLite는 CURRENT_TIMESTAMP 형식(초 단위 문자열)으로 저장하므로
+            # 바인딩 값을 같은 형식으로 맞춘다
+            value = func.datetime(value)
+        return or_(
+            Order.created_at < value,
+            and_(Order.created_at == value, Order.id < last_id),
         )
-        return orders, total
 
     def create(self, order_data: dict, *, commit: bool = False) -> Order:
         """Create a new order.
@@ -98,6 +175,25 @@ class OrderRepository:
             self.db.refresh(db_item)
         return db_item
 
+    def bulk_add_items(self, rows: List[dict], *, commit: bool = False) -> int:
+        """Add many items to orders with a single executemany INSERT.
+
+        ORM instances are not created; reload the order (get_by_id) to read
+        the inserted items.
+
+        Args:
+            rows: Order item column values (same keys as add_item()).
+            commit: If True, commit the transaction. Default False.
+
+        Returns:
+            int: Number of inserted rows.
+        """
+        if rows:
+            self.db.execute(insert(OrderItem), rows)
+        if commit:
+            self.db.commit()
+        return len(rows)
+
     def update_status(self, order: Order, status: str, *, commit: bool = False) -> Order:
         """Update order status.
 
@@ -115,6 +211,34 @@ class OrderRepository:
             self.db.refresh(order)
         return order
 
+    def transition_status(
+        self, order: Order, expected_status: str, status: str, *, commit: bool = False
+    ) -> bool:
+        """Change the order status only if it is still ``expected_status``.
+
+        The check and the change happen in one conditional UPDATE, so of two
+        concurrent transitions from the same status only one succeeds.
+
+        Args:
+            order: Order instance to update.
+            expected_status: Status the order must currently have.
+            status: New status value.
+            commit: If True, commit the transaction. Default False.
+
+        Returns:
+            bool: True if the status was changed.
+        """
+        result = self.db.execute(
+            update(Order)
+            .where(Order.id == order.id, Order.status == expected_status)
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+        if commit:
+            self.db.commit()
+            self.db.refresh(order)
+        return result.rowcount == 1
+
 
 class OrderItemRepository:
     def __init__(self, db: Session):
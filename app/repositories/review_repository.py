@@ -97,13 +97,3 @@ class ReviewRepository:
         self.db.delete(review)
         if commit:
             self.db.commit()
-
-    def get_average_rating(self, book_id: int) -> Tuple[float, int]:
-        avg = (
-            self.db.query(func.avg(Review.rating))
-            .filter(Review.book_id == book_id)
-            .scalar()
-            or 0
-        )
-        count = self.db.query(Review).filter(Review.book_id == book_id).count()
-        return float(avg), count
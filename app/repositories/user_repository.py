@@ -10,6 +10,7 @@ from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.models.user import User
+from app.repositories.count_strategy import CountStrategy
 from app.schemas.user import UserCreate, UserUpdate
 
 
@@ -24,20 +25,37 @@ class UserRepository:
 
     def __init__(self, db: Session):
         self.db = db
+        self.counter = CountStrategy(db)
 
     def get_by_id(self, user_id: int) -> Optional[User]:
         return self.db.query(User).filter(User.id == user_id).first()
 
+    def get_principal_row(self, user_id: int):
+        """Load only the columns needed for authorization (id, role, is_active)."""
+        return (
+            self.db.query(User.id, User.role, User.is_active)
+            .filter(User.id == user_id)
+            .first()
+        )
+
     def get_by_email(self, email: str) -> Optional[User]:
         return self.db.query(User).filter(User.email == email).first()
 
-    def get_all(self, skip: int = 0, limit: int = 100, keyword: Optional[str] = None):
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        keyword: Optional[str] = None,
+        include_total: bool = True,
+    ):
         query = self.db.query(User)
         if keyword:
             query = query.filter(
                 or_(User.name.ilike(f"%{keyword}%"), User.email.ilike(f"%{keyword}%"))
             )
-        total = query.count()
+        total = None
+        if include_total:
+            total = self.counter.count(query, User.__tablename__, {"keyword": keyword})
         users = query.offset(skip).limit(limit).all()
         return users, total
 
@@ -15,6 +15,11 @@ class TokenRefresh(BaseModel):
     refresh_token: str
 
 
+class LogoutRequest(BaseModel):
+    """로그아웃 요청 (함께 폐기할 리프레시 토큰)"""
+    refresh_token: Optional[str] = None
+
+
 class TokenData(BaseModel):
     """토큰 데이터 (내부 사용)"""
     user_id: Optional[int] = None
@@ -12,6 +12,29 @@ class BookStatus(str, Enum):
     TOBESOLD = "TOBESOLD"
 
 
+class BookCategory(str, Enum):
+    NOVEL = "NOVEL"  # 소설
+    ESSAY = "ESSAY"  # 에세이
+    SELF_HELP = "SELF_HELP"  # 자기계발
+    BUSINESS = "BUSINESS"  # 경제/경영
+    HUMANITIES = "HUMANITIES"  # 인문학
+    SCIENCE = "SCIENCE"  # 과학
+    HISTORY = "HISTORY"  # 역사
+    TRAVEL = "TRAVEL"  # 여행
+    COOKING = "COOKING"  # 요리
+    HEALTH = "HEALTH"  # 건강
+    COMPUTER = "COMPUTER"  # IT/컴퓨터
+    ART = "ART"  # 예술
+    COMICS = "COMICS"  # 만화
+    CHILDREN = "CHILDREN"  # 아동
+    LANGUAGE = "LANGUAGE"  # 외국어
+
+
+class BookFileFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
 class BookSortBy(str, Enum):
     PRICE_ASC = "price_asc"
     PRICE_DESC = "price_desc"
@@ -19,6 +42,7 @@ class BookSortBy(str, Enum):
     DATE_DESC = "date_desc"
     RATING = "rating"
     SALES = "sales"
+    RELEVANCE = "relevance"  # 키워드 검색 관련도순
 
 
 # ============ Request Schemas ============
@@ -31,6 +55,7 @@ class BookCreate(BaseModel):
     isbn: str = Field(..., max_length=15)
     price: Decimal = Field(..., gt=0)
     publication_date: Optional[date] = None
+    category: Optional[BookCategory] = None
     status: BookStatus = BookStatus.TOBESOLD
 
 
@@ -42,6 +67,7 @@ class BookUpdate(BaseModel):
     summary: Optional[str] = Field(None, max_length=100)
     price: Optional[Decimal] = Field(None, gt=0)
     publication_date: Optional[date] = None
+    category: Optional[BookCategory] = None
     status: Optional[BookStatus] = None
 
 
@@ -57,6 +83,7 @@ class BookResponse(BaseModel):
     isbn: str
     price: Decimal
     status: BookStatus
+    category: Optional[BookCategory] = None
     average_rating: Decimal
     review_count: int
     purchase_count: int
@@ -67,9 +94,57 @@ class BookResponse(BaseModel):
         from_attributes = True
 
 
+class FacetBucket(BaseModel):
+    """패싯 구간별 도서 수"""
+    value: str
+    count: int
+
+
+class BookFacets(BaseModel):
+    """도서 검색 패싯 (facets=true 요청 시)"""
+    publisher: list[FacetBucket]  # 도서 수 내림차순 상위 항목
+    price: list[FacetBucket]  # 가격대 (원)
+    rating: list[FacetBucket]  # 평균 평점 구간
+    status: list[FacetBucket]  # 판매 상태 (상태 필터와 무관하게 집계)
+
+
 class BookListResponse(BaseModel):
     """도서 목록 응답"""
     books: list[BookResponse]
-    total: int
+    total: Optional[int] = None  # include_total=false 요청 시 생략
     page: int
     size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (keyset 페이지네이션)
+    facets: Optional[BookFacets] = None
+
+
+class BookSuggestion(BaseModel):
+    """자동완성 후보 도서"""
+    id: int
+    title: str
+    author: str
+    publisher: str
+    purchase_count: int
+
+    class Config:
+        from_attributes = True
+
+
+class BookSuggestResponse(BaseModel):
+    """자동완성 응답"""
+    suggestions: list[BookSuggestion]
+
+
+class BookImportError(BaseModel):
+    """대량 등록 실패 행"""
+    row: int  # 데이터 행 번호 (1부터, CSV 헤더 제외)
+    isbn: Optional[str] = None
+    message: str
+
+
+class BookImportResponse(BaseModel):
+    """도서 대량 등록 결과"""
+    total_rows: int
+    created: int
+    failed: int
+    errors: list[BookImportError]  # 최대 BOOK_IMPORT_MAX_ERRORS건
@@ -50,6 +50,7 @@ class OrderResponse(BaseModel):
 class OrderListResponse(BaseModel):
     """주문 목록 응답"""
     orders: list[OrderResponse]
-    total: int
+    total: Optional[int] = None  # include_total=false 요청 시 생략
     page: int
     size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (keyset 페이지네이션)
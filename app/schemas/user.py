@@ -69,6 +69,6 @@ class UserResponse(BaseModel):
 class UserListResponse(BaseModel):
     """사용자 목록 응답 (Admin용)"""
     users: list[UserResponse]
-    total: int
+    total: Optional[int] = None  # include_total=false 요청 시 생략
     page: int
     size: int
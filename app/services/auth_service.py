@@ -1,20 +1,26 @@
+from typing import Optional
+
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
 )
 from app.exceptions.auth_exceptions import (
     InvalidCredentialsException,
     InvalidTokenException,
 )
 from app.exceptions.user_exceptions import UserAlreadyExistsException
+from app.models.user import User
+from app.repositories.count_strategy import CountStrategy
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth import TokenData, TokenResponse
 from app.schemas.user import UserCreate
+from app.services.token_revocation import token_revocation
 
 
 class AuthService:
@@ -22,25 +28,27 @@ class AuthService:
         self.db = db
         self.user_repo = UserRepository(db)
 
-    def signup(self, user_data: UserCreate) -> dict:
+    async def signup(self, user_data: UserCreate) -> dict:
+        # DB 작업은 스레드풀에서, 해싱은 해싱 풀을 await (요청 스레드 점유 없음)
         # 이메일 중복 체크
-        existing_user = self.user_repo.get_by_email(user_data.email)
+        existing_user = await run_in_threadpool(
+            self.user_repo.get_by_email, user_data.email
+        )
         if existing_user:
             raise UserAlreadyExistsException("Email already registered")
 
         # 비밀번호 해싱
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
 
         # 사용자 생성
         user_dict = user_data.model_dump()
         user_dict["password"] = hashed_password
 
-        user = self.user_repo.create(user_dict)
-        return user
+        return await run_in_threadpool(self._create_user, user_dict)
 
-    def login(self, email: str, password: str) -> TokenResponse:
+    async def login(self, email: str, password: str) -> TokenResponse:
         # 사용자 조회
-        user = self.user_repo.get_by_email(email)
+        user = await run_in_threadpool(self.user_repo.get_by_email, email)
         if not user:
             raise InvalidCredentialsException()
 
@@ -49,7 +57,7 @@ class AuthService:
             raise InvalidCredentialsException("Account is deactivated")
 
         # 비밀번호 검증
-        if not verify_password(password, user.password):
+        if not await verify_password_async(password, user.password):
             raise InvalidCredentialsException()
 
         # 토큰 생성
@@ -64,6 +72,8 @@ class AuthService:
         payload = decode_token(refresh_token)
         if not payload or payload.get("type") != "refresh":
             raise InvalidTokenException()
+        if payload.get("jti") and token_revocation.is_revoked(payload["jti"]):
+            raise InvalidTokenException("Token has been revoked")
 
         user_id = payload.get("sub")
         user = self.user_repo.get_by_id(int(user_id))
@@ -79,11 +89,21 @@ class AuthService:
             access_token=new_access_token, refresh_token=new_refresh_token
         )
 
-    def logout(self) -> bool:
-        # JWT는 stateless이므로 클라이언트에서 토큰 삭제로 처리
-        # 실제 구현에서는 토큰 블랙리스트를 사용할 수 있음
+    def logout(self, access_token: str, refresh_token: Optional[str] = None) -> bool:
+        """Revoke the access token (and the refresh token, if given) until expiry."""
+        for token, token_type in ((access_token, "access"), (refresh_token, "refresh")):
+            payload = decode_token(token) if token else None
+            if not payload or payload.get("type") != token_type:
+                continue
+            if payload.get("jti"):
+                token_revocation.revoke(payload["jti"], payload["exp"])
         return True
 
+    def _create_user(self, user_dict: dict):
+        user = self.user_repo.create(user_dict)
+        CountStrategy.invalidate(User.__tablename__)
+        return user
+
     def get_current_user_from_token(self, token: str):
         payload = decode_token(token)
         if not payload or payload.get("type") != "access":
@@ -0,0 +1,251 @@
+"""Book cache module.
+
+GET /books/{book_id} 응답(BookResponse)을 read-through 방식으로 캐싱합니다.
+
+1. 워커 프로세스별 LRU (짧은 TTL) - 적중 시 Redis/DB 접근 없음
+2. Redis (book:{id}) - 워커 간 공유
+
+도서를 변경하는 서비스(BookService, OrderService, ReviewService)는 커밋 후
+invalidate()를 호출해야 합니다. Redis 장애 시에는 DB 조회로 대체됩니다.
+캐시 미스 시 DB를 읽는 동안 invalidate()가 실행되면 이전 값이 다시 기록될 수 있으므로,
+캐시 값에 도서별 버전(book:version:{id})을 함께 저장하고 invalidate()가 버전을
+올립니다. 조회 시 버전이 다른 값은 미스로 처리합니다 (PrincipalCache와 동일).
+
+검색 결과(페이지의 도서 id 목록 + total)는 정규화된 검색 조건과 카탈로그
+버전(catalog:version)으로 키를 만들어 캐싱합니다. 도서 쓰기 시 버전만 증가시키면
+이전 버전의 키는 더 이상 조회되지 않으므로 키 스캔 없이 일괄 무효화됩니다.
+
+도서 검색 패싯(BookFacets)은 정규화된 검색 조건별로 Redis 해시(facets:book)에
+캐싱하며, 도서 등록/수정/삭제 시 해시 전체를 무효화합니다.
+"""
+
+import json
+import logging
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.redis import (
+    BOOK_CACHE_TTL,
+    FACET_CACHE_TTL,
+    SEARCH_CACHE_TTL,
+    RedisKeys,
+    get_sync_redis_client,
+)
+from app.repositories.count_strategy import filter_cache_field
+from app.schemas.book import BookFacets, BookResponse
+from app.utils.lru_cache import LocalLRUCache
+
+logger = logging.getLogger(__name__)
+
+_local_cache = LocalLRUCache(
+    maxsize=settings.BOOK_CACHE_LOCAL_MAXSIZE, ttl=settings.BOOK_CACHE_LOCAL_TTL
+)
+
+# 이 워커의 invalidate() 호출 횟수 (조회 중 무효화된 값을 로컬 캐시에 넣지 않기 위함)
+_local_invalidations = 0
+
+
+class BookDetailCache:
+    """Read-through cache of book detail responses keyed by book id."""
+
+    @staticmethod
+    def get_or_load(
+        book_id: int, loader: Callable[[int], Optional[BookResponse]]
+    ) -> Optional[BookResponse]:
+        """Return the cached book detail, loading and caching it on a miss.
+
+        Args:
+            book_id: Book ID.
+            loader: Loads the book detail from the database (None if missing).
+
+        Returns:
+            Optional[BookResponse]: Book detail, or None if the book does not exist.
+        """
+        cached = _local_cache.get(book_id)
+        if cached is not None:
+            return cached
+
+        cache_key = RedisKeys.book_key(book_id)
+        invalidations = _local_invalidations
+        version = None
+        try:
+            pipe = get_sync_redis_client().pipeline(transaction=False)
+            pipe.get(RedisKeys.book_version_key(book_id))
+            pipe.get(cache_key)
+            version, payload = pipe.execute()
+            version = version or "0"
+            if payload is not None:
+                data = json.loads(payload)
+                # 이전 버전으로 기록된 값은 invalidate() 이전에 읽은 DB 값
+                if data.get("version") == version:
+                    book = BookResponse.model_validate(data["book"])
+                    _local_cache.set(book_id, book)
+                    return book
+        except Exception as e:
+            logger.warning(f"Redis book cache read error: {e}")
+
+        book = loader(book_id)
+        if book is None:
+            return None
+
+        if version is not None:
+            try:
+                get_sync_redis_client().set(
+                    cache_key,
+                    json.dumps(
+                        {"version": version, "book": book.model_dump(mode="json")}
+                    ),
+                    ex=BOOK_CACHE_TTL,
+                )
+            except Exception as e:
+                logger.warning(f"Redis book cache write error: {e}")
+        if invalidations == _local_invalidations:
+            _local_cache.set(book_id, book)
+        return book
+
+    @staticmethod
+    def invalidate(book_ids: Iterable[int]) -> None:
+        """Drop cached details of books changed by a committed write.
+
+        Args:
+            book_ids: IDs of the changed books.
+        """
+        global _local_invalidations
+
+        book_ids = set(book_ids)
+        if not book_ids:
+            return
+
+        _local_invalidations += 1
+        for book_id in book_ids:
+            _local_cache.delete(book_id)
+        try:
+            pipe = get_sync_redis_client().pipeline(transaction=False)
+            for book_id in book_ids:
+                pipe.incr(RedisKeys.book_version_key(book_id))
+            pipe.delete(*(RedisKeys.book_key(book_id) for book_id in book_ids))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis book cache invalidation error: {e}")
+
+    @staticmethod
+    def clear_local() -> None:
+        """Clear this worker's in-process cache."""
+        _local_cache.clear()
+
+
+class BookFacetCache:
+    """Cache of search facet buckets keyed by normalized filters."""
+
+    SCOPE = "book"
+
+    @staticmethod
+    def get_or_load(filters: dict, loader: Callable[[], BookFacets]) -> BookFacets:
+        """Return cached facets for the filters, computing them on a miss.
+
+        Args:
+            filters: Search filters (normalized into the cache field).
+            loader: Computes the facets from the database.
+
+        Returns:
+            BookFacets: Facet buckets.
+        """
+        cache_key = RedisKeys.facet_key(BookFacetCache.SCOPE)
+        field = filter_cache_field(filters)
+        try:
+            payload = get_sync_redis_client().hget(cache_key, field)
+            if payload is not None:
+                return BookFacets.model_validate_json(payload)
+        except Exception as e:
+            logger.warning(f"Redis facet cache read error: {e}")
+
+        facets = loader()
+
+        try:
+            pipe = get_sync_redis_client().pipeline(transaction=False)
+            pipe.hset(cache_key, field, facets.model_dump_json())
+            pipe.expire(cache_key, FACET_CACHE_TTL)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis facet cache write error: {e}")
+        return facets
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop all cached facets after a committed catalog write."""
+        try:
+            get_sync_redis_client().delete(RedisKeys.facet_key(BookFacetCache.SCOPE))
+        except Exception as e:
+            logger.warning(f"Redis facet cache invalidation error: {e}")
+
+
+class BookSearchCache:
+    """Cache of search result pages (book ids, total, next cursor) per catalog version.
+
+    호출자는 DB 조회 전에 current_version()으로 버전을 읽어 get/set에 같은 값을
+    넘겨야 합니다. 조회 도중 버전이 증가하면 결과가 이전 버전 키에 저장되어
+    새 버전에서 오래된 결과가 보이지 않습니다.
+    """
+
+    @staticmethod
+    def current_version() -> Optional[str]:
+        """Return the current catalog version, or None if Redis is unavailable."""
+        try:
+            return get_sync_redis_client().get(RedisKeys.CATALOG_VERSION) or "0"
+        except Exception as e:
+            logger.warning(f"Redis catalog version read error: {e}")
+            return None
+
+    @staticmethod
+    def get(
+        version: str, query: dict
+    ) -> Optional[Tuple[List[int], Optional[int], Optional[str]]]:
+        """Return the cached (book ids, total, next cursor) of a search, or None.
+
+        Args:
+            version: Catalog version from current_version().
+            query: Search parameters (normalized into the cache key).
+        """
+        try:
+            payload = get_sync_redis_client().get(
+                RedisKeys.search_key(version, filter_cache_field(query))
+            )
+            if payload is None:
+                return None
+            data = json.loads(payload)
+            return data["ids"], data["total"], data["next_cursor"]
+        except Exception as e:
+            logger.warning(f"Redis search cache read error: {e}")
+            return None
+
+    @staticmethod
+    def set(
+        version: str,
+        query: dict,
+        book_ids: List[int],
+        total: Optional[int],
+        next_cursor: Optional[str],
+    ) -> None:
+        """Cache the result page of a search under the given catalog version.
+
+        The next cursor is stored as computed from the rows of this query, so a
+        hit keeps paging from the cached ordering rather than from reloaded rows.
+        """
+        try:
+            get_sync_redis_client().set(
+                RedisKeys.search_key(version, filter_cache_field(query)),
+                json.dumps(
+                    {"ids": book_ids, "total": total, "next_cursor": next_cursor}
+                ),
+                ex=SEARCH_CACHE_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"Redis search cache write error: {e}")
+
+    @staticmethod
+    def bump_version() -> None:
+        """Invalidate every cached search at once after a committed catalog write."""
+        try:
+            get_sync_redis_client().incr(RedisKeys.CATALOG_VERSION)
+        except Exception as e:
+            logger.warning(f"Redis catalog version bump error: {e}")
@@ -1,22 +1,54 @@
-from typing import Optional
+import hashlib
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, BinaryIO, Iterator, List, Optional, Tuple
 
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+
 from app.exceptions.book_exceptions import (
     BookAlreadyExistsException,
     BookNotFoundException,
     BookNotOwnedException,
 )
+from app.exceptions.pagination_exceptions import InvalidCursorException
 from app.exceptions.seller_exceptions import SellerNotFoundException
-from app.repositories.book_repository import BookRepository
+from app.models.book import Book
+from app.repositories.book_repository import (
+    BOOK_SORT_KEYS,
+    PRICE_FACET_BANDS,
+    RATING_FACET_BANDS,
+    BookRepository,
+)
+from app.repositories.count_strategy import CountStrategy, normalize_keyword
 from app.repositories.seller_repository import SellerRepository
 from app.schemas.book import (
+    BookCategory,
     BookCreate,
+    BookFacets,
+    BookFileFormat,
+    BookImportError,
+    BookImportResponse,
     BookListResponse,
     BookResponse,
     BookSortBy,
+    BookStatus,
+    BookSuggestion,
+    BookSuggestResponse,
     BookUpdate,
+    FacetBucket,
 )
+from app.services.book_cache import BookDetailCache, BookFacetCache, BookSearchCache
+from app.services.book_suggest import book_suggest_index
+from app.services.purchase_counter import PurchaseCounter
+from app.utils.book_export import encode_rows, gzip_chunks
+from app.utils.book_import import iter_import_rows
+from app.utils.cursor import decode_cursor, encode_cursor
+
+# 구매/리뷰 통계 정렬은 카탈로그 버전 변경 없이 순서가 바뀌므로 검색 캐시에서 제외
+STAT_SORTS = frozenset({BookSortBy.RATING, BookSortBy.SALES})
 
 
 class BookService:
@@ -42,37 +74,358 @@ class BookService:
         book_dict["seller_id"] = seller.id
 
         book = self.book_repo.create(book_dict, commit=True)
+        self._invalidate_listing_caches()
+        book_suggest_index.upsert(book)
         return book
 
+    def import_books(
+        self, user_id: int, stream: BinaryIO, fmt: BookFileFormat
+    ) -> BookImportResponse:
+        """Bulk-register books from a CSV/NDJSON upload.
+
+        The file is parsed as a stream and every row is validated with
+        BookCreate. Valid rows are buffered and written in batches of
+        BOOK_IMPORT_BATCH_SIZE: each batch resolves ISBN duplicates with one
+        IN query and inserts the rest with one executemany INSERT in its own
+        transaction. Invalid or duplicate rows are reported, not raised.
+
+        Args:
+            user_id: ID of the seller user.
+            stream: Binary file object of the upload.
+            fmt: Upload format.
+
+        Returns:
+            BookImportResponse: Counts and per-row errors.
+
+        Raises:
+            SellerNotFoundException: If the user has no seller profile.
+        """
+        seller = self.seller_repo.get_by_user_id(user_id)
+        if not seller:
+            raise SellerNotFoundException(
+                "Seller profile not found. Please register as a seller first."
+            )
+
+        report = BookImportResponse(total_rows=0, created=0, failed=0, errors=[])
+        seen_isbns: set[str] = set()
+        batch: List[Tuple[int, dict]] = []
+
+        for row_no, data, parse_error in iter_import_rows(stream, fmt):
+            report.total_rows += 1
+            if parse_error:
+                self._report_import_error(report, row_no, None, parse_error)
+                continue
+
+            try:
+                book_data = BookCreate.model_validate(data)
+            except ValidationError as e:
+                message = "; ".join(
+                    f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}"
+                    for err in e.errors()
+                )
+                self._report_import_error(report, row_no, data.get("isbn"), message)
+                continue
+
+            # 파일 내 중복 ISBN은 첫 행만 등록
+            if book_data.isbn in seen_isbns:
+                self._report_import_error(
+                    report, row_no, book_data.isbn, "Duplicate ISBN in upload"
+                )
+                continue
+            seen_isbns.add(book_data.isbn)
+
+            book_dict = book_data.model_dump()
+            book_dict["seller_id"] = seller.id
+            batch.append((row_no, book_dict))
+
+            if len(batch) >= settings.BOOK_IMPORT_BATCH_SIZE:
+                self._flush_import_batch(batch, report)
+                batch = []
+
+        self._flush_import_batch(batch, report)
+
+        if report.created:
+            self._invalidate_listing_caches()
+        return report
+
+    def export_books(
+        self,
+        user_id: int,
+        is_admin: bool,
+        fmt: BookFileFormat,
+        seller_id: Optional[int] = None,
+        compress: bool = False,
+    ) -> Iterator[bytes]:
+        """Stream the catalog as NDJSON/CSV bytes.
+
+        Admins export every book (or one seller's with ``seller_id``); sellers
+        always export their own books. The scope is resolved eagerly so that
+        permission errors are raised before the response starts.
+
+        Args:
+            user_id: ID of the requesting user.
+            is_admin: Whether the requesting user is an admin.
+            fmt: Output format.
+            seller_id: Seller filter (admin only).
+            compress: If True, gzip the stream.
+
+        Returns:
+            Iterator[bytes]: Encoded (optionally gzipped) chunks.
+
+        Raises:
+            SellerNotFoundException: If a non-admin user has no seller profile.
+        """
+        if not is_admin:
+            seller = self.seller_repo.get_by_user_id(user_id)
+            if not seller:
+                raise SellerNotFoundException(
+                    "Seller profile not found. Please register as a seller first."
+                )
+            seller_id = seller.id
+
+        books = self.book_repo.iter_for_export(seller_id=seller_id)
+        chunks = encode_rows((BookResponse.model_validate(b) for b in books), fmt)
+        return gzip_chunks(chunks) if compress else chunks
+
+    def _flush_import_batch(
+        self, batch: List[Tuple[int, dict]], report: BookImportResponse
+    ) -> None:
+        """Insert one import batch in its own transaction."""
+        if not batch:
+            return
+
+        existing = self.book_repo.get_existing_isbns([row["isbn"] for _, row in batch])
+        rows = []
+        for row_no, row in batch:
+            if row["isbn"] in existing:
+                self._report_import_error(
+                    report, row_no, row["isbn"], BookAlreadyExistsException().message
+                )
+            else:
+                rows.append(row)
+
+        created = self.book_repo.bulk_create(rows, commit=True)
+        report.created += created
+        if created:
+            book_suggest_index.add_rows(
+                self.book_repo.iter_suggest_rows(isbns=[row["isbn"] for row in rows])
+            )
+
+    def _report_import_error(
+        self,
+        report: BookImportResponse,
+        row_no: int,
+        isbn: Optional[Any],
+        message: str,
+    ) -> None:
+        report.failed += 1
+        if len(report.errors) < settings.BOOK_IMPORT_MAX_ERRORS:
+            report.errors.append(
+                BookImportError(
+                    row=row_no,
+                    isbn=isbn if isinstance(isbn, str) else None,
+                    message=message,
+                )
+            )
+
     def get_books(
         self,
         page: int = 1,
         size: int = 10,
         keyword: Optional[str] = None,
-        category: Optional[str] = None,
+        category: Optional[BookCategory] = None,
         sort: BookSortBy = BookSortBy.DATE_DESC,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        facets: bool = False,
+        fuzzy: bool = False,
     ) -> BookListResponse:
+        """Get on-sale books with offset or keyset (cursor) pagination.
+
+        When ``cursor`` is given, the page is fetched by seeking past the
+        last row of the previous page, so deep pages cost the same as the
+        first one and rows do not shift between requests. With ``facets``,
+        facet buckets of the same search are attached (one cached query).
+        With ``fuzzy``, the keyword is matched by trigram similarity so that
+        misspelled titles/authors still find the intended books.
+
+        The page's book ids, total and next cursor are cached per catalog
+        version; on a hit only the books themselves are loaded (one primary-key
+        IN query). Sorts by purchase/review stats are not cached, since those
+        stats change without a catalog version bump.
+        """
+        keyword = normalize_keyword(keyword)
+        after = self._decode_cursor(cursor, sort) if cursor else None
         skip = (page - 1) * size
-        books, total = self.book_repo.get_all(
-            skip=skip,
-            limit=size,
-            keyword=keyword,
-            category=category,
-            sort=sort,
-            status="ONSALE",  # 판매 중인 책만 조회
-        )
+        query = {
+            "keyword": keyword,
+            "category": category,
+            "sort": sort.value,
+            "page": None if cursor else page,
+            # 긴 커서 문자열 대신 해시로 키 구성
+            "cursor": hashlib.sha1(cursor.encode()).hexdigest() if cursor else None,
+            "size": size,
+            "include_total": include_total,
+            "fuzzy": fuzzy or None,
+        }
+        version = None if sort in STAT_SORTS else BookSearchCache.current_version()
+        cached = BookSearchCache.get(version, query) if version else None
+        if cached is not None:
+            # 커서는 캐시된 순서 기준으로 저장된 값을 사용 (재조회한 값으로 만들면 어긋남)
+            book_ids, total, next_cursor = cached
+            books = self.book_repo.get_by_ids(book_ids)
+        else:
+            books, total = self.book_repo.get_all(
+                skip=skip,
+                limit=size,
+                keyword=keyword,
+                category=category,
+                sort=sort,
+                status="ONSALE",  # 판매 중인 책만 조회
+                after=after,
+                include_total=include_total,
+                fuzzy=fuzzy,
+            )
+            next_cursor = None
+            if len(books) == size and sort in BOOK_SORT_KEYS:
+                next_cursor = self._encode_cursor(books[-1], sort)
+            if version:
+                BookSearchCache.set(
+                    version, query, [b.id for b in books], total, next_cursor
+                )
+
         return BookListResponse(
-            books=[BookResponse.model_validate(b) for b in books],
+            books=self._merge_pending_purchases(
+                [BookResponse.model_validate(b) for b in books]
+            ),
             total=total,
             page=page,
             size=size,
+            next_cursor=next_cursor,
+            facets=self._get_facets(keyword, category, fuzzy) if facets else None,
+        )
+
+    def _get_facets(
+        self, keyword: Optional[str], category: Optional[BookCategory], fuzzy: bool
+    ) -> BookFacets:
+        status = BookStatus.ONSALE.value
+        filters = {
+            "keyword": keyword,
+            "category": category,
+            "status": status,
+            "fuzzy": fuzzy or None,
+        }
+
+        def load() -> BookFacets:
+            rows = self.book_repo.get_facets(
+                keyword=keyword, category=category, status=status, fuzzy=fuzzy
+            )
+            return BookFacets(
+                publisher=self._facet_buckets(rows["publisher"])[
+                    : settings.BOOK_FACET_PUBLISHER_LIMIT
+                ],
+                price=self._facet_buckets(
+                    rows["price"], [label for label, _ in reversed(PRICE_FACET_BANDS)]
+                ),
+                rating=self._facet_buckets(
+                    rows["rating"], [label for label, _ in RATING_FACET_BANDS]
+                ),
+                status=self._facet_buckets(
+                    rows["status"], [s.value for s in BookStatus]
+                ),
+            )
+
+        return BookFacetCache.get_or_load(filters, load)
+
+    def _facet_buckets(
+        self, rows: List[Tuple[str, int]], order: Optional[List[str]] = None
+    ) -> List[FacetBucket]:
+        """Order facet rows: fixed bucket order (zero-filled) or count desc."""
+        counts = {str(value): count for value, count in rows if value is not None}
+        if order is None:
+            ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+            return [FacetBucket(value=value, count=count) for value, count in ranked]
+        return [FacetBucket(value=value, count=counts.get(value, 0)) for value in order]
+
+    def _invalidate_listing_caches(self) -> None:
+        """Drop cached totals, facets and search pages after a committed catalog write."""
+        CountStrategy.invalidate(Book.__tablename__)
+        BookFacetCache.invalidate()
+        BookSearchCache.bump_version()
+
+    def _encode_cursor(self, book: Book, sort: BookSortBy) -> str:
+        column, _ = BOOK_SORT_KEYS[sort]
+        value = getattr(book, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        return encode_cursor({"sort": sort.value, "key": value, "id": book.id})
+
+    def _decode_cursor(self, cursor: str, sort: BookSortBy) -> Tuple[Any, int]:
+        if sort not in BOOK_SORT_KEYS:
+            raise InvalidCursorException(
+                f"Cursor pagination is not supported for sort '{sort.value}'"
+            )
+
+        payload = decode_cursor(cursor)
+        if payload.get("sort") != sort.value:
+            raise InvalidCursorException("Cursor does not match the sort option")
+
+        column, _ = BOOK_SORT_KEYS[sort]
+        python_type = column.type.python_type
+        try:
+            raw_value = payload["key"]
+            if python_type is datetime:
+                value = datetime.fromisoformat(raw_value)
+            elif python_type is Decimal:
+                value = Decimal(str(raw_value))
+            else:
+                value = python_type(raw_value)
+            last_id = int(payload["id"])
+        except (KeyError, TypeError, ValueError, InvalidOperation):
+            raise InvalidCursorException()
+        return value, last_id
+
+    def suggest_books(self, prefix: str, limit: int = 10) -> BookSuggestResponse:
+        """Autocomplete on-sale books by title/author/publisher prefix.
+
+        Served from the in-memory suggest index without a database query.
+        """
+        entries = book_suggest_index.suggest(prefix, limit)
+        return BookSuggestResponse(
+            suggestions=[BookSuggestion.model_validate(e) for e in entries]
         )
 
     def get_book(self, book_id: int) -> BookResponse:
+        """Get book detail through the read-through cache.
+
+        A cache hit is served without touching the database.
+        """
+        book = BookDetailCache.get_or_load(book_id, self._load_book)
+        if book is None:
+            raise BookNotFoundException()
+        return self._merge_pending_purchases([book])[0]
+
+    def _merge_pending_purchases(
+        self, books: List[BookResponse]
+    ) -> List[BookResponse]:
+        """Add purchase counts buffered in Redis (write-behind mode) to responses."""
+        if not settings.PURCHASE_COUNT_WRITE_BEHIND or not books:
+            return books
+        pending = PurchaseCounter.pending(self.db, (b.id for b in books))
+        return [
+            b.model_copy(
+                update={"purchase_count": max(0, b.purchase_count + pending[b.id])}
+            )
+            if b.id in pending
+            else b
+            for b in books
+        ]
+
+    def _load_book(self, book_id: int) -> Optional[BookResponse]:
         book = self.book_repo.get_by_id(book_id)
         if not book:
-            raise BookNotFoundException()
-        return book
+            return None
+        return BookResponse.model_validate(book)
 
     def update_book(
         self, user_id: int, book_id: int, update_data: BookUpdate
@@ -87,7 +440,10 @@ class BookService:
             raise BookNotOwnedException()
 
         update_dict = update_data.model_dump(exclude_unset=True)
-        updated_book = self.book_repo.update(book, update_dict)
+        updated_book = self.book_repo.update(book, update_dict, commit=True)
+        self._invalidate_listing_caches()
+        BookDetailCache.invalidate([book_id])
+        book_suggest_index.upsert(updated_book)
         return updated_book
 
     def delete_book(self, user_id: int, book_id: int) -> bool:
@@ -101,5 +457,8 @@ class BookService:
             raise BookNotOwnedException()
 
         # 상태를 SOLDOUT으로 변경 (실제 삭제 아님)
-        self.book_repo.delete(book)
+        self.book_repo.delete(book, commit=True)
+        self._invalidate_listing_caches()
+        BookDetailCache.invalidate([book_id])
+        book_suggest_index.remove(book_id)
         return True
@@ -0,0 +1,230 @@
+"""Book autocomplete (prefix suggest) index module.
+
+판매 중(ONSALE)인 도서의 제목/저자/출판사를 정렬된 배열에 보관하고, 접두어와 일치하는
+도서 중 판매량(purchase_count) 상위 N권을 반환합니다. 조회 시 DB에 접근하지 않습니다.
+
+- 짧은 접두어(SUGGEST_TOP_PREFIX_LENGTH 이하)는 일치 범위가 넓으므로 접두어별 상위
+  SUGGEST_TOP_K권을 미리 계산해 두고 그대로 반환합니다.
+- 더 긴 접두어는 bisect로 일치 범위를 찾아 범위 전체에서 순위를 매깁니다.
+- 앱 시작 시 rebuild()로 구축하고, 스케줄러가 주기적으로 재구축합니다
+  (다른 워커의 변경 및 판매량 반영).
+- 이 워커에서 처리한 도서 등록/수정/삭제/일괄 등록은 BookService가
+  upsert()/remove()/add_rows()로 즉시 반영합니다.
+"""
+
+import heapq
+import logging
+import threading
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Any, Iterable, List
+
+from sqlalchemy.orm import Session
+
+from app.models.book import Book
+from app.repositories.book_repository import BookRepository
+
+logger = logging.getLogger(__name__)
+
+# 접두어별로 미리 계산해 두는 상위 도서 수 (자동완성 limit 상한)
+SUGGEST_TOP_K = 20
+
+# 이 길이 이하의 접두어는 상위 도서를 미리 계산 (긴 접두어는 일치 범위 전체를 검사)
+SUGGEST_TOP_PREFIX_LENGTH = 3
+
+# 한 번에 추가되는 키가 이보다 많으면 insort 대신 병합 정렬
+_BULK_INSERT_KEYS = 64
+
+
+@dataclass(frozen=True)
+class SuggestEntry:
+    """Book fields kept in the suggest index."""
+
+    id: int
+    title: str
+    author: str
+    publisher: str
+    purchase_count: int
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def _index_keys(entry: SuggestEntry) -> set[str]:
+    """Keys of a book: each field from its start and from every word start."""
+    keys = set()
+    for value in (entry.title, entry.author, entry.publisher):
+        words = _normalize(value or "").split(" ")
+        for i in range(len(words)):
+            key = " ".join(words[i:])
+            if key:
+                keys.add(key)
+    return keys
+
+
+def _short_prefixes(keys: Iterable[str]) -> set[str]:
+    """Prefixes of the keys whose top books are precomputed."""
+    return {
+        key[:length]
+        for key in keys
+        for length in range(1, min(len(key), SUGGEST_TOP_PREFIX_LENGTH) + 1)
+    }
+
+
+def _rank(entry: SuggestEntry) -> tuple:
+    return (-entry.purchase_count, entry.title, entry.id)
+
+
+def _entry(row: Any) -> SuggestEntry:
+    return SuggestEntry(
+        id=row.id,
+        title=row.title,
+        author=row.author,
+        publisher=row.publisher,
+        purchase_count=row.purchase_count or 0,
+    )
+
+
+class BookSuggestIndex:
+    """Sorted-array prefix index over on-sale book titles/authors/publishers."""
+
+    def __init__(self):
+        self._keys: List[tuple[str, int]] = []  # (정규화된 키, book_id) 정렬 배열
+        self._entries: dict[int, SuggestEntry] = {}
+        self._top: dict[str, List[int]] = {}  # 짧은 접두어 -> 판매량 순 상위 book_id
+        self._lock = threading.Lock()
+
+    def rebuild(self, db: Session) -> int:
+        """Rebuild the whole index from on-sale books.
+
+        Returns:
+            int: Number of indexed books.
+        """
+        entries = {
+            row.id: _entry(row) for row in BookRepository(db).iter_suggest_rows()
+        }
+        keys = []
+        top: dict[str, List[int]] = {}
+        # 판매량 순으로 순회하면 접두어별 목록이 순위대로 채워짐
+        for entry in sorted(entries.values(), key=_rank):
+            entry_keys = _index_keys(entry)
+            keys.extend((key, entry.id) for key in entry_keys)
+            for prefix in _short_prefixes(entry_keys):
+                ids = top.setdefault(prefix, [])
+                if len(ids) < SUGGEST_TOP_K:
+                    ids.append(entry.id)
+        keys.sort()
+        with self._lock:
+            self._entries = entries
+            self._keys = keys
+            self._top = top
+        logger.info(f"Book suggest index rebuilt ({len(entries)} books)")
+        return len(entries)
+
+    def upsert(self, book: Book) -> None:
+        """Reflect a created/updated book (removed unless it is on sale)."""
+        if book.status != "ONSALE":
+            self.remove(book.id)
+            return
+
+        with self._lock:
+            self._remove_locked(book.id)
+            self._add_locked([_entry(book)])
+
+    def add_rows(self, rows: Iterable[Any]) -> None:
+        """Add on-sale rows from BookRepository.iter_suggest_rows() (e.g. an import)."""
+        entries = [_entry(row) for row in rows]
+        if not entries:
+            return
+        with self._lock:
+            for entry in entries:
+                self._remove_locked(entry.id)
+            self._add_locked(entries)
+
+    def remove(self, book_id: int) -> None:
+        """Remove a book from the index."""
+        with self._lock:
+            self._remove_locked(book_id)
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[SuggestEntry]:
+        """Return up to ``limit`` on-sale books matching the prefix, best sellers first.
+
+        Args:
+            prefix: Typed text (case-insensitive, matched at field or word start).
+            limit: Maximum number of suggestions.
+
+        Returns:
+            List[SuggestEntry]: Matching books ordered by purchase_count.
+        """
+        key = _normalize(prefix)
+        if not key:
+            return []
+
+        with self._lock:
+            if len(key) <= SUGGEST_TOP_PREFIX_LENGTH and limit <= SUGGEST_TOP_K:
+                top = self._top.get(key, [])[:limit]
+                return [self._entries[book_id] for book_id in top]
+            return self._scan_locked(key, limit)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._keys = []
+            self._entries = {}
+            self._top = {}
+
+    def _scan_locked(self, prefix: str, limit: int) -> List[SuggestEntry]:
+        """Rank every book in the index range matching the prefix."""
+        matched: set[int] = set()
+        index = bisect_left(self._keys, (prefix, -1))
+        while index < len(self._keys) and self._keys[index][0].startswith(prefix):
+            matched.add(self._keys[index][1])
+            index += 1
+        return heapq.nsmallest(
+            limit, (self._entries[book_id] for book_id in matched), key=_rank
+        )
+
+    def _add_locked(self, entries: List[SuggestEntry]) -> None:
+        new_keys = []
+        for entry in entries:
+            self._entries[entry.id] = entry
+            entry_keys = _index_keys(entry)
+            new_keys.extend((key, entry.id) for key in entry_keys)
+            for prefix in _short_prefixes(entry_keys):
+                ids = self._top.setdefault(prefix, [])
+                ids.append(entry.id)
+                ids.sort(key=lambda book_id: _rank(self._entries[book_id]))
+                del ids[SUGGEST_TOP_K:]
+        if len(new_keys) > _BULK_INSERT_KEYS:
+            # 정렬된 두 구간의 병합은 timsort가 선형 시간에 처리
+            self._keys.extend(sorted(new_keys))
+            self._keys.sort()
+        else:
+            for key in new_keys:
+                insort(self._keys, key)
+
+    def _remove_locked(self, book_id: int) -> None:
+        entry = self._entries.pop(book_id, None)
+        if entry is None:
+            return
+        entry_keys = _index_keys(entry)
+        for key in entry_keys:
+            index = bisect_left(self._keys, (key, book_id))
+            if index < len(self._keys) and self._keys[index] == (key, book_id):
+                del self._keys[index]
+        for prefix in _short_prefixes(entry_keys):
+            ids = self._top.get(prefix)
+            if not ids or book_id not in ids:
+                continue
+            if len(ids) < SUGGEST_TOP_K:
+                ids.remove(book_id)
+            else:
+                # 목록 밖의 다음 순위 도서를 알 수 없으므로 범위 전체에서 다시 계산
+                ids[:] = [e.id for e in self._scan_locked(prefix, SUGGEST_TOP_K)]
+            if not ids:
+                del self._top[prefix]
+
+
+# 워커 프로세스별 인덱스
+book_suggest_index = BookSuggestIndex()
@@ -0,0 +1,340 @@
+"""Order domain events module.
+
+주문 생성/취소 트랜잭션은 주문 행, 상태 전이, 장바구니 비우기만 기록하고, 판매량과
+도서 상세 캐시 같은 파생 데이터는 커밋 후 발행되는 도메인 이벤트(OrderCreated,
+OrderCancelled)로 요청 경로 밖에서 배치로 반영합니다.
+
+- inline: 발행한 요청 안에서 바로 처리 (테스트용)
+- queue: 워커 프로세스 내 큐에 쌓고 백그라운드 스레드가 배치로 처리. 반영에 실패한
+  배치는 큐에 되돌려 간격을 늘려 가며 재시도합니다. 프로세스가 비정상 종료되면 아직
+  처리하지 않은 이벤트는 유실됩니다.
+- redis: Redis Streams(events:order)에 추가하고 모든 워커가 하나의 소비자 그룹으로
+  나누어 처리. 반영 후 XACK하고, 종료된 워커(소비자 이름은 호스트-pid)가 받고 ACK하지
+  못한 항목은 ORDER_EVENT_CLAIM_IDLE_MS가 지나면 다른 워커가 XAUTOCLAIM으로 회수하므로
+  재시작해도 유실되지 않지만(at-least-once), 반영과 ACK 사이에 종료되면 해당 배치가
+  한 번 더 반영될 수 있습니다. XADD가 실패하면 해당 워커의 로컬 큐로 대체합니다.
+
+배치의 이벤트는 도서별 수량 합계로 모아 UPDATE 한 번으로 반영합니다.
+PURCHASE_COUNT_WRITE_BEHIND가 켜져 있으면 합계를 Redis에 누적하고 DB 반영은
+app.services.purchase_counter의 주기 작업에 맡깁니다.
+"""
+
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from redis.exceptions import ResponseError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.redis import (
+    ORDER_EVENT_CLAIM_IDLE_MS,
+    ORDER_EVENT_STREAM_MAXLEN,
+    RedisKeys,
+    get_sync_redis_client,
+)
+from app.repositories.book_repository import BookRepository
+from app.services.book_cache import BookDetailCache
+from app.services.purchase_counter import PurchaseCounter
+
+logger = logging.getLogger(__name__)
+
+# Redis 연결 실패/반영 실패 시 재시도 간격 (초)
+WORKER_RETRY_SECONDS = 5.0
+
+# 반영 실패 시 재시도 간격 상한 (초, WORKER_RETRY_SECONDS부터 두 배씩 증가)
+WORKER_MAX_RETRY_SECONDS = 60.0
+
+# 종료된 소비자의 미처리 항목 회수(XAUTOCLAIM) 주기 (초)
+CLAIM_INTERVAL_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class OrderCreated:
+    """An order was placed.
+
+    Attributes:
+        order_id: Order ID.
+        user_id: Ordering user ID.
+        quantities: Ordered quantity per book id.
+    """
+
+    order_id: int
+    user_id: int
+    quantities: Dict[int, int]
+
+
+@dataclass(frozen=True)
+class OrderCancelled:
+    """An order was cancelled (refunded).
+
+    Attributes:
+        order_id: Order ID.
+        user_id: Ordering user ID.
+        quantities: Cancelled quantity per book id.
+    """
+
+    order_id: int
+    user_id: int
+    quantities: Dict[int, int]
+
+
+OrderEvent = Union[OrderCreated, OrderCancelled]
+
+EVENT_TYPES = {cls.__name__: cls for cls in (OrderCreated, OrderCancelled)}
+
+
+def serialize_event(event: OrderEvent) -> Dict[str, str]:
+    """Encode an event as Redis stream entry fields."""
+    return {"type": type(event).__name__, "data": json.dumps(asdict(event))}
+
+
+def deserialize_event(fields: Dict[str, str]) -> OrderEvent:
+    """Decode Redis stream entry fields back into an event."""
+    data = json.loads(fields["data"])
+    data["quantities"] = {int(k): v for k, v in data["quantities"].items()}
+    return EVENT_TYPES[fields["type"]](**data)
+
+
+def apply_order_events(db: Session, events: Iterable[OrderEvent]) -> None:
+    """Apply a batch of order events to the derived book statistics.
+
+    Quantities are summed per book so the whole batch is one UPDATE, or one
+    Redis pipeline in write-behind mode (falling back to the UPDATE if Redis
+    is unavailable).
+
+    Args:
+        db: Session used (and committed) for the update.
+        events: Order events to apply.
+    """
+    deltas: Dict[int, int] = {}
+    for event in events:
+        sign = 1 if isinstance(event, OrderCreated) else -1
+        for book_id, quantity in event.quantities.items():
+            deltas[book_id] = deltas.get(book_id, 0) + sign * quantity
+    deltas = {book_id: delta for book_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    if settings.PURCHASE_COUNT_WRITE_BEHIND:
+        try:
+            # 조회 시 미반영 수량을 더하므로 도서 캐시 무효화 불필요
+            PurchaseCounter.add(deltas)
+            return
+        except Exception as e:
+            logger.warning(f"Redis purchase counter write error: {e}")
+    BookRepository(db).increment_purchase_counts(deltas, commit=True)
+    BookDetailCache.invalidate(deltas)
+
+
+class OrderEventBus:
+    """Dispatches order events to apply_order_events off the request path.
+
+    Attributes:
+        backend: Dispatch backend (inline, queue or redis).
+        session_factory: Creates the sessions used to apply events.
+        batch_size: Max events applied per batch.
+        flush_seconds: Max wait for more events before applying a batch.
+    """
+
+    def __init__(
+        self,
+        backend: str,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: int = 500,
+        flush_seconds: float = 1.0,
+    ):
+        self.backend = backend
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self._queue: "queue.Queue[OrderEvent]" = queue.Queue()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def publish(self, event: OrderEvent) -> None:
+        """Publish an event of a committed order change."""
+        if self.backend == "inline":
+            self._apply([event])
+            return
+        if self.backend == "redis":
+            try:
+                get_sync_redis_client().xadd(
+                    RedisKeys.ORDER_EVENT_STREAM,
+                    serialize_event(event),
+                    maxlen=ORDER_EVENT_STREAM_MAXLEN,
+                    approximate=True,
+                )
+                return
+            except Exception as e:
+                logger.warning(f"Redis order event publish error: {e}")
+        self._queue.put(event)
+
+    def start(self) -> None:
+        """Start the background worker (no-op for the inline backend)."""
+        if self.backend == "inline" or self._worker is not None:
+            return
+        self._stop.clear()
+        target = (
+            self._consume_stream if self.backend == "redis" else self._consume_queue
+        )
+        self._worker = threading.Thread(
+            target=target, name="order-event-worker", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Stop the worker and apply the events left in the local queue."""
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            self._stop.set()
+            worker.join(timeout=WORKER_RETRY_SECONDS)
+        # 종료 시에는 한 번만 시도 (실패한 배치는 _apply가 로그로 남김)
+        while batch := self._take_local(timeout=0):
+            self._apply(batch)
+
+    def _apply(self, events: List[OrderEvent]) -> bool:
+        db = self.session_factory()
+        try:
+            apply_order_events(db, events)
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Applying {len(events)} order events failed: {e}")
+            return False
+        finally:
+            db.close()
+
+    def _apply_or_requeue(self, events: List[OrderEvent]) -> bool:
+        """Apply locally queued events, putting them back in the queue on failure."""
+        if self._apply(events):
+            return True
+        for event in events:
+            self._queue.put(event)
+        return False
+
+    def _take_local(self, timeout: float) -> List[OrderEvent]:
+        """Take up to batch_size queued events, waiting up to flush_seconds for more."""
+        batch: List[OrderEvent] = []
+        deadline = None
+        while len(batch) < self.batch_size:
+            if deadline is None:
+                wait = timeout
+            else:
+                wait = max(0.0, deadline - time.monotonic())
+            try:
+                event = (
+                    self._queue.get(timeout=wait) if wait else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            batch.append(event)
+            if deadline is None and timeout:
+                deadline = time.monotonic() + self.flush_seconds
+        return batch
+
+    def _consume_queue(self) -> None:
+        retry_seconds = WORKER_RETRY_SECONDS
+        while not self._stop.is_set():
+            batch = self._take_local(timeout=self.flush_seconds)
+            if not batch:
+                continue
+            if self._apply_or_requeue(batch):
+                retry_seconds = WORKER_RETRY_SECONDS
+            else:
+                self._stop.wait(retry_seconds)
+                retry_seconds = min(retry_seconds * 2, WORKER_MAX_RETRY_SECONDS)
+
+    def _consume_stream(self) -> None:
+        stream, group = RedisKeys.ORDER_EVENT_STREAM, RedisKeys.ORDER_EVENT_GROUP
+        consumer = f"{socket.gethostname()}-{os.getpid()}"
+        while not self._stop.is_set():
+            # (재)연결 시 이전에 받고 ACK하지 못한 항목부터 처리
+            start_id = "0"
+            next_claim = 0.0
+            try:
+                client = get_sync_redis_client()
+                try:
+                    client.xgroup_create(stream, group, id="0", mkstream=True)
+                except ResponseError as e:
+                    if "BUSYGROUP" not in str(e):
+                        raise
+                while not self._stop.is_set():
+                    if time.monotonic() >= next_claim:
+                        if self._claim_stale(client, consumer):
+                            start_id = "0"
+                        next_claim = time.monotonic() + CLAIM_INTERVAL_SECONDS
+
+                    # XADD 실패로 로컬 큐에 남은 이벤트
+                    local = self._take_local(timeout=0)
+                    if local and not self._apply_or_requeue(local):
+                        self._stop.wait(WORKER_RETRY_SECONDS)
+                        continue
+
+                    response = client.xreadgroup(
+                        group, consumer, {stream: start_id}, count=self.batch_size
+                    )
+                    entries = response[0][1] if response else []
+                    if not entries:
+                        if start_id == "0":
+                            start_id = ">"
+                        else:
+                            self._stop.wait(self.flush_seconds)
+                        continue
+
+                    events = []
+                    for entry_id, fields in entries:
+                        try:
+                            events.append(deserialize_event(fields))
+                        except (KeyError, TypeError, ValueError) as e:
+                            logger.error(f"Malformed order event {entry_id}: {e}")
+                    if not self._apply(events):
+                        self._stop.wait(WORKER_RETRY_SECONDS)
+                        start_id = "0"
+                        continue
+                    client.xack(stream, group, *[entry_id for entry_id, _ in entries])
+            except Exception as e:
+                logger.warning(f"Redis order event worker error: {e}")
+                self._stop.wait(WORKER_RETRY_SECONDS)
+
+    def _claim_stale(self, client, consumer: str) -> bool:
+        """Take over entries other consumers read but did not ack in time.
+
+        Entries of a crashed or restarted worker (whose consumer name had
+        another pid) stay pending in the group; once idle for
+        ORDER_EVENT_CLAIM_IDLE_MS they are moved to this consumer's pending
+        list and re-read from "0".
+
+        Returns:
+            bool: True if any entry was claimed.
+        """
+        stream, group = RedisKeys.ORDER_EVENT_STREAM, RedisKeys.ORDER_EVENT_GROUP
+        claimed = False
+        start = "0-0"
+        while True:
+            response = client.xautoclaim(
+                stream,
+                group,
+                consumer,
+                min_idle_time=ORDER_EVENT_CLAIM_IDLE_MS,
+                start_id=start,
+                count=self.batch_size,
+                justid=True,
+            )
+            start, entry_ids = response[0], response[1]
+            claimed = claimed or bool(entry_ids)
+            if start == "0-0":
+                return claimed
+
+
+order_event_bus = OrderEventBus(
+    backend=settings.ORDER_EVENT_BACKEND,
+    batch_size=settings.ORDER_EVENT_BATCH_SIZE,
+    flush_seconds=settings.ORDER_EVENT_FLUSH_SECONDS,
+)
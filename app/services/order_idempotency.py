@@ -0,0 +1,110 @@
+"""Order idempotency module.
+
+타임아웃 후 결제를 재시도하는 클라이언트가 같은 Idempotency-Key 헤더를 보내면
+주문 생성 트랜잭션을 다시 실행하지 않고 처음 요청의 결과를 돌려줍니다. 키별 상태는
+Redis(idempotency:order:{user_id}:{key})에 저장합니다.
+
+1. SET NX로 "처리 중" 레코드를 선점한 요청만 주문을 생성 (IDEMPOTENCY_LOCK_TTL)
+2. 성공하면 응답(OrderResponse)을 완료 레코드로 덮어써 IDEMPOTENCY_RESULT_TTL 동안 보관
+3. 같은 키의 재요청은 완료 응답을 즉시 반환, 아직 처리 중이면 409
+4. 같은 키로 다른 요청 본문을 보내면 422
+
+주문 생성이 실패하면 레코드를 지워 같은 키로 다시 시도할 수 있게 합니다.
+Redis 장애 시에는 키 없이 처리합니다 (재시도는 비워진 장바구니로 인해 실패).
+"""
+
+import hashlib
+import json
+import logging
+from typing import Callable
+
+from pydantic import BaseModel
+
+from app.core.redis import (
+    IDEMPOTENCY_LOCK_TTL,
+    IDEMPOTENCY_RESULT_TTL,
+    RedisKeys,
+    get_sync_redis_client,
+)
+from app.exceptions.order_exceptions import (
+    IdempotencyKeyReusedException,
+    OrderRequestInProgressException,
+)
+from app.schemas.order import OrderResponse
+
+logger = logging.getLogger(__name__)
+
+
+class OrderIdempotency:
+    """Runs order creation at most once per (user, Idempotency-Key)."""
+
+    @staticmethod
+    def run(
+        user_id: int,
+        key: str,
+        request: BaseModel,
+        create: Callable[[], OrderResponse],
+    ) -> OrderResponse:
+        """Create the order once, replaying the stored result for retries.
+
+        Args:
+            user_id: ID of the ordering user.
+            key: Idempotency-Key header value.
+            request: Request body (retries must send the same body).
+            create: Creates the order.
+
+        Returns:
+            OrderResponse: Created order, or the stored result of the first request.
+
+        Raises:
+            OrderRequestInProgressException: If the first request is still running.
+            IdempotencyKeyReusedException: If the key was used with another body.
+        """
+        cache_key = RedisKeys.order_idempotency_key(user_id, key)
+        fingerprint = hashlib.sha1(request.model_dump_json().encode()).hexdigest()
+        client = get_sync_redis_client()
+        try:
+            acquired = client.set(
+                cache_key,
+                json.dumps({"fingerprint": fingerprint}),
+                ex=IDEMPOTENCY_LOCK_TTL,
+                nx=True,
+            )
+            payload = None if acquired else client.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Redis idempotency read error: {e}")
+            return create()
+
+        if not acquired:
+            record = json.loads(payload) if payload else {}
+            if record and record["fingerprint"] != fingerprint:
+                raise IdempotencyKeyReusedException()
+            if "response" not in record:
+                # 처리 중 (또는 실패한 첫 요청의 레코드가 방금 삭제됨)
+                raise OrderRequestInProgressException()
+            return OrderResponse.model_validate(record["response"])
+
+        try:
+            response = create()
+        except Exception:
+            try:
+                client.delete(cache_key)
+            except Exception as e:
+                logger.warning(f"Redis idempotency release error: {e}")
+            raise
+
+        try:
+            client.set(
+                cache_key,
+                json.dumps(
+                    {
+                        "fingerprint": fingerprint,
+                        "response": response.model_dump(mode="json"),
+                    }
+                ),
+                ex=IDEMPOTENCY_RESULT_TTL,
+            )
+        except Exception as e:
+            # 처리 중 레코드는 IDEMPOTENCY_LOCK_TTL 후 만료되어 재시도가 다시 실행됨
+            logger.warning(f"Redis idempotency write error: {e}")
+        return response
@@ -4,8 +4,9 @@ This module handles all order-related business logic with proper
 transaction management using the Unit of Work pattern.
 """
 
+from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -15,8 +16,10 @@ from app.exceptions.order_exceptions import (
     OrderCancelNotAllowedException,
     OrderNotFoundException,
 )
-from app.repositories.book_repository import BookRepository
+from app.exceptions.pagination_exceptions import InvalidCursorException
+from app.models.order import Order
 from app.repositories.cart_repository import CartRepository
+from app.repositories.count_strategy import CountStrategy
 from app.repositories.order_repository import OrderItemRepository, OrderRepository
 from app.schemas.order import (
     OrderCreate,
@@ -24,6 +27,9 @@ from app.schemas.order import (
     OrderListResponse,
     OrderResponse,
 )
+from app.services.order_events import OrderCancelled, OrderCreated, order_event_bus
+from app.services.order_idempotency import OrderIdempotency
+from app.utils.cursor import decode_cursor, encode_cursor
 
 
 class OrderService:
@@ -31,7 +37,8 @@ class OrderService:
 
     This service manages transactions to ensure atomicity across
     multiple repository operations (order creation, item addition,
-    book stats update, cart clearing).
+    cart clearing). Derived book statistics are updated from the order
+    events published after each commit.
     """
 
     def __init__(self, db: Session):
@@ -39,30 +46,54 @@ class OrderService:
         self.order_repo = OrderRepository(db)
         self.order_item_repo = OrderItemRepository(db)
         self.cart_repo = CartRepository(db)
-        self.book_repo = BookRepository(db)
 
-    def create_order(self, user_id: int, order_data: OrderCreate) -> OrderResponse:
+    def create_order(
+        self,
+        user_id: int,
+        order_data: OrderCreate,
+        idempotency_key: Optional[str] = None,
+    ) -> OrderResponse:
         """Create a new order from cart items.
 
         This method ensures atomicity - all operations succeed together
         or fail together (rollback on any error).
 
-        Transaction includes:
+        Transaction includes (a fixed number of statements regardless of
+        cart size):
         1. Create order record
-        2. Create order items for each cart item
-        3. Update book purchase counts
-        4. Clear cart items
+        2. Bulk insert the order items
+        3. Clear cart items
+
+        Book purchase counts are updated after the commit from the published
+        OrderCreated event (see app.services.order_events).
+
+        With ``idempotency_key``, the order is created at most once per key and
+        retries get the stored response of the first request.
 
         Args:
             user_id: ID of the user creating the order.
             order_data: Order creation data with optional cart_item_ids.
+            idempotency_key: Client-supplied Idempotency-Key header value.
 
         Returns:
             OrderResponse: Created order with items.
 
         Raises:
             CartEmptyException: If no items to order.
+            OrderRequestInProgressException: If a request with the same key is
+                still being processed.
+            IdempotencyKeyReusedException: If the key was used with another body.
         """
+        if idempotency_key:
+            return OrderIdempotency.run(
+                user_id,
+                idempotency_key,
+                order_data,
+                lambda: self._create_order(user_id, order_data),
+            )
+        return self._create_order(user_id, order_data)
+
+    def _create_order(self, user_id: int, order_data: OrderCreate) -> OrderResponse:
         # 장바구니 아이템 조회
         if order_data.cart_item_ids:
             cart_items = self.cart_repo.get_by_ids(order_data.cart_item_ids, user_id)
@@ -85,59 +116,58 @@ class OrderService:
                     {"user_id": user_id, "total_amount": total_amount, "status": "CREATED"}
                 )
 
-                # 2. 주문 아이템 생성 (commit=False)
-                order_items = []
-                for cart in cart_items:
-                    item_total = cart.book.price * cart.quantity
-                    order_item = self.order_repo.add_item(
+                # 2. 주문 아이템 일괄 생성 (INSERT 1회, commit=False)
+                self.order_repo.bulk_add_items(
+                    [
                         {
                             "order_id": order.id,
                             "book_id": cart.book_id,
                             "price": cart.book.price,
-                            "total_amount": item_total,
+                            "total_amount": cart.book.price * cart.quantity,
                             "quantity": cart.quantity,
                         }
-                    )
-                    order_items.append(order_item)
-
-                    # 3. 책 판매량 증가 (commit=False)
-                    book = self.book_repo.get_by_id(cart.book_id)
-                    if book:
-                        self.book_repo.update_stats(
-                            book, purchase_count=book.purchase_count + cart.quantity
-                        )
+                        for cart in cart_items
+                    ]
+                )
 
-                # 4. 장바구니 비우기 (commit=False)
+                # 3. 장바구니 비우기 (DELETE 1회, commit=False)
+                # 같은 장바구니로 중복 주문되지 않도록 주문과 함께 커밋
                 self.cart_repo.delete_multiple(cart_items)
 
                 # 모든 작업 성공 시 한 번에 커밋
                 uow.commit()
 
-                # refresh를 위해 다시 조회
-                self.db.refresh(order)
-                for item in order_items:
-                    self.db.refresh(item)
-
             except Exception:
                 # 예외 발생 시 자동으로 롤백됨 (UnitOfWork.__exit__)
                 raise
 
-        return self._build_order_response(order, order_items)
+        # 주문과 아이템(도서 포함)을 한 번의 조회로 다시 읽음
+        order = self.order_repo.get_by_id(order.id)
+
+        CountStrategy.invalidate(Order.__tablename__)
+        # 판매량 증가, 도서 상세 캐시 무효화는 이벤트 처리기에서 배치로 반영
+        order_event_bus.publish(
+            OrderCreated(order.id, user_id, self._item_quantities(order.items))
+        )
+        return self._build_order_response(order, order.items)
 
     def get_my_orders(
-        self, user_id: int, page: int = 1, size: int = 10
+        self,
+        user_id: int,
+        page: int = 1,
+        size: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> OrderListResponse:
-        """Get orders for a specific user with pagination."""
-        skip = (page - 1) * size
-        orders, total = self.order_repo.get_by_user_id(user_id, skip=skip, limit=size)
-
-        order_responses = []
-        for order in orders:
-            order_responses.append(self._build_order_response(order, order.items))
-
-        return OrderListResponse(
-            orders=order_responses, total=total, page=page, size=size
+        """Get orders for a specific user with offset or keyset (cursor) pagination."""
+        orders, total = self.order_repo.get_by_user_id(
+            user_id,
+            skip=(page - 1) * size,
+            limit=size,
+            include_total=include_total,
+            after=self._decode_cursor(cursor) if cursor else None,
         )
+        return self._build_order_list_response(orders, total, page, size)
 
     def get_order(self, user_id: int, order_id: int) -> OrderResponse:
         """Get a specific order by ID."""
@@ -150,8 +180,9 @@ class OrderService:
     def cancel_order(self, user_id: int, order_id: int) -> OrderResponse:
         """Cancel an order.
 
-        This method ensures atomicity - status update and purchase count
-        rollback happen together or not at all.
+        The status changes with a conditional UPDATE so that an order is
+        cancelled only once; the purchase counts are restored from the
+        published OrderCancelled event.
 
         Args:
             user_id: ID of the user canceling the order.
@@ -174,16 +205,9 @@ class OrderService:
 
         with UnitOfWork(self.db) as uow:
             try:
-                # 판매량 감소
-                for item in order.items:
-                    book = self.book_repo.get_by_id(item.book_id)
-                    if book:
-                        self.book_repo.update_stats(
-                            book, purchase_count=max(0, book.purchase_count - item.quantity)
-                        )
-
-                # 주문 상태 변경
-                order = self.order_repo.update_status(order, "REFUND")
+                # 주문 상태 변경 (동시 취소 시 한 요청만 성공)
+                if not self.order_repo.transition_status(order, "CREATED", "REFUND"):
+                    raise OrderCancelNotAllowedException()
 
                 uow.commit()
                 self.db.refresh(order)
@@ -191,23 +215,67 @@ class OrderService:
             except Exception:
                 raise
 
+        CountStrategy.invalidate(Order.__tablename__)
+        # 판매량 감소는 이벤트 처리기에서 배치로 반영
+        order_event_bus.publish(
+            OrderCancelled(order.id, user_id, self._item_quantities(order.items))
+        )
         return self._build_order_response(order, order.items)
 
     def get_all_orders(
-        self, page: int = 1, size: int = 10, status: Optional[str] = None
+        self,
+        page: int = 1,
+        size: int = 10,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> OrderListResponse:
-        """Get all orders with pagination (admin only)."""
-        skip = (page - 1) * size
-        orders, total = self.order_repo.get_all(skip=skip, limit=size, status=status)
+        """Get all orders with offset or keyset (cursor) pagination (admin only).
 
-        order_responses = []
-        for order in orders:
-            order_responses.append(self._build_order_response(order, order.items))
+        With ``cursor``, the page is fetched by seeking past the last order of
+        the previous page on (created_at, id), so deep pages cost the same as
+        the first one.
+        """
+        orders, total = self.order_repo.get_all(
+            skip=(page - 1) * size,
+            limit=size,
+            status=status,
+            include_total=include_total,
+            after=self._decode_cursor(cursor) if cursor else None,
+        )
+        return self._build_order_list_response(orders, total, page, size)
 
+    def _build_order_list_response(
+        self, orders: List[Order], total: Optional[int], page: int, size: int
+    ) -> OrderListResponse:
+        next_cursor = None
+        if len(orders) == size:
+            last = orders[-1]
+            next_cursor = encode_cursor(
+                {"key": last.created_at.isoformat(), "id": last.id}
+            )
         return OrderListResponse(
-            orders=order_responses, total=total, page=page, size=size
+            orders=[self._build_order_response(o, o.items) for o in orders],
+            total=total,
+            page=page,
+            size=size,
+            next_cursor=next_cursor,
         )
 
+    def _decode_cursor(self, cursor: str) -> Tuple[datetime, int]:
+        payload = decode_cursor(cursor)
+        try:
+            return datetime.fromisoformat(payload["key"]), int(payload["id"])
+        except (KeyError, TypeError, ValueError):
+            raise InvalidCursorException()
+
+    def _item_quantities(self, items) -> dict[int, int]:
+        """Sum ordered quantities per book id."""
+        quantities: dict[int, int] = {}
+        for item in items:
+            quantities[item.book_id] = quantities.get(item.book_id, 0) + item.quantity
+        return quantities
+
     def _build_order_response(self, order, items) -> OrderResponse:
         """Build OrderResponse from order and items."""
         item_responses = []
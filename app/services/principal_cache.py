@@ -0,0 +1,123 @@
+"""Principal cache module.
+
+인증된 요청마다 사용자 테이블을 조회하지 않도록 인증 주체(id/role/is_active)를
+read-through 방식으로 캐싱합니다.
+
+1. 워커 프로세스별 LRU (짧은 TTL) - 적중 시 Redis/DB 접근 없음
+2. Redis (principal:{id}) - 워커 간 공유
+
+사용자 권한이나 활성 상태를 변경하는 서비스(UserService, SellerService)는 커밋 후
+invalidate()를 호출해야 합니다. 다른 워커의 로컬 캐시에는 최대
+PRINCIPAL_CACHE_LOCAL_TTL 동안 이전 값이 남을 수 있습니다.
+
+캐시 미스 시 DB를 읽는 동안 invalidate()가 실행되면 이전 값이 Redis에 다시 기록될 수
+있으므로, 캐시 값에 사용자별 버전(principal:version:{id})을 함께 저장하고
+invalidate()가 버전을 올립니다. 조회 시 버전이 다른 값은 미스로 처리합니다.
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from typing import Callable, Optional
+
+from app.core.config import settings
+from app.core.redis import PRINCIPAL_CACHE_TTL, RedisKeys, get_sync_redis_client
+from app.utils.lru_cache import LocalLRUCache
+
+logger = logging.getLogger(__name__)
+
+_local_cache = LocalLRUCache(
+    maxsize=settings.PRINCIPAL_CACHE_LOCAL_MAXSIZE,
+    ttl=settings.PRINCIPAL_CACHE_LOCAL_TTL,
+)
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated user as seen by authorization checks.
+
+    Attributes:
+        id: User ID.
+        role: User role (user, admin, seller).
+        is_active: Account activation status.
+    """
+
+    id: int
+    role: str
+    is_active: bool
+
+
+class PrincipalCache:
+    """Read-through cache of authenticated principals keyed by user id."""
+
+    @staticmethod
+    def get_or_load(
+        user_id: int, loader: Callable[[int], Optional[Principal]]
+    ) -> Optional[Principal]:
+        """Return the cached principal, loading and caching it on a miss.
+
+        Args:
+            user_id: User ID.
+            loader: Loads the principal from the database (None if missing).
+
+        Returns:
+            Optional[Principal]: Principal, or None if the user does not exist.
+        """
+        cached = _local_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        cache_key = RedisKeys.principal_key(user_id)
+        version = None
+        try:
+            pipe = get_sync_redis_client().pipeline(transaction=False)
+            pipe.get(RedisKeys.principal_version_key(user_id))
+            pipe.get(cache_key)
+            version, payload = pipe.execute()
+            version = version or "0"
+            if payload is not None:
+                data = json.loads(payload)
+                # 이전 버전으로 기록된 값은 invalidate() 이전에 읽은 DB 값
+                if data.pop("version", None) == version:
+                    principal = Principal(**data)
+                    _local_cache.set(user_id, principal)
+                    return principal
+        except Exception as e:
+            logger.warning(f"Redis principal cache read error: {e}")
+
+        principal = loader(user_id)
+        if principal is None:
+            return None
+
+        if version is not None:
+            try:
+                get_sync_redis_client().set(
+                    cache_key,
+                    json.dumps({**asdict(principal), "version": version}),
+                    ex=PRINCIPAL_CACHE_TTL,
+                )
+            except Exception as e:
+                logger.warning(f"Redis principal cache write error: {e}")
+        _local_cache.set(user_id, principal)
+        return principal
+
+    @staticmethod
+    def invalidate(user_id: int) -> None:
+        """Drop the cached principal after a committed role/status change.
+
+        Args:
+            user_id: ID of the changed user.
+        """
+        _local_cache.delete(user_id)
+        try:
+            pipe = get_sync_redis_client().pipeline(transaction=False)
+            pipe.incr(RedisKeys.principal_version_key(user_id))
+            pipe.delete(RedisKeys.principal_key(user_id))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis principal cache invalidation error: {e}")
+
+    @staticmethod
+    def clear_local() -> None:
+        """Clear this worker's in-process cache."""
+        _local_cache.clear()
@@ -0,0 +1,175 @@
+"""Write-behind purchase counter module.
+
+PURCHASE_COUNT_WRITE_BEHIND가 켜져 있으면 주문 이벤트의 판매량 증감을 도서 행에 바로
+UPDATE하지 않고 Redis 해시(purchase:pending)에 HINCRBY로 누적합니다. 인기 도서에
+주문이 몰려도 book 행 잠금 경합(동시 구매자, 판매자의 도서 수정)이 생기지 않습니다.
+
+1. 주기 작업(flush)이 누적 해시를 purchase:flushing으로 RENAME하고 배치 번호를
+   기록 (Lua 스크립트로 원자적으로 수행)
+2. 도서별 합계 UPDATE와 배치 반영 표시(purchaseCountBatch)를 한 트랜잭션으로 커밋한
+   뒤 해시 삭제
+3. 도서 조회 응답은 DB 값에 미반영 수량을 더해 반환. 두 해시는 MULTI로 한 시점에서
+   읽고, purchase:flushing은 해당 배치가 아직 DB에 반영되지 않았을 때만 더함
+
+반영이 중간에 실패하면 purchase:flushing이 남아 다음 주기에 다시 반영되며, 커밋과
+해시 삭제 사이에 중단된 배치는 반영 표시로 확인하여 다시 반영하지 않습니다.
+반영 직후 다른 워커의 로컬 도서 캐시에는 BOOK_CACHE_LOCAL_TTL 동안 이전 값이 남을
+수 있습니다. 반영 작업 잠금은 임의 토큰으로 걸고 토큰이 일치할 때만 해제하므로,
+PURCHASE_COUNT_FLUSH_LOCK_TTL을 넘긴 작업이 다른 워커의 잠금을 지우지 않습니다
+(TTL은 반영 작업 시간보다 충분히 길어야 합니다).
+"""
+
+import logging
+import secrets
+from typing import Dict, Iterable
+
+from sqlalchemy.orm import Session
+
+from app.core.redis import (
+    PURCHASE_COUNT_FLUSH_LOCK_TTL,
+    RedisKeys,
+    get_sync_redis_client,
+)
+from app.repositories.book_repository import BookRepository
+from app.services.book_cache import BookDetailCache
+
+logger = logging.getLogger(__name__)
+
+# 자신이 건 잠금(토큰 일치)일 때만 삭제
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# purchase:flushing 해시에서 배치 번호를 담는 필드 (도서 id와 겹치지 않음)
+BATCH_FIELD = "batch"
+
+# 누적 해시가 있으면 반영 중 해시로 옮기고 새 배치 번호를 기록 (없으면 0)
+FREEZE_BATCH_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 0 then
+    return 0
+end
+local batch = redis.call('incr', KEYS[3])
+redis.call('rename', KEYS[1], KEYS[2])
+redis.call('hset', KEYS[2], ARGV[1], batch)
+return batch
+"""
+
+
+class PurchaseCounter:
+    """Purchase count deltas buffered in Redis and flushed in batches."""
+
+    @staticmethod
+    def add(deltas: Dict[int, int]) -> None:
+        """Buffer purchase count deltas.
+
+        Args:
+            deltas: Quantity to add per book id (negative for cancellations).
+
+        Raises:
+            redis.RedisError: If Redis is unavailable (caller applies directly).
+        """
+        pipe = get_sync_redis_client().pipeline(transaction=False)
+        for book_id, delta in deltas.items():
+            pipe.hincrby(RedisKeys.PURCHASE_COUNT_PENDING, book_id, delta)
+        pipe.execute()
+
+    @staticmethod
+    def pending(db: Session, book_ids: Iterable[int]) -> Dict[int, int]:
+        """Return the buffered deltas not yet visible in the database.
+
+        Both hashes are read in one MULTI, so a concurrent RENAME is seen either
+        entirely before or after. The flushing batch is skipped once its
+        applied marker is in the database.
+
+        Args:
+            db: Session used to check the applied batch marker.
+            book_ids: Book IDs to look up.
+
+        Returns:
+            Dict[int, int]: Non-zero delta per book id ({} if Redis is unavailable).
+        """
+        book_ids = list(book_ids)
+        if not book_ids:
+            return {}
+        try:
+            pipe = get_sync_redis_client().pipeline(transaction=True)
+            pipe.hmget(RedisKeys.PURCHASE_COUNT_PENDING, book_ids)
+            pipe.hmget(RedisKeys.PURCHASE_COUNT_FLUSHING, [*book_ids, BATCH_FIELD])
+            pending, flushing = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis purchase counter read error: {e}")
+            return {}
+        batch = flushing.pop()
+        if (
+            batch is not None
+            and any(flushing)
+            and BookRepository(db).purchase_batch_applied(int(batch))
+        ):
+            # 커밋은 끝났고 해시만 아직 남은 배치 (DB 값에 이미 포함)
+            flushing = [None] * len(book_ids)
+        deltas = {
+            book_id: int(a or 0) + int(b or 0)
+            for book_id, a, b in zip(book_ids, pending, flushing)
+        }
+        return {book_id: delta for book_id, delta in deltas.items() if delta}
+
+    @staticmethod
+    def flush(db: Session) -> int:
+        """Apply the buffered deltas to the database in one UPDATE.
+
+        Only one worker flushes at a time (purchase:flush:lock).
+
+        Args:
+            db: Session used (and committed) for the update.
+
+        Returns:
+            int: Number of books updated.
+        """
+        client = get_sync_redis_client()
+        token = secrets.token_hex(16)
+        if not client.set(
+            RedisKeys.PURCHASE_COUNT_FLUSH_LOCK,
+            token,
+            ex=PURCHASE_COUNT_FLUSH_LOCK_TTL,
+            nx=True,
+        ):
+            return 0
+        try:
+            # 이전 반영이 중단되어 남은 항목이 있으면 그것부터 반영
+            if not client.exists(RedisKeys.PURCHASE_COUNT_FLUSHING):
+                if not client.eval(
+                    FREEZE_BATCH_SCRIPT,
+                    3,
+                    RedisKeys.PURCHASE_COUNT_PENDING,
+                    RedisKeys.PURCHASE_COUNT_FLUSHING,
+                    RedisKeys.PURCHASE_COUNT_BATCH_SEQ,
+                    BATCH_FIELD,
+                ):
+                    return 0  # 누적된 항목 없음
+            fields = client.hgetall(RedisKeys.PURCHASE_COUNT_FLUSHING)
+            batch = fields.pop(BATCH_FIELD, None)
+            batch_id = int(batch) if batch is not None else None
+            deltas = {
+                int(book_id): int(delta)
+                for book_id, delta in fields.items()
+                if int(delta)
+            }
+            book_repo = BookRepository(db)
+            # 커밋 후 해시 삭제 전에 중단된 배치는 다시 반영하지 않음
+            applied = batch_id is not None and book_repo.purchase_batch_applied(
+                batch_id
+            )
+            if deltas and not applied:
+                book_repo.increment_purchase_counts(
+                    deltas, batch_id=batch_id, commit=True
+                )
+            client.delete(RedisKeys.PURCHASE_COUNT_FLUSHING)
+            BookDetailCache.invalidate(deltas)
+            return 0 if applied else len(deltas)
+        finally:
+            client.eval(
+                RELEASE_LOCK_SCRIPT, 1, RedisKeys.PURCHASE_COUNT_FLUSH_LOCK, token
+            )
@@ -11,6 +11,7 @@ from app.repositories.book_repository import BookRepository
 from app.repositories.order_repository import OrderItemRepository
 from app.repositories.review_repository import ReviewRepository
 from app.schemas.review import ReviewCreate, ReviewListResponse, ReviewResponse, ReviewUpdate
+from app.services.book_cache import BookDetailCache
 
 
 class ReviewService:
@@ -115,10 +116,9 @@ class ReviewService:
 
     def _update_book_rating(self, book_id: int):
         """도서 평점 및 리뷰 수 업데이트"""
-        avg_rating, count = self.review_repo.get_average_rating(book_id)
-        book = self.book_repo.get_by_id(book_id)
-        # commit=True를 명시하여 DB에 반영
-        self.book_repo.update_stats(book, rating=avg_rating, review_count=count, commit=True)
+        # 평균/개수를 UPDATE 안에서 계산하여 동시 리뷰 작성 시에도 최신 값 유지
+        self.book_repo.refresh_review_stats(book_id, commit=True)
+        BookDetailCache.invalidate([book_id])
 
     def _build_review_response(self, review) -> ReviewResponse:
         return ReviewResponse(
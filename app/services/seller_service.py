@@ -7,6 +7,7 @@ from app.exceptions.seller_exceptions import (
 from app.repositories.seller_repository import SellerRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.seller import SellerCreate, SellerResponse, SellerUpdate
+from app.services.principal_cache import PrincipalCache
 
 
 class SellerService:
@@ -39,6 +40,7 @@ class SellerService:
         # 사용자 역할 변경
         user = self.user_repo.get_by_id(user_id)
         self.user_repo.update_role(user, "seller")
+        PrincipalCache.invalidate(user_id)
 
         return seller
 
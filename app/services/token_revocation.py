@@ -0,0 +1,154 @@
+"""Access token revocation module.
+
+로그아웃 등으로 폐기된 토큰의 jti를 Redis(revoked:jti:{jti})에 토큰 만료 시각까지
+보관합니다. 매 요청마다 Redis를 조회하지 않도록 워커별 Bloom filter에 폐기 목록을
+복제하고, Bloom filter에 (아마도) 포함된 경우에만 Redis로 확인합니다.
+
+1. 폐기 시 Redis 키 저장 + 채널(revoked:channel) 발행
+2. 각 워커의 구독 스레드가 발행된 jti를 Bloom filter에 추가
+3. 주기 작업이 Redis 키로 Bloom filter를 재구축 (만료 항목 제거, 누락 보정)
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from app.core.config import settings
+from app.core.redis import RedisKeys, get_sync_redis_client
+from app.exceptions.server_exceptions import ServiceUnavailableException
+from app.utils.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+# 구독 연결 실패 시 재시도 간격 (초)
+LISTENER_RETRY_SECONDS = 5.0
+
+
+class TokenRevocationList:
+    """Revoked token IDs in Redis, mirrored into a per-worker Bloom filter."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._bloom = BloomFilter(capacity)
+        self._next_bloom: Optional[BloomFilter] = None  # 재구축 중인 필터
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._listener: Optional[threading.Thread] = None
+
+    def revoke(self, jti: str, expires_at: float) -> None:
+        """Revoke a token until its expiry and notify the other workers.
+
+        Args:
+            jti: Token ID claim.
+            expires_at: Token ``exp`` claim (Unix time).
+
+        Raises:
+            ServiceUnavailableException: If the revocation cannot be stored.
+        """
+        ttl = int(expires_at - time.time()) + 1
+        if ttl <= 0:
+            return  # 이미 만료된 토큰
+
+        client = get_sync_redis_client()
+        try:
+            client.set(RedisKeys.revoked_token_key(jti), "1", ex=ttl)
+        except Exception as e:
+            logger.error(f"Redis revocation write error: {e}")
+            raise ServiceUnavailableException("Could not revoke the token")
+        self._add(jti)
+        try:
+            client.publish(RedisKeys.REVOKED_TOKEN_CHANNEL, jti)
+        except Exception as e:
+            # 다른 워커는 다음 재구축 시 반영
+            logger.warning(f"Redis revocation publish error: {e}")
+
+    def is_revoked(self, jti: str) -> bool:
+        """Return whether a token has been revoked.
+
+        Only probable hits of the Bloom filter are confirmed in Redis. If Redis
+        is unavailable, a probable hit is treated as revoked.
+        """
+        if jti not in self._bloom:
+            return False
+        try:
+            return bool(
+                get_sync_redis_client().exists(RedisKeys.revoked_token_key(jti))
+            )
+        except Exception as e:
+            logger.warning(f"Redis revocation check error: {e}")
+            return True
+
+    def rebuild(self) -> None:
+        """Rebuild the Bloom filter from the revoked token keys in Redis."""
+        bloom = BloomFilter(self.capacity)
+        with self._lock:
+            self._next_bloom = bloom  # 재구축 중 추가되는 jti도 함께 기록
+        prefix_length = len(RedisKeys.revoked_token_key(""))
+        try:
+            for key in get_sync_redis_client().scan_iter(
+                match=RedisKeys.REVOKED_TOKEN_PATTERN, count=1000
+            ):
+                bloom.add(key[prefix_length:])
+        except Exception:
+            with self._lock:
+                self._next_bloom = None
+            raise
+        with self._lock:
+            self._bloom, self._next_bloom = bloom, None
+        logger.info(f"Token revocation filter rebuilt: {len(bloom)} tokens")
+
+    def start_listener(self) -> None:
+        """Start the pub/sub thread that mirrors revocations of other workers."""
+        if self._listener is not None:
+            return
+        self._stop.clear()
+        self._listener = threading.Thread(
+            target=self._listen, name="token-revocation-listener", daemon=True
+        )
+        self._listener.start()
+
+    def stop_listener(self) -> None:
+        """Stop the pub/sub thread."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            self._stop.set()
+            listener.join(timeout=LISTENER_RETRY_SECONDS)
+
+    def clear_local(self) -> None:
+        """Clear this worker's Bloom filter."""
+        with self._lock:
+            self._bloom = BloomFilter(self.capacity)
+
+    def _add(self, jti: str) -> None:
+        with self._lock:
+            self._bloom.add(jti)
+            if self._next_bloom is not None:
+                self._next_bloom.add(jti)
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = get_sync_redis_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(RedisKeys.REVOKED_TOKEN_CHANNEL)
+                # 구독 전(또는 재연결 사이)에 발행된 폐기 반영
+                self.rebuild()
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=0.5)
+                    if message and message["type"] == "message":
+                        self._add(message["data"])
+            except Exception as e:
+                logger.warning(f"Redis revocation listener error: {e}")
+                self._stop.wait(LISTENER_RETRY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+
+token_revocation = TokenRevocationList(
+    capacity=settings.TOKEN_REVOCATION_BLOOM_CAPACITY
+)
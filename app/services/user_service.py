@@ -1,13 +1,17 @@
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
 from app.exceptions.auth_exceptions import (
     ForbiddenException,
     InvalidCredentialsException,
 )
 from app.exceptions.user_exceptions import UserNotFoundException
+from app.models.user import User
+from app.repositories.count_strategy import CountStrategy, normalize_keyword
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import PasswordChange, UserListResponse, UserResponse, UserUpdate
+from app.services.principal_cache import PrincipalCache
 
 
 class UserService:
@@ -28,27 +32,42 @@ class UserService:
 
         update_dict = update_data.model_dump(exclude_unset=True)
         updated_user = self.user_repo.update(user, update_dict)
+        CountStrategy.invalidate(User.__tablename__)
         return updated_user
 
-    def change_password(self, user_id: int, password_data: PasswordChange) -> bool:
-        user = self.user_repo.get_by_id(user_id)
+    async def change_password(
+        self, user_id: int, password_data: PasswordChange
+    ) -> bool:
+        # DB 작업은 스레드풀에서, 해싱은 해싱 풀을 await (요청 스레드 점유 없음)
+        user = await run_in_threadpool(self.user_repo.get_by_id, user_id)
         if not user:
             raise UserNotFoundException()
 
         # 현재 비밀번호 검증
-        if not verify_password(password_data.current_password, user.password):
+        if not await verify_password_async(
+            password_data.current_password, user.password
+        ):
             raise InvalidCredentialsException("Current password is incorrect")
 
         # 새 비밀번호 해싱 및 저장
-        hashed_password = get_password_hash(password_data.new_password)
-        self.user_repo.update_password(user, hashed_password)
+        hashed_password = await get_password_hash_async(password_data.new_password)
+        await run_in_threadpool(self.user_repo.update_password, user, hashed_password)
         return True
 
     def get_all_users(
-        self, page: int = 1, size: int = 10, keyword: str = None
+        self,
+        page: int = 1,
+        size: int = 10,
+        keyword: str = None,
+        include_total: bool = True,
     ) -> UserListResponse:
         skip = (page - 1) * size
-        users, total = self.user_repo.get_all(skip=skip, limit=size, keyword=keyword)
+        users, total = self.user_repo.get_all(
+            skip=skip,
+            limit=size,
+            keyword=normalize_keyword(keyword),
+            include_total=include_total,
+        )
         return UserListResponse(
             users=[UserResponse.model_validate(u) for u in users],
             total=total,
@@ -66,6 +85,7 @@ class UserService:
             raise UserNotFoundException()
 
         updated_user = self.user_repo.update_role(user, role)
+        PrincipalCache.invalidate(user_id)
         return updated_user
 
     def deactivate_user(self, admin_id: int, target_user_id: int) -> UserResponse:
@@ -95,4 +115,5 @@ class UserService:
             raise ForbiddenException("Cannot deactivate admin accounts")
 
         updated_user = self.user_repo.update_status(user, is_active=False)
+        PrincipalCache.invalidate(target_user_id)
         return updated_user
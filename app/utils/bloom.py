@@ -0,0 +1,56 @@
+"""Bloom filter utilities.
+
+워커 프로세스 내에서 "확실히 없음"을 네트워크 조회 없이 판정하기 위한 고정 크기
+Bloom filter를 제공합니다. 거짓 양성은 있을 수 있으나 거짓 음성은 없으므로,
+적중한 경우에만 Redis 등 원본 저장소를 확인하면 됩니다.
+"""
+
+import hashlib
+import math
+import threading
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Attributes:
+        capacity: Expected number of items.
+        error_rate: Target false-positive rate at ``capacity`` items.
+        size: Number of bits.
+        hash_count: Number of bit positions per item.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        with self._lock:
+            for position in self._positions(item):
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        """Number of add() calls (duplicates included)."""
+        return self._count
+
+    def _positions(self, item: str):
+        # Kirsch-Mitzenmacher: 해시 두 개로 k개의 위치를 생성
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
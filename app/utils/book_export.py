@@ -0,0 +1,65 @@
+"""Streaming encoders for catalog export.
+
+도서 행 이터레이터를 NDJSON/CSV 바이트 청크로 변환하며, 선택적으로 gzip
+스트림 압축을 적용합니다. 모든 함수는 제너레이터이므로 카탈로그 크기와
+관계없이 메모리 사용량이 일정합니다.
+"""
+
+import csv
+import io
+import json
+import zlib
+from typing import Iterable, Iterator
+
+from app.schemas.book import BookFileFormat, BookResponse
+
+# 청크당 행 수 (너무 작은 write로 인한 오버헤드 방지)
+EXPORT_CHUNK_ROWS = 500
+
+EXPORT_FIELDS = list(BookResponse.model_fields)
+
+
+def encode_rows(rows: Iterable[BookResponse], fmt: BookFileFormat) -> Iterator[bytes]:
+    """Encode book rows as NDJSON lines or CSV (with header) chunks.
+
+    Args:
+        rows: Book rows to export.
+        fmt: Output format.
+
+    Yields:
+        bytes: UTF-8 encoded chunks of EXPORT_CHUNK_ROWS rows.
+    """
+    buffer = io.StringIO()
+    writer = None
+    if fmt == BookFileFormat.CSV:
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, lineterminator="\n")
+        writer.writeheader()
+
+    pending = 0
+    for row in rows:
+        data = row.model_dump(mode="json")
+        if writer is not None:
+            writer.writerow(data)
+        else:
+            buffer.write(json.dumps(data, ensure_ascii=False))
+            buffer.write("\n")
+
+        pending += 1
+        if pending >= EXPORT_CHUNK_ROWS:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a byte stream into a single gzip member, chunk by chunk."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,122 @@
+"""Streaming parsers for bulk book import files.
+
+업로드 파일을 한 번에 메모리에 올리지 않고 한 행씩 읽어 (행 번호, 데이터,
+파싱 오류) 튜플로 반환합니다. 검증(BookCreate)과 저장은 BookService가 담당합니다.
+"""
+
+import csv
+import io
+import json
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from app.exceptions.book_exceptions import BookImportFormatException
+from app.schemas.book import BookFileFormat
+
+ImportRow = Tuple[int, Optional[dict], Optional[str]]
+
+_EXTENSION_FORMATS = {
+    ".csv": BookFileFormat.CSV,
+    ".ndjson": BookFileFormat.NDJSON,
+    ".jsonl": BookFileFormat.NDJSON,
+}
+
+_CONTENT_TYPE_FORMATS = {
+    "text/csv": BookFileFormat.CSV,
+    "application/x-ndjson": BookFileFormat.NDJSON,
+    "application/jsonl": BookFileFormat.NDJSON,
+}
+
+
+def detect_import_format(
+    filename: Optional[str], content_type: Optional[str]
+) -> BookFileFormat:
+    """Infer the import format from the file name or content type.
+
+    Raises:
+        BookImportFormatException: If the format cannot be determined.
+    """
+    name = (filename or "").lower()
+    for extension, fmt in _EXTENSION_FORMATS.items():
+        if name.endswith(extension):
+            return fmt
+
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in _CONTENT_TYPE_FORMATS:
+        return _CONTENT_TYPE_FORMATS[media_type]
+
+    raise BookImportFormatException()
+
+
+def iter_import_rows(stream: BinaryIO, fmt: BookFileFormat) -> Iterator[ImportRow]:
+    """Parse an uploaded file lazily, one data row at a time.
+
+    Args:
+        stream: Binary file object of the upload.
+        fmt: File format.
+
+    Yields:
+        ImportRow: (row number, row data or None, parse error or None).
+        Row numbers start at 1 and exclude the CSV header line. A file that
+        is not valid UTF-8 ends with one error row for the undecodable rest.
+    """
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    rows = (
+        _iter_csv_rows(text_stream)
+        if fmt == BookFileFormat.CSV
+        else _iter_ndjson_rows(text_stream)
+    )
+    row_no = 0
+    try:
+        for row in rows:
+            row_no = row[0]
+            yield row
+    except UnicodeDecodeError as e:
+        # 디코딩은 청크 단위이므로 이후 행은 읽을 수 없음 (파일 오류로 보고)
+        yield (
+            row_no + 1,
+            None,
+            f"File is not valid UTF-8 text ({e.reason}); remaining rows were skipped",
+        )
+    finally:
+        # 업로드 파일 객체는 호출자가 닫으므로 래퍼만 분리
+        text_stream.detach()
+
+
+def _iter_csv_rows(text_stream: io.TextIOBase) -> Iterator[ImportRow]:
+    reader = csv.DictReader(text_stream)
+    row_no = 0
+    while True:
+        try:
+            record = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            row_no += 1
+            yield row_no, None, f"Malformed CSV row: {e}"
+            continue
+
+        row_no += 1
+        # 빈 칸(및 누락된 칸)은 키를 제외하여 미입력으로 처리 (BookCreate 기본값 적용)
+        data = {
+            key.strip(): value.strip()
+            for key, value in record.items()
+            if key is not None and isinstance(value, str) and value.strip()
+        }
+        yield row_no, data, None
+
+
+def _iter_ndjson_rows(text_stream: io.TextIOBase) -> Iterator[ImportRow]:
+    row_no = 0
+    for line in text_stream:
+        if not line.strip():
+            continue
+        row_no += 1
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield row_no, None, f"Malformed JSON line: {e}"
+            continue
+        if not isinstance(data, dict):
+            yield row_no, None, "Each line must be a JSON object"
+            continue
+        yield row_no, data, None
@@ -0,0 +1,47 @@
+"""Opaque pagination cursor utilities.
+
+Keyset(커서) 페이지네이션에서 마지막 행의 정렬 키를 클라이언트에 불투명한
+문자열로 전달하기 위한 인코딩/디코딩 함수를 제공합니다.
+"""
+
+import base64
+import binascii
+import json
+
+from app.exceptions.pagination_exceptions import InvalidCursorException
+
+
+def encode_cursor(payload: dict) -> str:
+    """Encode a cursor payload into an opaque URL-safe string.
+
+    Args:
+        payload: JSON-serializable cursor data (sort key values).
+
+    Returns:
+        str: URL-safe base64 encoded cursor.
+    """
+    raw = json.dumps(payload, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decode an opaque cursor string back into its payload.
+
+    Args:
+        cursor: Cursor string produced by encode_cursor().
+
+    Returns:
+        dict: Decoded cursor payload.
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise InvalidCursorException()
+
+    if not isinstance(payload, dict):
+        raise InvalidCursorException()
+    return payload
@@ -0,0 +1,65 @@
+"""HTTP conditional request utilities (ETag / If-None-Match).
+
+공개 카탈로그 GET 응답에 본문 해시 기반 ETag를 붙이고, 클라이언트가 보낸
+If-None-Match와 일치하면 본문 없이 304 Not Modified를 반환합니다.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+
+def compute_etag(body: bytes) -> str:
+    """Compute a strong ETag from the response body.
+
+    Args:
+        body: Serialized response body.
+
+    Returns:
+        str: Quoted entity tag.
+    """
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value.
+        etag: Current entity tag of the resource.
+
+    Returns:
+        bool: True if the client's cached representation is current.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    current = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        if candidate.strip().removeprefix("W/") == current:
+            return True
+    return False
+
+
+def conditional_response(request: Request, payload: BaseModel) -> Response:
+    """Build a JSON response with an ETag, or 304 if the client is current.
+
+    Args:
+        request: Incoming request (If-None-Match is read from it).
+        payload: Response model to serialize.
+
+    Returns:
+        Response: 200 with body and ETag, or 304 without body.
+    """
+    body = payload.model_dump_json().encode("utf-8")
+    etag = compute_etag(body)
+    # 캐시는 허용하되 재사용 전 항상 재검증 (조건부 요청)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
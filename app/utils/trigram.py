@@ -0,0 +1,27 @@
+"""Trigram extraction for fuzzy (typo-tolerant) search.
+
+pg_trgm과 같은 방식으로 단어마다 앞에 공백 2칸, 뒤에 1칸을 붙여 3글자 조각을
+만듭니다. 한글은 음절 단위로 처리되므로 "해리포터"와 오타 "해리포타"가
+"  해", " 해리", "해리포"를 공유합니다.
+"""
+
+import re
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the set of padded word trigrams of a text (case-insensitive).
+
+    Args:
+        text: Text to split (title, author or search keyword).
+
+    Returns:
+        set[str]: 3-character trigrams.
+    """
+    result: set[str] = set()
+    for word in _NON_WORD.sub(" ", text or "").casefold().split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            result.add(padded[i : i + 3])
+    return result
@@ -0,0 +1,122 @@
+"""로그인 부하 벤치마크 스크립트
+
+실행 중인 서버에 동시 로그인 요청을 보내면서 도서 목록 조회 지연 시간을 함께 측정합니다.
+Argon2 해싱이 요청 스레드풀을 점유하면 카탈로그 조회 지연이 커지므로,
+PASSWORD_HASH_WORKERS / PASSWORD_HASH_MAX_PENDING 설정별로 결과를 비교합니다.
+로그인 rate limit(분당 5회)이 결과를 가리지 않도록 limiter를 끈 서버에서 실행하세요.
+
+실행 방법:
+    uvicorn app.main:app --port 8000
+    python -m scripts.bench_login --base-url http://localhost:8000 --concurrency 32
+
+출력:
+    로그인 처리량(req/s), 503(백프레셔) 비율, 도서 목록 조회 p50/p95/p99 지연
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+import httpx
+
+BENCH_USER = {
+    "email": "bench-login@example.com",
+    "password": "benchpassword123",
+    "name": "벤치마크",
+}
+
+
+class Counter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.status: dict[int, int] = {}
+        self.latencies: list[float] = []
+
+    def record(self, status_code: int, latency: float) -> None:
+        with self.lock:
+            self.status[status_code] = self.status.get(status_code, 0) + 1
+            self.latencies.append(latency)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def login_worker(base_url: str, deadline: float, counter: Counter) -> None:
+    credentials = {"email": BENCH_USER["email"], "password": BENCH_USER["password"]}
+    with httpx.Client(base_url=base_url, timeout=30) as client:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status_code = client.post("/auth/login", json=credentials).status_code
+            except httpx.HTTPError:
+                status_code = 0
+            counter.record(status_code, time.perf_counter() - started)
+
+
+def reader_worker(base_url: str, deadline: float, counter: Counter) -> None:
+    with httpx.Client(base_url=base_url, timeout=30) as client:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status_code = client.get("/books/", params={"size": 10}).status_code
+            except httpx.HTTPError:
+                status_code = 0
+            counter.record(status_code, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Login throughput benchmark")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 로그인 수")
+    parser.add_argument("--readers", type=int, default=4, help="동시 목록 조회 수")
+    parser.add_argument("--duration", type=float, default=15.0, help="측정 시간(초)")
+    args = parser.parse_args()
+
+    # 벤치마크 사용자 생성 (이미 있으면 409)
+    httpx.post(f"{args.base_url}/auth/signup", json=BENCH_USER, timeout=30)
+
+    logins, reads = Counter(), Counter()
+    deadline = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(target=login_worker, args=(args.base_url, deadline, logins))
+        for _ in range(args.concurrency)
+    ] + [
+        threading.Thread(target=reader_worker, args=(args.base_url, deadline, reads))
+        for _ in range(args.readers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    total_logins = sum(logins.status.values())
+    succeeded = logins.status.get(200, 0)
+    rejected = logins.status.get(503, 0)
+    print(
+        f"concurrency={args.concurrency} readers={args.readers} duration={args.duration}s"
+    )
+    print(
+        f"  login: {succeeded / args.duration:8.1f} ok/s "
+        f"(total={total_logins}, 503={rejected / max(total_logins, 1):.1%}, "
+        f"status={dict(sorted(logins.status.items()))})"
+    )
+    print(
+        f"  login latency ms: p50={percentile(logins.latencies, 0.5) * 1000:.1f} "
+        f"p99={percentile(logins.latencies, 0.99) * 1000:.1f}"
+    )
+    print(
+        f"  catalog latency ms: mean={statistics.fmean(reads.latencies or [0]) * 1000:.1f} "
+        f"p50={percentile(reads.latencies, 0.5) * 1000:.1f} "
+        f"p95={percentile(reads.latencies, 0.95) * 1000:.1f} "
+        f"p99={percentile(reads.latencies, 0.99) * 1000:.1f} "
+        f"(requests={len(reads.latencies)})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""JWT 검증 캐시 벤치마크 스크립트
+
+decode_token의 요청당 비용을 캐시 사용 전/후로 비교합니다.
+실제 트래픽처럼 소수의 활성 사용자가 요청 대부분을 차지하도록 사용자별 요청 수를
+Zipf 분포(s=1.1)로 뽑고, 사용자마다 하나의 액세스 토큰을 계속 재사용합니다.
+
+실행 방법:
+    python -m scripts.bench_token_cache
+
+또는 프로젝트 루트에서:
+    python scripts/bench_token_cache.py --users 5000 --requests 200000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 경로를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core import security  # noqa: E402
+from app.core.security import (  # noqa: E402
+    clear_token_cache,
+    create_access_token,
+    decode_token,
+    token_cache_stats,
+)
+
+
+def build_workload(users: int, requests: int, seed: int) -> list[str]:
+    """Zipf 분포를 따르는 토큰 요청 시퀀스 생성"""
+    rng = random.Random(seed)
+    tokens = [
+        create_access_token({"sub": str(user_id)}) for user_id in range(1, users + 1)
+    ]
+    weights = [1 / rank**1.1 for rank in range(1, users + 1)]
+    return rng.choices(tokens, weights=weights, k=requests)
+
+
+def run(workload: list[str], cached: bool) -> float:
+    """요청당 평균 decode_token 시간(마이크로초) 측정"""
+    clear_token_cache()
+    original_maxsize = security._token_cache.maxsize
+    if not cached:
+        security._token_cache.maxsize = 0  # 캐시 비활성화 (매번 서명 검증)
+    try:
+        started = time.perf_counter()
+        for token in workload:
+            decode_token(token)
+        elapsed = time.perf_counter() - started
+    finally:
+        security._token_cache.maxsize = original_maxsize
+    return elapsed / len(workload) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JWT verification cache benchmark")
+    parser.add_argument("--users", type=int, default=5000, help="활성 사용자(토큰) 수")
+    parser.add_argument("--requests", type=int, default=200_000, help="요청 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    workload = build_workload(args.users, args.requests, args.seed)
+
+    uncached = run(workload, cached=False)
+    cached = run(workload, cached=True)
+    stats = token_cache_stats()
+
+    print(f"users={args.users} requests={args.requests} (Zipf s=1.1)")
+    print(f"  without cache: {uncached:8.2f} us/request")
+    print(f"  with cache:    {cached:8.2f} us/request ({uncached / cached:.1f}x)")
+    print(
+        f"  cache hits={stats['hits']} misses={stats['misses']} "
+        f"hit_ratio={stats['hit_ratio']:.3f} size={stats['size']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
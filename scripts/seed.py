@@ -133,9 +133,9 @@ def create_books(db, sellers: list[SellerProfile], count: int = 100) -> list[Boo
     books = []
 
     categories = [
-        "소설", "에세이", "자기계발", "경제/경영", "인문학",
-        "과학", "역사", "여행", "요리", "건강",
-        "IT/컴퓨터", "예술", "만화", "아동", "외국어"
+        "NOVEL", "ESSAY", "SELF_HELP", "BUSINESS", "HUMANITIES",
+        "SCIENCE", "HISTORY", "TRAVEL", "COOKING", "HEALTH",
+        "COMPUTER", "ART", "COMICS", "CHILDREN", "LANGUAGE"
     ]
 
     publishers = [
@@ -152,6 +152,7 @@ def create_books(db, sellers: list[SellerProfile], count: int = 100) -> list[Boo
         book = Book(
             seller_id=seller.id,
             status=random.choice(statuses),
+            category=category,
             title=f"{fake.catch_phrase()[:18]}",  # 최대 20자
             author=fake.name()[:18],
             publisher=random.choice(publishers)[:18],
@@ -1,5 +1,10 @@
+import fnmatch
+import queue
+import time
+
 import pytest
 from unittest.mock import patch
+from redis.exceptions import ResponseError
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
@@ -8,7 +13,17 @@ from sqlalchemy.pool import StaticPool
 
 from app.api.dependencies import get_db
 from app.core.database import Base
+from app.core.password_hasher import password_hasher
+from app.core.security import clear_token_cache
 from app.main import app
+from app.services.book_cache import BookDetailCache
+from app.services.book_suggest import book_suggest_index
+from app.services.order_events import order_event_bus
+from app.services.principal_cache import PrincipalCache
+from app.services.token_revocation import token_revocation
+
+# 테스트에서는 비밀번호 해싱을 호출 스레드에서 실행 (해싱 스레드 풀 생성 생략)
+password_hasher.workers = 0
 
 # 테스트용 인메모리 SQLite 데이터베이스
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -37,6 +52,10 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 # 테이블은 한 번만 생성
 Base.metadata.create_all(bind=engine)
 
+# 테스트에서는 주문 이벤트를 발행한 요청 안에서 바로 처리 (결과를 즉시 검증)
+order_event_bus.backend = "inline"
+order_event_bus.session_factory = TestingSessionLocal
+
 
 # ============ Redis Mocking ============
 class MockRedisClient:
@@ -77,8 +96,215 @@ class MockRedisClient:
         self._data.clear()
 
 
+class MockSyncPipeline:
+    """Mock Redis pipeline - 명령을 모아 execute() 시 순서대로 실행"""
+
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        results = [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+
+class MockSyncPubSub:
+    """Mock Redis pub/sub - 구독한 채널에 발행된 메시지를 큐로 전달"""
+
+    def __init__(self, client):
+        self._client = client
+        self._messages = queue.Queue()
+
+    def subscribe(self, *channels):
+        for channel in channels:
+            self._client._subscribers.setdefault(channel, []).append(self)
+
+    def get_message(self, timeout: float = 0.0):
+        try:
+            return self._messages.get(timeout=min(timeout, 0.05))
+        except queue.Empty:
+            return None
+
+    def close(self):
+        for subscribers in self._client._subscribers.values():
+            if self in subscribers:
+                subscribers.remove(self)
+
+
+class MockSyncRedisClient:
+    """Mock sync Redis Client for testing.
+
+    서비스 계층(동기)에서 사용하는 Redis 클라이언트를 모킹합니다.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._subscribers = {}
+
+    def get(self, key: str):
+        return self._data.get(key)
+
+    def set(self, key: str, value, ex=None, nx: bool = False):
+        if nx and key in self._data:
+            return None
+        self._data[key] = str(value)
+        return True
+
+    def setex(self, key: str, ttl: int, value):
+        self._data[key] = str(value)
+        return True
+
+    def delete(self, *keys: str):
+        removed = 0
+        for key in keys:
+            if key in self._data:
+                del self._data[key]
+                removed += 1
+        return removed
+
+    def expire(self, key: str, ttl: int):
+        return key in self._data
+
+    def exists(self, *keys: str):
+        return sum(1 for key in keys if key in self._data)
+
+    def scan_iter(self, match: str = "*", count: int = None):
+        return [key for key in list(self._data) if fnmatch.fnmatchcase(key, match)]
+
+    def publish(self, channel: str, message):
+        subscribers = list(self._subscribers.get(channel, []))
+        for subscriber in subscribers:
+            subscriber._messages.put({"type": "message", "channel": channel, "data": str(message)})
+        return len(subscribers)
+
+    def pubsub(self, ignore_subscribe_messages: bool = False):
+        return MockSyncPubSub(self)
+
+    def incr(self, key: str, amount: int = 1):
+        value = int(self._data.get(key, 0)) + amount
+        self._data[key] = str(value)
+        return value
+
+    def hget(self, key: str, field):
+        return self._data.get(key, {}).get(str(field))
+
+    def hset(self, key: str, field, value):
+        self._data.setdefault(key, {})[str(field)] = str(value)
+        return 1
+
+    def hincrby(self, key: str, field, amount: int = 1):
+        mapping = self._data.setdefault(key, {})
+        mapping[str(field)] = str(int(mapping.get(str(field), 0)) + amount)
+        return int(mapping[str(field)])
+
+    def hmget(self, key: str, fields):
+        mapping = self._data.get(key, {})
+        return [mapping.get(str(field)) for field in fields]
+
+    def hgetall(self, key: str):
+        return dict(self._data.get(key, {}))
+
+    def rename(self, src: str, dst: str):
+        if src not in self._data:
+            raise ResponseError("no such key")
+        self._data[dst] = self._data.pop(src)
+        return True
+
+    def eval(self, script: str, numkeys: int, *keys_and_args):
+        """Lua 스크립트 대신 같은 의미의 파이썬 구현을 실행"""
+        from app.services.purchase_counter import FREEZE_BATCH_SCRIPT, RELEASE_LOCK_SCRIPT
+
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        if script == RELEASE_LOCK_SCRIPT:
+            if self.get(keys[0]) == args[0]:
+                return self.delete(keys[0])
+            return 0
+        if script == FREEZE_BATCH_SCRIPT:
+            if not self.exists(keys[0]):
+                return 0
+            batch = self.incr(keys[2])
+            self.rename(keys[0], keys[1])
+            self.hset(keys[1], args[0], batch)
+            return batch
+        raise NotImplementedError(script)
+
+    def pipeline(self, transaction: bool = True):
+        return MockSyncPipeline(self)
+
+    def xadd(self, name: str, fields: dict, maxlen=None, approximate: bool = True):
+        stream = self._data.setdefault(name, {"entries": [], "groups": {}})
+        entry_id = f"{len(stream['entries']) + 1}-0"
+        stream["entries"].append((entry_id, {k: str(v) for k, v in fields.items()}))
+        return entry_id
+
+    def xgroup_create(self, name: str, groupname: str, id: str = "$", mkstream: bool = False):
+        from redis.exceptions import ResponseError
+
+        stream = self._data.setdefault(name, {"entries": [], "groups": {}})
+        if groupname in stream["groups"]:
+            raise ResponseError("BUSYGROUP Consumer Group name already exists")
+        delivered = 0 if id == "0" else len(stream["entries"])
+        stream["groups"][groupname] = {
+            "delivered": delivered, "pending": {}, "delivered_at": {}
+        }
+        return True
+
+    def xreadgroup(self, groupname: str, consumername: str, streams: dict, count=None, block=None):
+        result = []
+        for name, start in streams.items():
+            stream = self._data[name]
+            group = stream["groups"][groupname]
+            if start == ">":
+                entries = stream["entries"][group["delivered"]:][:count]
+                group["delivered"] += len(entries)
+                for entry_id, _ in entries:
+                    group["pending"][entry_id] = consumername
+                    group["delivered_at"][entry_id] = time.monotonic()
+            else:
+                entries = [
+                    entry for entry in stream["entries"]
+                    if group["pending"].get(entry[0]) == consumername
+                ][:count]
+            if entries or start != ">":
+                result.append([name, entries])
+        return result
+
+    def xautoclaim(self, name: str, groupname: str, consumername: str, min_idle_time: int,
+                   start_id: str = "0-0", count=None, justid: bool = False):
+        group = self._data[name]["groups"][groupname]
+        now = time.monotonic()
+        claimed = [
+            entry for entry in self._data[name]["entries"]
+            if entry[0] in group["pending"]
+            and (now - group["delivered_at"][entry[0]]) * 1000 >= min_idle_time
+        ][:count]
+        for entry_id, _ in claimed:
+            group["pending"][entry_id] = consumername
+            group["delivered_at"][entry_id] = now
+        entries = [entry_id for entry_id, _ in claimed] if justid else claimed
+        return ["0-0", entries, []]
+
+    def xack(self, name: str, groupname: str, *ids: str):
+        pending = self._data[name]["groups"][groupname]["pending"]
+        return sum(1 for entry_id in ids if pending.pop(entry_id, None) is not None)
+
+    def close(self):
+        pass
+
+    def clear(self):
+        self._data.clear()
+
+
 # Global mock redis instance
 _mock_redis = MockRedisClient()
+_mock_sync_redis = MockSyncRedisClient()
 
 
 async def mock_get_redis_client():
@@ -86,6 +312,13 @@ async def mock_get_redis_client():
     return _mock_redis
 
 
+@pytest.fixture(scope="function", autouse=True)
+def mock_sync_redis_client():
+    """서비스 계층의 동기 Redis 클라이언트를 Mock으로 대체합니다."""
+    with patch('app.core.redis._sync_redis_client', _mock_sync_redis):
+        yield _mock_sync_redis
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """각 테스트마다 새로운 DB 세션 제공.
@@ -125,6 +358,14 @@ def cleanup_db(request):
 
         # Redis mock 데이터 정리
         _mock_redis.clear()
+        _mock_sync_redis.clear()
+
+        # 프로세스 로컬 캐시 정리 (테이블 정리 후 id가 재사용됨)
+        BookDetailCache.clear_local()
+        PrincipalCache.clear_local()
+        clear_token_cache()
+        token_revocation.clear_local()
+        book_suggest_index.clear()
 
 
 @pytest.fixture(scope="function")
@@ -132,3 +132,297 @@ class TestLogout:
         response = client.post("/auth/logout")
 
         assert_error_response(response, status_code=401, error_code="AUTH_UNAUTHORIZED")
+
+    def test_logout_revokes_access_token(self, client, auth_headers):
+        """로그아웃한 액세스 토큰으로는 더 이상 접근 불가"""
+        client.post("/auth/logout", headers=auth_headers)
+
+        response = client.get("/users/me", headers=auth_headers)
+
+        assert_error_response(response, status_code=401, error_code="AUTH_UNAUTHORIZED")
+
+    def test_logout_revokes_refresh_token(self, client, test_user_data, registered_user):
+        """로그아웃 시 함께 보낸 리프레시 토큰도 폐기"""
+        tokens = client.post("/auth/login", json={
+            "email": test_user_data["email"],
+            "password": test_user_data["password"]
+        }).json()["data"]
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+        client.post("/auth/logout", json={"refresh_token": tokens["refresh_token"]}, headers=headers)
+
+        response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert_error_response(response, status_code=401, error_code="AUTH_INVALID_TOKEN")
+
+    def test_other_tokens_remain_valid(self, client, test_user_data, auth_headers):
+        """로그아웃은 해당 토큰만 폐기 (다른 세션 토큰은 유효)"""
+        other = client.post("/auth/login", json={
+            "email": test_user_data["email"],
+            "password": test_user_data["password"]
+        }).json()["data"]["access_token"]
+
+        client.post("/auth/logout", headers=auth_headers)
+
+        response = client.get("/users/me", headers={"Authorization": f"Bearer {other}"})
+        assert_success_response(response, status_code=200)
+
+
+class TestTokenRevocationList:
+    """폐기 토큰 목록(Redis + Bloom filter) 테스트"""
+
+    def test_unrevoked_token_skips_redis(self, mock_sync_redis_client, monkeypatch):
+        """Bloom filter에 없는 jti는 Redis를 조회하지 않음"""
+        from app.services.token_revocation import token_revocation
+
+        def fail(*keys):
+            raise AssertionError("Redis should not be queried")
+
+        monkeypatch.setattr(mock_sync_redis_client, "exists", fail)
+
+        assert token_revocation.is_revoked("not-revoked-jti") is False
+
+    def test_revocation_propagates_via_pubsub(self):
+        """다른 워커의 폐기가 pub/sub으로 Bloom filter에 반영"""
+        import time
+
+        from app.services.token_revocation import TokenRevocationList, token_revocation
+
+        other_worker = TokenRevocationList(capacity=1000)
+        other_worker.start_listener()
+        try:
+            deadline = time.monotonic() + 2
+            while time.monotonic() < deadline:
+                token_revocation.revoke("jti-from-worker-a", time.time() + 60)
+                if other_worker.is_revoked("jti-from-worker-a"):
+                    break
+                time.sleep(0.05)
+
+            assert other_worker.is_revoked("jti-from-worker-a") is True
+        finally:
+            other_worker.stop_listener()
+
+    def test_rebuild_loads_existing_revocations(self, mock_sync_redis_client):
+        """재구축 시 Redis에 저장된 폐기 목록을 반영"""
+        from app.core.redis import RedisKeys
+        from app.services.token_revocation import TokenRevocationList
+
+        mock_sync_redis_client.set(RedisKeys.revoked_token_key("stored-jti"), "1", ex=60)
+        revocations = TokenRevocationList(capacity=1000)
+        assert revocations.is_revoked("stored-jti") is False
+
+        revocations.rebuild()
+
+        assert revocations.is_revoked("stored-jti") is True
+
+
+class TestVerifiedTokenCache:
+    """검증 완료 토큰 캐시 테스트"""
+
+    def test_reused_token_served_from_cache(self):
+        """같은 토큰 재사용 시 서명 검증 없이 캐시에서 payload 반환"""
+        from app.core.security import create_access_token, decode_token, token_cache_stats
+
+        token = create_access_token({"sub": "1"})
+
+        first = decode_token(token)
+        first["sub"] = "changed"  # 반환값 변경이 캐시에 영향을 주지 않음
+        second = decode_token(token)
+
+        assert second["sub"] == "1"
+        stats = token_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+    def test_cached_token_expires_with_exp(self):
+        """캐시 항목은 토큰 exp 이후 사용되지 않음"""
+        import time
+        from datetime import timedelta
+
+        from app.core.security import create_access_token, decode_token
+
+        token = create_access_token({"sub": "1"}, expires_delta=timedelta(seconds=1))
+        assert decode_token(token) is not None
+
+        time.sleep(1.1)
+
+        assert decode_token(token) is None
+
+    def test_invalid_token_not_cached(self):
+        """검증 실패한 토큰은 캐싱하지 않음"""
+        from app.core.security import decode_token, token_cache_stats
+
+        assert decode_token("invalid.token.value") is None
+        assert decode_token("invalid.token.value") is None
+
+        assert token_cache_stats()["size"] == 0
+
+
+class TestPasswordHasher:
+    """비밀번호 해싱 전용 실행기 테스트"""
+
+    def test_hash_and_verify_in_pool(self):
+        """전용 스레드 풀에서 해싱/검증 수행"""
+        from app.core.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(workers=1, max_pending=2)
+        try:
+            hashed = hasher.hash("secret-password")
+
+            assert hasher.verify("secret-password", hashed) is True
+            assert hasher.verify("wrong-password", hashed) is False
+            stats = hasher.stats()
+            assert (stats["completed"], stats["running"], stats["queued"]) == (3, 0, 0)
+            assert stats["failed"] == 0
+        finally:
+            hasher.shutdown()
+
+    def test_async_runs_in_pool_thread(self):
+        """async 경로는 이벤트 루프 스레드가 아닌 해싱 스레드에서 실행"""
+        import asyncio
+        import threading
+
+        from app.core.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(workers=1, max_pending=2)
+        try:
+            thread_name = asyncio.run(
+                hasher._run_async(lambda: threading.current_thread().name)
+            )
+
+            assert thread_name.startswith("password-hasher")
+            assert hasher.stats()["completed"] == 1
+        finally:
+            hasher.shutdown()
+
+    def test_failed_operations_counted_separately(self):
+        """예외로 끝난 작업은 completed가 아닌 failed로 집계"""
+        from app.core.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(workers=0, max_pending=1)
+
+        def broken(password):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            hasher._run(broken, "pw")
+
+        stats = hasher.stats()
+        assert (stats["completed"], stats["failed"], stats["running"]) == (0, 1, 0)
+
+    def test_rejects_when_saturated(self):
+        """실행 + 대기 한도를 넘으면 대기 없이 거절"""
+        import threading
+
+        from app.core.password_hasher import PasswordHasher
+        from app.exceptions.server_exceptions import ServiceUnavailableException
+
+        hasher = PasswordHasher(workers=0, max_pending=1)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_hash(password):
+            started.set()
+            release.wait(5)
+            return password
+
+        worker = threading.Thread(target=hasher._run, args=(slow_hash, "pw"))
+        worker.start()
+        try:
+            started.wait(5)
+            assert hasher.stats()["running"] == 1
+
+            with pytest.raises(ServiceUnavailableException):
+                hasher.hash("another")
+            assert hasher.stats()["rejected"] == 1
+        finally:
+            release.set()
+            worker.join()
+
+        assert hasher.stats()["running"] == 0
+
+    def test_non_positive_max_pending_is_unbounded(self):
+        """PASSWORD_HASH_MAX_PENDING이 0 이하이면 거절하지 않음"""
+        from app.core.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(workers=0, max_pending=0)
+        hashed = hasher.hash("secret-password")
+
+        assert hasher.verify("secret-password", hashed) is True
+        assert hasher.stats()["rejected"] == 0
+
+    def test_login_returns_503_when_saturated(self, client, test_user_data, registered_user, monkeypatch):
+        """해싱 실행기가 포화 상태이면 로그인은 503"""
+        from app.core import security
+        from app.core.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(workers=0, max_pending=1)
+        hasher._slots.acquire()  # 다른 요청이 한도를 모두 사용 중
+        monkeypatch.setattr(security, "password_hasher", hasher)
+
+        response = client.post("/auth/login", json={
+            "email": test_user_data["email"],
+            "password": test_user_data["password"]
+        })
+
+        assert_error_response(response, status_code=503, error_code="SERVICE_UNAVAILABLE")
+
+
+class TestRateLimitStorage:
+    """Redis rate limit 저장소(로컬 선점) 테스트"""
+
+    def _storage_with_fake_script(self):
+        """Lua 스크립트를 동일한 의미의 파이썬 구현으로 대체한 저장소"""
+        from app.core.rate_limit_storage import LeasedRedisStorage
+
+        storage = LeasedRedisStorage("leased+redis://127.0.0.1:1/0")
+        counts, calls = {}, []
+
+        def acquire_lease(keys, args):
+            limit, _, amount, want = args
+            calls.append(want)
+            granted = min(want, limit - counts.get(keys[1], 0))
+            if granted < amount:
+                return 0
+            counts[keys[1]] = counts.get(keys[1], 0) + granted
+            return granted
+
+        storage.lua_acquire_sliding_window_lease = acquire_lease
+        return storage, calls
+
+    def test_hits_served_from_local_lease(self):
+        """한도에 여유가 있으면 선점분으로 처리하여 Redis 호출 감소"""
+        storage, calls = self._storage_with_fake_script()
+
+        results = [storage.acquire_sliding_window_entry("k", 100, 60) for _ in range(100)]
+
+        assert all(results)
+        assert len(calls) == 10  # 10건씩 선점
+
+    def test_limit_is_not_exceeded(self):
+        """선점을 사용해도 한도를 넘지 않음"""
+        storage, calls = self._storage_with_fake_script()
+
+        results = [storage.acquire_sliding_window_entry("k", 25, 60) for _ in range(30)]
+
+        assert results.count(True) == 25
+
+    def test_small_limits_are_exact(self):
+        """선점 크기가 1 이하인 한도는 매 요청 Redis에서 처리"""
+        storage, calls = self._storage_with_fake_script()
+
+        results = [storage.acquire_sliding_window_entry("k", 5, 60) for _ in range(6)]
+
+        assert results == [True] * 5 + [False]
+        assert calls == [1] * 6
+
+    def test_falls_back_to_memory_when_redis_unavailable(self, client, test_user_data, registered_user):
+        """Redis에 연결할 수 없으면 in-memory 카운터로 한도 적용"""
+        from app.core.limiter import limiter
+
+        login_data = {"email": test_user_data["email"], "password": "wrongpassword"}
+        limiter.enabled = True
+        try:
+            statuses = [client.post("/auth/login", json=login_data).status_code for _ in range(6)]
+        finally:
+            limiter.enabled = False
+            limiter._fallback_storage.reset()
+
+        assert statuses == [401] * 5 + [429]
@@ -35,6 +35,183 @@ class TestCreateBook:
         assert_error_response(response, status_code=401)
 
 
+class TestImportBooks:
+    """도서 대량 등록 테스트"""
+
+    CSV_HEADER = "title,author,publisher,summary,isbn,price,status,category\n"
+
+    def test_import_books_csv(self, client, seller_auth_headers, test_book_data, monkeypatch):
+        """CSV 대량 등록: 유효 행만 등록, 실패 행은 행 번호와 함께 보고"""
+        from app.core.config import settings
+        from app.services.book_suggest import book_suggest_index
+
+        monkeypatch.setattr(settings, "BOOK_IMPORT_BATCH_SIZE", 2)
+        # 등록된 행만 자동완성 색인에 추가 (전체 재구축 없음)
+        monkeypatch.setattr(book_suggest_index, "rebuild", lambda db: pytest.fail("full rebuild"))
+        client.post("/books/", json=test_book_data, headers=seller_auth_headers)
+
+        content = self.CSV_HEADER + (
+            "대량도서1,저자,출판사,요약,978-00-0000-001,10000,ONSALE,NOVEL\n"
+            "대량도서2,저자,출판사,요약,978-00-0000-002,12000,ONSALE,\n"
+            "가격오류,저자,출판사,요약,978-00-0000-003,-1,ONSALE,\n"
+            "파일내중복,저자,출판사,요약,978-00-0000-001,10000,ONSALE,\n"
+            f"기존도서,저자,출판사,요약,{test_book_data['isbn']},10000,ONSALE,\n"
+            "대량도서3,저자,출판사,요약,978-00-0000-004,9000,ONSALE,COMPUTER\n"
+        )
+
+        response = client.post(
+            "/books/import",
+            files={"file": ("books.csv", content.encode("utf-8"), "text/csv")},
+            headers=seller_auth_headers,
+        )
+
+        data = assert_success_response(response, status_code=200)["data"]
+        assert data["total_rows"] == 6
+        assert data["created"] == 3
+        assert data["failed"] == 3
+        assert [(e["row"], e["isbn"]) for e in sorted(data["errors"], key=lambda e: e["row"])] == [
+            (3, "978-00-0000-003"),
+            (4, "978-00-0000-001"),
+            (5, test_book_data["isbn"]),
+        ]
+
+        listing = client.get("/books/", params={"keyword": "대량도서"}).json()["data"]
+        assert listing["total"] == 3
+        # 대량 등록 도서도 퍼지 검색 색인에 포함
+        fuzzy = client.get("/books/", params={"keyword": "대량도사", "fuzzy": "true"}).json()["data"]
+        assert fuzzy["total"] == 3
+        assert client.get("/books/", params={"category": "COMPUTER"}).json()["data"]["total"] == 1
+        suggestions = client.get("/books/suggest", params={"q": "대량"}).json()["data"]["suggestions"]
+        assert sorted(s["title"] for s in suggestions) == ["대량도서1", "대량도서2", "대량도서3"]
+
+    def test_import_books_csv_blank_cells_use_defaults(self, client, seller_auth_headers, db_session):
+        """빈 칸은 미입력으로 처리되어 기본값 적용 (status 기본값 TOBESOLD)"""
+        from app.models.book import Book
+
+        content = self.CSV_HEADER + "빈칸도서,저자,출판사,요약,978-00-0000-021,10000,,\n"
+
+        response = client.post(
+            "/books/import",
+            files={"file": ("books.csv", content.encode("utf-8"), "text/csv")},
+            headers=seller_auth_headers,
+        )
+
+        data = assert_success_response(response, status_code=200)["data"]
+        assert (data["created"], data["failed"]) == (1, 0)
+        book = db_session.query(Book).filter(Book.isbn == "978-00-0000-021").one()
+        assert (book.status, book.category) == ("TOBESOLD", None)
+
+    def test_import_books_invalid_encoding(self, client, seller_auth_headers):
+        """UTF-8이 아닌 파일은 요청 실패 대신 파일 오류로 보고"""
+        content = self.CSV_HEADER + "인코딩오류,저자,출판사,요약,978-00-0000-031,10000,ONSALE,\n"
+
+        response = client.post(
+            "/books/import",
+            files={"file": ("books.csv", content.encode("cp949"), "text/csv")},
+            headers=seller_auth_headers,
+        )
+
+        data = assert_success_response(response, status_code=200)["data"]
+        assert (data["created"], data["failed"]) == (0, 1)
+        assert "UTF-8" in data["errors"][0]["message"]
+
+    def test_import_books_ndjson(self, client, seller_auth_headers, test_book_data):
+        """NDJSON 대량 등록 (잘못된 JSON 행은 보고 후 계속 진행)"""
+        import json
+
+        lines = [
+            json.dumps({**test_book_data, "isbn": "978-00-0000-011"}),
+            "{not json",
+            "",
+            json.dumps({**test_book_data, "isbn": "978-00-0000-012"}),
+        ]
+
+        response = client.post(
+            "/books/import",
+            files={"file": ("books.ndjson", "\n".join(lines).encode("utf-8"), "application/octet-stream")},
+            headers=seller_auth_headers,
+        )
+
+        data = assert_success_response(response, status_code=200)["data"]
+        assert data["total_rows"] == 3
+        assert data["created"] == 2
+        assert data["errors"][0]["row"] == 2
+
+    def test_import_books_unsupported_format(self, client, seller_auth_headers):
+        """형식을 알 수 없는 파일"""
+        response = client.post(
+            "/books/import",
+            files={"file": ("books.xlsx", b"data", "application/octet-stream")},
+            headers=seller_auth_headers,
+        )
+
+        assert_error_response(response, status_code=400, error_code="UNSUPPORTED_IMPORT_FORMAT")
+
+    def test_import_books_not_seller(self, client, auth_headers):
+        """판매자가 아닌 경우"""
+        response = client.post(
+            "/books/import",
+            files={"file": ("books.csv", self.CSV_HEADER.encode("utf-8"), "text/csv")},
+            headers=auth_headers,
+        )
+
+        assert_error_response(response, status_code=403)
+
+
+class TestExportBooks:
+    """도서 카탈로그 내보내기 테스트"""
+
+    def _create_books(self, client, seller_auth_headers, test_book_data, count):
+        for i in range(count):
+            client.post(
+                "/books/",
+                json={**test_book_data, "isbn": f"978-00-1000-{i:03d}", "title": f"도서{i}"},
+                headers=seller_auth_headers,
+            )
+
+    def test_export_books_ndjson(self, client, seller_auth_headers, test_book_data):
+        """판매자는 본인 도서를 NDJSON으로 스트리밍 (seller_id 지정은 무시)"""
+        import json
+
+        self._create_books(client, seller_auth_headers, test_book_data, 3)
+
+        response = client.get("/books/export", params={"seller_id": 9999}, headers=seller_auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["title"] for row in rows] == ["도서0", "도서1", "도서2"]
+
+    def test_export_books_csv_gzip_as_admin(self, client, seller_auth_headers, admin_headers, test_book_data):
+        """관리자는 전체 카탈로그를 gzip 압축 CSV로 내보내기"""
+        import csv
+        import gzip
+        import io
+
+        self._create_books(client, seller_auth_headers, test_book_data, 2)
+
+        response = client.get(
+            "/books/export", params={"format": "csv", "gzip": "true"}, headers=admin_headers
+        )
+
+        assert response.status_code == 200
+        assert 'filename="books.csv.gz"' in response.headers["content-disposition"]
+        text = gzip.decompress(response.content).decode("utf-8")
+        rows = list(csv.DictReader(io.StringIO(text)))
+        assert len(rows) == 2
+        assert rows[0]["isbn"] == "978-00-1000-000"
+
+        # 특정 판매자로 범위 제한
+        response = client.get("/books/export", params={"seller_id": 9999}, headers=admin_headers)
+        assert response.text == ""
+
+    def test_export_books_not_seller(self, client, auth_headers):
+        """판매자/관리자가 아닌 경우"""
+        response = client.get("/books/export", headers=auth_headers)
+
+        assert_error_response(response, status_code=403)
+
+
 class TestGetBooks:
     """도서 목록 조회 테스트"""
 
@@ -64,6 +241,88 @@ class TestGetBooks:
 
         assert_success_response(response, status_code=200)
 
+    def test_get_books_keyword_search_fields(self, client, seller_auth_headers, test_book_data):
+        """키워드 검색 - 제목/저자/출판사 전문 검색 및 불일치 제외"""
+        books = [
+            {"title": "해리포터와마법사의돌", "author": "롤링", "publisher": "문학수첩", "isbn": "978-89-0000-001"},
+            {"title": "반지의제왕", "author": "톨킨", "publisher": "씨앗을뿌리는사람", "isbn": "978-89-0000-002"},
+            {"title": "호빗", "author": "톨킨", "publisher": "문학수첩", "isbn": "978-89-0000-003"},
+        ]
+        for book in books:
+            client.post("/books/", json={**test_book_data, **book}, headers=seller_auth_headers)
+
+        title_hit = client.get("/books/", params={"keyword": "마법사의"}).json()["data"]
+        assert [b["title"] for b in title_hit["books"]] == ["해리포터와마법사의돌"]
+
+        publisher_hit = client.get("/books/", params={"keyword": "문학수첩"}).json()["data"]
+        assert publisher_hit["total"] == 2
+
+        miss = client.get("/books/", params={"keyword": "존재하지않는책"}).json()["data"]
+        assert miss["total"] == 0
+        assert miss["books"] == []
+
+    def test_get_books_short_keyword_fallback(self, client, seller_auth_headers, test_book_data):
+        """색인 최소 길이보다 짧은 키워드도 검색 가능"""
+        client.post("/books/", json={**test_book_data, "author": "톨킨"}, headers=seller_auth_headers)
+
+        response = client.get("/books/", params={"keyword": "톨"})
+
+        data = assert_success_response(response, status_code=200)
+        assert data["data"]["total"] == 1
+
+    def test_get_books_search_reflects_update(self, client, seller_auth_headers, test_book_data):
+        """도서 수정 시 검색 색인 동기화"""
+        create_response = client.post("/books/", json=test_book_data, headers=seller_auth_headers)
+        book_id = create_response.json()["data"]["id"]
+
+        client.put(f"/books/{book_id}", json={"title": "새로운제목입니다"}, headers=seller_auth_headers)
+
+        old = client.get("/books/", params={"keyword": "테스트도서"}).json()["data"]
+        new = client.get("/books/", params={"keyword": "새로운제목"}).json()["data"]
+        assert old["total"] == 0
+        assert [b["id"] for b in new["books"]] == [book_id]
+
+    def test_get_books_sort_by_relevance(self, client, seller_auth_headers, test_book_data):
+        """관련도순 정렬"""
+        client.post("/books/", json={**test_book_data, "title": "파이썬", "isbn": "978-89-0000-011"}, headers=seller_auth_headers)
+        client.post("/books/", json={**test_book_data, "title": "파이썬파이썬파이썬", "isbn": "978-89-0000-012"}, headers=seller_auth_headers)
+
+        response = client.get("/books/", params={"keyword": "파이썬", "sort": "relevance"})
+
+        data = assert_success_response(response, status_code=200)
+        assert data["data"]["total"] == 2
+        assert data["data"]["books"][0]["title"] == "파이썬파이썬파이썬"
+
+    def test_get_books_fuzzy(self, client, seller_auth_headers, test_book_data):
+        """오타가 있는 키워드도 유사도 검색으로 찾음 (유사도순 정렬)"""
+        client.post("/books/", json={**test_book_data, "isbn": "978-00-4000-001", "title": "해리포터"}, headers=seller_auth_headers)
+        client.post("/books/", json={**test_book_data, "isbn": "978-00-4000-002", "title": "해리포터와 불사조"}, headers=seller_auth_headers)
+        client.post("/books/", json={**test_book_data, "isbn": "978-00-4000-003", "title": "반지의 제왕"}, headers=seller_auth_headers)
+
+        # 일반 검색은 결과 없음
+        assert client.get("/books/", params={"keyword": "해리포타"}).json()["data"]["total"] == 0
+
+        response = client.get("/books/", params={"keyword": "해리포타", "fuzzy": "true", "sort": "relevance"})
+
+        data = assert_success_response(response, status_code=200)
+        assert data["data"]["total"] == 2
+        assert {b["title"] for b in data["data"]["books"]} == {"해리포터", "해리포터와 불사조"}
+
+        response = client.get("/books/", params={"keyword": "Tolkein", "fuzzy": "true"})
+        assert response.json()["data"]["total"] == 0
+
+    def test_get_books_fuzzy_author_and_update(self, client, seller_auth_headers, test_book_data):
+        """저자 오타 검색, 수정 시 색인 갱신"""
+        book_id = client.post(
+            "/books/", json={**test_book_data, "author": "Tolkien"}, headers=seller_auth_headers
+        ).json()["data"]["id"]
+
+        assert client.get("/books/", params={"keyword": "tolkein", "fuzzy": "true"}).json()["data"]["total"] == 1
+
+        client.put(f"/books/{book_id}", json={"author": "Rowling"}, headers=seller_auth_headers)
+        assert client.get("/books/", params={"keyword": "tolkein", "fuzzy": "true"}).json()["data"]["total"] == 0
+        assert client.get("/books/", params={"keyword": "rowlin", "fuzzy": "true"}).json()["data"]["total"] == 1
+
     def test_get_books_with_pagination(self, client, seller_auth_headers, test_book_data):
         """페이지네이션"""
         # 여러 도서 등록
@@ -78,6 +337,101 @@ class TestGetBooks:
         data = assert_success_response(response, status_code=200)
         assert len(data["data"]["books"]) <= 2
 
+    @pytest.mark.parametrize("sort", ["date_desc", "date_asc", "price_asc", "price_desc", "sales"])
+    def test_get_books_with_cursor(self, client, seller_auth_headers, test_book_data, sort):
+        """커서(keyset) 페이지네이션 - 동일 정렬 값이 있어도 중복/누락 없음"""
+        created_ids = []
+        for i in range(5):
+            book_data = {**test_book_data, "isbn": f"978-89-1234-{i:03d}", "price": 10000 + (i // 2) * 1000}
+            response = client.post("/books/", json=book_data, headers=seller_auth_headers)
+            created_ids.append(response.json()["data"]["id"])
+
+        seen = []
+        params = {"size": 2, "sort": sort}
+        for _ in range(len(created_ids) + 1):
+            data = client.get("/books/", params=params).json()["data"]
+            seen.extend(b["id"] for b in data["books"])
+            if not data["next_cursor"]:
+                break
+            params = {"size": 2, "sort": sort, "cursor": data["next_cursor"]}
+
+        assert sorted(seen) == sorted(created_ids)
+        assert len(seen) == len(set(seen))
+
+    def test_get_books_cursor_matches_offset(self, client, seller_auth_headers, test_book_data):
+        """커서 페이지와 offset 페이지 결과 일치"""
+        for i in range(4):
+            book_data = {**test_book_data, "isbn": f"978-89-1234-{i:03d}", "price": 10000 + i}
+            client.post("/books/", json=book_data, headers=seller_auth_headers)
+
+        first = client.get("/books/", params={"size": 2, "sort": "price_asc"}).json()["data"]
+        by_offset = client.get("/books/", params={"size": 2, "page": 2, "sort": "price_asc"}).json()["data"]
+        by_cursor = client.get(
+            "/books/", params={"size": 2, "sort": "price_asc", "cursor": first["next_cursor"]}
+        ).json()["data"]
+
+        assert [b["id"] for b in by_cursor["books"]] == [b["id"] for b in by_offset["books"]]
+        assert by_cursor["total"] == 4
+
+    def test_get_books_invalid_cursor(self, client):
+        """잘못된 커서"""
+        response = client.get("/books/", params={"cursor": "not-a-cursor"})
+
+        assert_error_response(response, status_code=400, error_code="INVALID_CURSOR")
+
+    def test_get_books_cursor_sort_mismatch(self, client, seller_auth_headers, test_book_data):
+        """다른 정렬 옵션으로 발급된 커서 사용"""
+        for i in range(2):
+            book_data = {**test_book_data, "isbn": f"978-89-1234-{i:03d}"}
+            client.post("/books/", json=book_data, headers=seller_auth_headers)
+        cursor = client.get("/books/", params={"size": 1}).json()["data"]["next_cursor"]
+
+        response = client.get("/books/", params={"size": 1, "sort": "price_asc", "cursor": cursor})
+
+        assert_error_response(response, status_code=400, error_code="INVALID_CURSOR")
+
+    def test_get_books_with_category(self, client, seller_auth_headers, test_book_data):
+        """카테고리 필터 적용"""
+        client.post(
+            "/books/",
+            json={**test_book_data, "isbn": "978-89-0000-001", "category": "NOVEL"},
+            headers=seller_auth_headers,
+        )
+        client.post(
+            "/books/",
+            json={**test_book_data, "isbn": "978-89-0000-002", "category": "COMPUTER"},
+            headers=seller_auth_headers,
+        )
+        client.post(
+            "/books/", json={**test_book_data, "isbn": "978-89-0000-003"}, headers=seller_auth_headers
+        )
+
+        response = client.get("/books/", params={"category": "NOVEL"})
+
+        data = assert_success_response(response, status_code=200)
+        assert data["data"]["total"] == 1
+        assert [b["category"] for b in data["data"]["books"]] == ["NOVEL"]
+        assert client.get("/books/").json()["data"]["total"] == 3
+
+    def test_get_books_invalid_category(self, client):
+        """정의되지 않은 카테고리는 422"""
+        response = client.get("/books/", params={"category": "UNKNOWN"})
+
+        assert response.status_code == 422
+
+    def test_get_books_not_modified(self, client, seller_auth_headers, test_book_data):
+        """목록 ETag: 동일 결과는 304, 도서 추가 후에는 200"""
+        client.post("/books/", json=test_book_data, headers=seller_auth_headers)
+        etag = client.get("/books/").headers["etag"]
+
+        assert client.get("/books/", headers={"If-None-Match": etag}).status_code == 304
+        assert client.get("/books/", headers={"If-None-Match": f'W/{etag}, "other"'}).status_code == 304
+
+        client.post("/books/", json={**test_book_data, "isbn": "978-89-9999-999"}, headers=seller_auth_headers)
+        response = client.get("/books/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()["data"]["books"]) == 2
+
     def test_get_books_with_sort(self, client, seller_auth_headers, test_book_data):
         """정렬 옵션"""
         client.post("/books/", json=test_book_data, headers=seller_auth_headers)
@@ -86,6 +440,351 @@ class TestGetBooks:
 
         assert_success_response(response, status_code=200)
 
+    def test_keyword_whitespace_shares_query_and_cached_total(self, client, seller_auth_headers, test_book_data):
+        """공백만 다른 검색어는 같은 조건으로 조회되어 캐시된 total과 목록이 일치"""
+        client.post("/books/", json=test_book_data, headers=seller_auth_headers)
+
+        first = client.get("/books/", params={"keyword": "테스트도서"}).json()["data"]
+        padded = client.get("/books/", params={"keyword": " 테스트도서 "}).json()["data"]
+
+        assert first["total"] == len(first["books"]) == 1
+        assert padded["total"] == len(padded["books"]) == 1
+
+
+class TestBookListTotal:
+    """도서 목록 total 집계 전략 테스트"""
+
+    def test_get_books_without_total(self, client, seller_auth_headers, test_book_data):
+        """include_total=false이면 개수 집계 생략"""
+        client.post("/books/", json=test_book_data, headers=seller_auth_headers)
+
+        response = client.get("/books/", params={"include_total": "false"})
+
+        data = assert_success_response(response, status_code=200)
+        assert data["data"]["total"] is None
+        assert len(data["data"]["books"]) == 1
+
+    def test_get_books_total_is_cached(self, client, seller_auth_headers, test_book_data, db_session):
+        """동일 필터의 total은 캐시에서 제공 (서비스를 거치지 않은 변경은 반영되지 않음)"""
+        from app.models.book import Book
+
+        create_response = client.post("/books/", json=test_book_data, headers=seller_auth_headers)
+        assert client.get("/books/").json()["data"]["total"] == 1
+
+        # 캐시 무효화 없이 DB를 직접 변경
+        db_session.query(Book).filter(Book.id == create_response.json()["data"]["id"]).update(
+            {"status": "SOLDOUT"}
+        )
+        db_session.commit()
+
+        assert client.get("/books/").json()["data"]["total"] == 1
+
+    def test_get_books_total_invalidated_on_write(self, client, seller_auth_headers, test_book_data):
+        """도서 등록/삭제 시 캐시된 total 무효화"""
+        first = client.post("/books/", json=test_book_data, headers=seller_auth_headers).json()["data"]
+        assert client.get("/books/").json()["data"]["total"] == 1
+
+        client.post("/books/", json={**test_book_data, "isbn": "978-89-9999-999"}, headers=seller_auth_headers)
+        assert client.get("/books/").json()["data"]["total"] == 2
+
+        client.delete(f"/books/{first['id']}", headers=seller_auth_headers)
+        assert client.get("/books/").json()["data"]["total"] == 1
+
+
+class TestBookSearchCache:
+    """검색 결과 캐시(카탈로그 버전) 테스트"""
+
+    def test_search_results_served_from_cache(self, client, seller_auth_headers, test_book_data, db_session):
+        """동일 검색은 캐시된 id 목록으로 응답하되 도서 내용은 최신 값으로 채움"""
+        from app.models.book import Book
+
+        book = client.post("/books/", json=test_book_data, headers=seller_auth_headers).json()["data"]
+        assert [b["id"] for b in client.get("/books/", params={"keyword": "테스트"}).json()["data"]["books"]] == [book["id"]]
+
+        # 캐시 무효화 없이 DB를 직접 변경 (검색 조건에서 벗어나도록)
+        db_session.query(Book).filter(Book.id == book["id"]).update({"title": "직접수정"})
+        db_session.commit()
+
+        books = client.get("/books/", params={"keyword": "테스트"}).json()["data"]["books"]
+        assert [b["id"] for b in books] == [book["id"]]
+        assert books[0]["title"] == "직접수정"
+
+    def test_search_cache_invalidated_by_catalog_version(self, client, seller_auth_headers, test_book_data):
+        """도서 등록/수정 시 카탈로그 버전이 올라가 새 결과를 조회"""
+        first = client.post("/books/", json=test_book_data, headers=seller_auth_headers).json()["data"]
+        assert len(client.get("/books/").json()["data"]["books"]) == 1
+
+        second = client.post(
+            "/books/", json={**test_book_data, "isbn": "978-89-9999-999"}, headers=seller_auth_headers
+        ).json()["data"]
+        assert {b["id"] for b in client.get("/books/").json()["data"]["books"]} == {first["id"], second["id"]}
+
+        client.put(f"/books/{second['id']}", json={"status": "SOLDOUT"}, headers=seller_auth_headers)
+        assert [b["id"] for b in client.get("/books/").json()["data"]["books"]] == [first["id"]]
+
+    def test_search_cache_distinguishes_cursors(self, client, seller_auth_headers, test_book_data):
+        """커서가 다르면 다른 페이지로 캐싱"""
+        for i in range(3):
+            client.post("/books/", json={**test_book_data, "isbn": f"978-00-4000-00{i}"}, headers=seller_auth_headers)
+
+        first = client.get("/books/", params={"size": 1}).json()["data"]
+        second = client.get("/books/", params={"size": 1, "cursor": first["next_cursor"]}).json()["data"]
+        third = client.get("/books/", params={"size": 1, "cursor": second["next_cursor"]}).json()["data"]
+
+        ids = [page["books"][0]["id"] for page in (first, second, third)]
+        assert len(set(ids)) == 3
+
+    def test_stat_sorted_search_not_cached(self, client, seller_auth_headers, test_book_data, db_session):
+        """판매량순은 카탈로그 버전 없이 바뀌는 통계 기준이므로 캐시하지 않음"""
+        from app.models.book import Book
+
+        first = client.post("/books/", json={**test_book_data, "isbn": "978-00-4100-001"}, headers=seller_auth_headers).json()["data"]
+        second = client.post("/books/", json={**test_book_data, "isbn": "978-00-4100-002"}, headers=seller_auth_headers).json()["data"]
+        db_session.query(Book).filter(Book.id == first["id"]).update({"purchase_count": 5})
+        db_session.commit()
+        books = client.get("/books/", params={"sort": "sales"}).json()["data"]["books"]
+        assert [b["id"] for b in books] == [first["id"], second["id"]]
+
+        # 구매 집계 반영(카탈로그 버전 변경 없음) 후 순서가 바로 바뀜
+        db_session.query(Book).filter(Book.id == second["id"]).update({"purchase_count": 9})
+        db_session.commit()
+        books = client.get("/books/", params={"sort": "sales"}).json()["data"]["books"]
+        assert [b["id"] for b in books] == [second["id"], first["id"]]
+
+    def test_cached_page_keeps_cursor_of_cached_order(self, client, seller_auth_headers, test_book_data, db_session):
+        """캐시 적중 시 다음 커서는 재조회한 행이 아닌 캐시된 순서 기준"""
+        from app.models.book import Book
+
+        for i in range(2):
+            client.post("/books/", json={**test_book_data, "isbn": f"978-00-4200-00{i}"}, headers=seller_auth_headers)
+        first = client.get("/books/", params={"size": 1, "sort": "price_asc"}).json()["data"]
+
+        # 캐시 무효화 없이 DB를 직접 변경
+        db_session.query(Book).filter(Book.id == first["books"][0]["id"]).update({"price": 99999})
+        db_session.commit()
+
+        cached = client.get("/books/", params={"size": 1, "sort": "price_asc"}).json()["data"]
+        assert cached["next_cursor"] == first["next_cursor"]
+
+
+class TestBookFacets:
+    """도서 검색 패싯 테스트"""
+
+    def _create(self, client, headers, data, isbn, **fields):
+        client.post("/books/", json={**data, "isbn": isbn, **fields}, headers=headers)
+
+    def test_get_books_with_facets(self, client, seller_auth_headers, test_book_data, db_session):
+        """출판사/가격대/평점대/상태 버킷을 한 번에 집계"""
+        self._create(client, seller_auth_headers, test_book_data, "978-00-3000-001", publisher="가출판", price=9000)
+        self._create(client, seller_auth_headers, test_book_data, "978-00-3000-002", publisher="가출판", price=25000)
+        self._create(client, seller_auth_headers, test_book_data, "978-00-3000-003", publisher="나출판", price=60000)
+        self._create(client, seller_auth_headers, test_book_data, "978-00-3000-004", publisher="다출판", status="SOLDOUT")
+
+        response = client.get("/books/", params={"facets": "true"})
+
+        facets = assert_success_response(response, status_code=200)["data"]["facets"]
+        assert facets["publisher"] == [{"value": "가출판", "count": 2}, {"value": "나출판", "count": 1}]
+        assert {b["value"]: b["count"] for b in facets["price"]} == {
+            "0-10000": 1, "10000-20000": 0, "20000-30000": 1, "30000-50000": 0, "50000+": 1
+        }
+        assert facets["rating"][-1] == {"value": "0-1", "count": 3}
+        # 상태 패싯은 판매 상태 필터와 무관하게 집계
+        assert {b["value"]: b["count"] for b in facets["status"]} == {
+            "SOLDOUT": 1, "ONSALE": 3, "TOBESOLD": 0
+        }
+
+    def test_get_books_facets_follow_keyword(self, client, seller_auth_headers, test_book_data):
+        """키워드 검색 결과 기준으로 집계"""
+        self._create(client, seller_auth_headers, test_book_data, "978-00-3000-011", title="파이썬 입문", publisher="가출판")
+        self._create(client, seller_auth_headers, test_book_data, "978-00-3000-012", title="자바 입문", publisher="나출판")
+
+        response = client.get("/books/", params={"facets": "true", "keyword": "파이썬"})
+
+        facets = response.json()["data"]["facets"]
+        assert facets["publisher"] == [{"value": "가출판", "count": 1}]
+
+    def test_get_books_facets_cached_and_invalidated(self, client, seller_auth_headers, test_book_data, db_session):
+        """동일 조건 패싯은 캐시에서 제공, 도서 등록 시 무효화"""
+        from app.models.book import Book
+
+        self._create(client, seller_auth_headers, test_book_data, "978-00-3000-021")
+        client.get("/books/", params={"facets": "true"})
+
+        db_session.query(Book).update({"publisher": "직접수정"})
+        db_session.commit()
+        facets = client.get("/books/", params={"facets": "true"}).json()["data"]["facets"]
+        assert facets["publisher"] == [{"value": test_book_data["publisher"], "count": 1}]
+
+        self._create(client, seller_auth_headers, test_book_data, "978-00-3000-022")
+        facets = client.get("/books/", params={"facets": "true"}).json()["data"]["facets"]
+        assert facets["publisher"] == [
+            {"value": "직접수정", "count": 1},
+            {"value": test_book_data["publisher"], "count": 1},
+        ]
+
+    def test_get_books_without_facets(self, client):
+        """기본 요청에는 패싯 없음"""
+        response = client.get("/books/")
+
+        assert response.json()["data"]["facets"] is None
+
+
+class TestBookListQueryPlan:
+    """도서 목록 정렬 경로별 인덱스 사용 검증 (EXPLAIN QUERY PLAN)"""
+
+    @staticmethod
+    def _explain_listing(db_session, **kwargs):
+        """BookRepository.get_all이 실행하는 목록 쿼리의 실행 계획 반환"""
+        from sqlalchemy import event
+
+        from app.repositories.book_repository import BookRepository
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT") and "LIMIT" in statement:
+                statements.append((statement, parameters))
+
+        bind = db_session.get_bind()
+        event.listen(bind, "before_cursor_execute", capture)
+        try:
+            BookRepository(db_session).get_all(status="ONSALE", include_total=False, **kwargs)
+        finally:
+            event.remove(bind, "before_cursor_execute", capture)
+
+        statement, parameters = statements[-1]
+        rows = db_session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).fetchall()
+        return " | ".join(row[-1] for row in rows)
+
+    @pytest.mark.parametrize(
+        "sort, index_name",
+        [
+            ("price_asc", "ixBookStatusPrice"),
+            ("price_desc", "ixBookStatusPrice"),
+            ("date_asc", "ixBookStatusCreatedAt"),
+            ("date_desc", "ixBookStatusCreatedAt"),
+            ("rating", "ixBookStatusAverageRating"),
+            ("sales", "ixBookStatusPurchaseCount"),
+        ],
+    )
+    def test_sort_uses_index(self, db_session, sort, index_name):
+        """ONSALE 필터 + 정렬이 (status, 정렬 컬럼, id) 인덱스로 처리됨"""
+        from app.schemas.book import BookSortBy
+
+        plan = self._explain_listing(db_session, sort=BookSortBy(sort))
+
+        assert index_name in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_cursor_seek_uses_index(self, db_session):
+        """keyset 조회도 정렬 인덱스를 사용하며 별도 정렬이 없음"""
+        from decimal import Decimal
+
+        from app.schemas.book import BookSortBy
+
+        plan = self._explain_listing(
+            db_session, sort=BookSortBy.PRICE_ASC, after=(Decimal("15000"), 10)
+        )
+
+        assert "ixBookStatusPrice" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_category_listing_uses_index(self, db_session):
+        """카테고리 최신순 목록은 (status, category, createdAt, id) 인덱스 사용"""
+        from app.schemas.book import BookSortBy
+
+        plan = self._explain_listing(
+            db_session, category="NOVEL", sort=BookSortBy.DATE_DESC
+        )
+
+        assert "ixBookStatusCategoryCreatedAt" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestSuggestBooks:
+    """검색어 자동완성 테스트"""
+
+    def test_suggest_books_prefix(self, client, seller_auth_headers, test_book_data):
+        """제목/저자의 시작 또는 단어 시작과 일치, 판매 중 도서만"""
+        client.post("/books/", json={**test_book_data, "isbn": "978-00-2000-001", "title": "해리 포터"}, headers=seller_auth_headers)
+        client.post("/books/", json={**test_book_data, "isbn": "978-00-2000-002", "title": "포터의 모험"}, headers=seller_auth_headers)
+        client.post(
+            "/books/",
+            json={**test_book_data, "isbn": "978-00-2000-003", "title": "포터 미출간", "status": "TOBESOLD"},
+            headers=seller_auth_headers,
+        )
+
+        response = client.get("/books/suggest", params={"q": "포터"})
+
+        data = assert_success_response(response, status_code=200)
+        assert sorted(s["title"] for s in data["data"]["suggestions"]) == ["포터의 모험", "해리 포터"]
+        assert client.get("/books/suggest", params={"q": "테스트저"}).json()["data"]["suggestions"]
+        assert client.get("/books/suggest", params={"q": "없는제목"}).json()["data"]["suggestions"] == []
+
+    def test_suggest_books_ordered_by_sales(self, client, seller_auth_headers, test_book_data, db_session):
+        """판매량 순 정렬 및 limit 적용 (재구축 시 판매량 반영)"""
+        from app.models.book import Book
+        from app.services.book_suggest import book_suggest_index
+
+        ids = []
+        for i in range(3):
+            response = client.post(
+                "/books/",
+                json={**test_book_data, "isbn": f"978-00-2100-00{i}", "title": f"파이썬 {i}"},
+                headers=seller_auth_headers,
+            )
+            ids.append(response.json()["data"]["id"])
+        db_session.query(Book).filter(Book.id == ids[1]).update({"purchase_count": 50})
+        db_session.query(Book).filter(Book.id == ids[2]).update({"purchase_count": 10})
+        db_session.commit()
+        book_suggest_index.rebuild(db_session)
+
+        response = client.get("/books/suggest", params={"q": "파이", "limit": 2})
+
+        titles = [s["title"] for s in response.json()["data"]["suggestions"]]
+        assert titles == ["파이썬 1", "파이썬 2"]
+
+    def test_suggest_books_reflects_update_and_delete(self, client, seller_auth_headers, test_book_data):
+        """도서 수정/삭제가 색인에 즉시 반영됨"""
+        book_id = client.post("/books/", json=test_book_data, headers=seller_auth_headers).json()["data"]["id"]
+
+        client.put(f"/books/{book_id}", json={"title": "새제목"}, headers=seller_auth_headers)
+        assert client.get("/books/suggest", params={"q": "테스트도"}).json()["data"]["suggestions"] == []
+        assert len(client.get("/books/suggest", params={"q": "새제"}).json()["data"]["suggestions"]) == 1
+
+        client.delete(f"/books/{book_id}", headers=seller_auth_headers)
+        assert client.get("/books/suggest", params={"q": "새제"}).json()["data"]["suggestions"] == []
+
+    def test_suggest_ranks_whole_prefix_range(self):
+        """짧은/긴 접두어 모두 일치 범위 전체에서 판매량 상위 도서를 반환"""
+        from types import SimpleNamespace
+
+        from app.services.book_suggest import SUGGEST_TOP_K, BookSuggestIndex
+
+        def row(book_id, title, purchase_count=0):
+            return SimpleNamespace(
+                id=book_id, title=title, author="저자", publisher="출판사", purchase_count=purchase_count
+            )
+
+        index = BookSuggestIndex()
+        # 알파벳 순으로 가장 뒤에 있는 키가 가장 많이 팔린 도서
+        index.add_rows([row(i, f"book {i:05d}") for i in range(6000)])
+        index.add_rows([row(6000, "book zzz", 100)])
+
+        assert index.suggest("b", 1)[0].id == 6000
+        assert index.suggest("book", 1)[0].id == 6000
+        assert [e.id for e in index.suggest("book 0599", 20)] == list(range(5990, 6000))
+
+        # 상위 목록이 가득 찬 상태에서 제외되면 다음 순위 도서로 다시 채움
+        index.add_rows([row(6001 + i, f"book best {i}", 50 - i) for i in range(SUGGEST_TOP_K - 1)])
+        index.remove(6000)
+        top = index.suggest("b", SUGGEST_TOP_K)
+        assert len(top) == SUGGEST_TOP_K
+        assert top[0].id == 6001
+        assert top[-1].id == 0  # 판매량이 같으면 제목 순
+
 
 class TestGetBookDetail:
     """도서 상세 조회 테스트"""
@@ -108,6 +807,81 @@ class TestGetBookDetail:
 
         assert_error_response(response, status_code=404)
 
+    def test_get_book_detail_not_modified(self, client, seller_auth_headers, test_book_data):
+        """If-None-Match가 현재 ETag와 일치하면 304, 변경 후에는 200"""
+        book_id = client.post("/books/", json=test_book_data, headers=seller_auth_headers).json()["data"]["id"]
+
+        first = client.get(f"/books/{book_id}")
+        etag = first.headers["etag"]
+
+        response = client.get(f"/books/{book_id}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        client.put(f"/books/{book_id}", json={"price": 20000}, headers=seller_auth_headers)
+
+        response = client.get(f"/books/{book_id}", headers={"If-None-Match": etag})
+        data = assert_success_response(response, status_code=200)
+        assert float(data["data"]["price"]) == 20000
+        assert response.headers["etag"] != etag
+
+    def test_get_book_detail_served_from_cache(self, client, seller_auth_headers, test_book_data, db_session):
+        """캐시 적중 시 DB를 조회하지 않음 (서비스를 거치지 않은 변경은 반영되지 않음)"""
+        from app.models.book import Book
+        from app.services.book_cache import BookDetailCache
+
+        book_id = client.post("/books/", json=test_book_data, headers=seller_auth_headers).json()["data"]["id"]
+        assert client.get(f"/books/{book_id}").json()["data"]["title"] == test_book_data["title"]
+
+        db_session.query(Book).filter(Book.id == book_id).update({"title": "직접수정"})
+        db_session.commit()
+
+        # 워커 로컬 캐시와 Redis 캐시 모두에서 제공
+        assert client.get(f"/books/{book_id}").json()["data"]["title"] == test_book_data["title"]
+        BookDetailCache.clear_local()
+        assert client.get(f"/books/{book_id}").json()["data"]["title"] == test_book_data["title"]
+
+    def test_invalidation_during_load_discards_stale_write(self, mock_sync_redis_client):
+        """DB 조회 중 invalidate()가 실행되면 조회한 이전 값은 캐시되지 않음"""
+        from datetime import datetime
+        from decimal import Decimal
+
+        from app.schemas.book import BookResponse
+        from app.services.book_cache import BookDetailCache
+
+        def book(title):
+            return BookResponse(
+                id=1, seller_id=1, title=title, author="저자", publisher="출판사", summary="요약",
+                isbn="978-00-3000-001", price=Decimal("10000"), status="ONSALE",
+                average_rating=Decimal("0"), review_count=0, purchase_count=0,
+                created_at=datetime(2026, 10, 17),
+            )
+
+        def load_then_updated(book_id):
+            stale = book("이전제목")
+            # 조회 직후 다른 요청이 수정을 커밋하고 캐시를 무효화
+            BookDetailCache.invalidate([book_id])
+            return stale
+
+        assert BookDetailCache.get_or_load(1, load_then_updated).title == "이전제목"
+
+        current = book("새제목")
+        assert BookDetailCache.get_or_load(1, lambda book_id: current) == current
+        BookDetailCache.clear_local()
+        assert BookDetailCache.get_or_load(1, lambda book_id: None) == current  # Redis 적중
+
+    def test_get_book_detail_invalidated_on_update(self, client, seller_auth_headers, test_book_data):
+        """도서 수정/삭제 시 상세 캐시 무효화"""
+        book_id = client.post("/books/", json=test_book_data, headers=seller_auth_headers).json()["data"]["id"]
+        client.get(f"/books/{book_id}")
+
+        client.put(f"/books/{book_id}", json={"title": "수정된제목"}, headers=seller_auth_headers)
+        assert client.get(f"/books/{book_id}").json()["data"]["title"] == "수정된제목"
+
+        client.delete(f"/books/{book_id}", headers=seller_auth_headers)
+        assert client.get(f"/books/{book_id}").json()["data"]["status"] == "SOLDOUT"
+
 
 class TestUpdateBook:
     """도서 수정 테스트"""
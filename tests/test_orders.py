@@ -6,6 +6,8 @@ Orders API 테스트
 - POST /orders/{order_id}/cancel: 주문 취소
 - GET /admin/orders: 전체 주문 조회 (Admin)
 """
+from datetime import datetime
+
 import pytest
 from tests.conftest import assert_success_response, assert_error_response
 
@@ -94,15 +96,15 @@ class TestCreateOrder:
             에러 발생 시 예외가 발생하며, 부분적으로 생성된
             데이터가 커밋되지 않고 롤백됩니다.
         """
-        from app.repositories.book_repository import BookRepository
+        from app.repositories.cart_repository import CartRepository
 
-        # BookRepository의 update_stats에서 의도적으로 에러 발생시키기
-        def failing_update_stats(*args, **kwargs):
-            # 판매량 업데이트 중 에러를 발생시켜 롤백을 유도
+        # 트랜잭션 마지막 단계인 장바구니 비우기에서 의도적으로 에러 발생시키기
+        def failing_delete_multiple(*args, **kwargs):
+            # 주문/아이템 INSERT 이후 에러를 발생시켜 롤백을 유도
             raise Exception("Intentional error for rollback test")
 
         monkeypatch.setattr(
-            BookRepository, "update_stats", failing_update_stats
+            CartRepository, "delete_multiple", failing_delete_multiple
         )
 
         # 주문 생성 시도 - 에러 발생 예상
@@ -117,6 +119,119 @@ class TestCreateOrder:
 
         # 에러 발생 확인만으로도 롤백 메커니즘이 작동했음을 검증
         # (UnitOfWork의 __exit__에서 예외 발생 시 자동 rollback 수행)
+        from app.models.order import Order
+
+        assert db_session.query(Order).count() == 0
+
+    def test_create_order_statement_count_independent_of_cart_size(
+        self, client, buyer_headers, seller_auth_headers, test_book_data, db_session
+    ):
+        """장바구니 크기와 관계없이 주문 생성 SQL 문 수가 일정"""
+        from sqlalchemy import event
+
+        from app.models.book import Book
+        from tests.conftest import engine
+
+        def checkout(book_count):
+            book_ids = []
+            for i in range(book_count):
+                book = {
+                    **test_book_data,
+                    "title": f"{book_count}권 주문 도서 {i}",
+                    "isbn": f"978-{book_count}-{i:04d}",
+                }
+                response = client.post("/books/", json=book, headers=seller_auth_headers)
+                book_ids.append(response.json()["data"]["id"])
+                client.post(
+                    "/carts/",
+                    json={"book_id": book_ids[-1], "quantity": i + 1},
+                    headers=buyer_headers,
+                )
+
+            statements = []
+
+            def capture(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(engine, "before_cursor_execute", capture)
+            try:
+                response = client.post("/orders/", json={}, headers=buyer_headers)
+            finally:
+                event.remove(engine, "before_cursor_execute", capture)
+
+            data = assert_success_response(response, status_code=201)
+            assert [item["book_id"] for item in data["data"]["items"]] == book_ids
+            assert [item["quantity"] for item in data["data"]["items"]] == list(
+                range(1, book_count + 1)
+            )
+            db_session.expire_all()
+            counts = [db_session.get(Book, book_id).purchase_count for book_id in book_ids]
+            assert counts == list(range(1, book_count + 1))
+            return statements
+
+        one = checkout(1)
+        many = checkout(5)
+
+        assert len(many) == len(one)
+        assert sum("UPDATE book" in s for s in many) == 1
+
+
+class TestOrderIdempotency:
+    """Idempotency-Key 헤더를 사용한 주문 생성 재시도"""
+
+    def test_retry_returns_first_result(self, client, buyer_headers, cart_with_item, db_session):
+        """같은 키로 재시도하면 주문을 다시 만들지 않고 첫 응답을 반환"""
+        from app.models.book import Book
+        from app.models.order import Order
+
+        headers = {**buyer_headers, "Idempotency-Key": "checkout-1"}
+        first = client.post("/orders/", json={}, headers=headers)
+        retry = client.post("/orders/", json={}, headers=headers)
+
+        first_data = assert_success_response(first, status_code=201)["data"]
+        retry_data = assert_success_response(retry, status_code=201)["data"]
+        assert retry_data == first_data
+        assert db_session.query(Order).count() == 1
+        assert db_session.get(Book, cart_with_item["id"]).purchase_count == 2
+
+    def test_key_reused_with_different_body(self, client, buyer_headers, cart_with_item):
+        """같은 키로 다른 요청 본문을 보내면 422"""
+        headers = {**buyer_headers, "Idempotency-Key": "checkout-1"}
+        client.post("/orders/", json={}, headers=headers)
+
+        response = client.post("/orders/", json={"cart_item_ids": [1]}, headers=headers)
+
+        assert_error_response(response, status_code=422, error_code="IDEMPOTENCY_KEY_REUSED")
+
+    def test_request_in_progress(self, client, buyer_headers, cart_with_item, mock_sync_redis_client):
+        """첫 요청이 처리 중이면 409"""
+        import hashlib
+        import json
+
+        from app.schemas.order import OrderCreate
+
+        user_id = client.get("/users/me", headers=buyer_headers).json()["data"]["id"]
+        fingerprint = hashlib.sha1(OrderCreate().model_dump_json().encode()).hexdigest()
+        mock_sync_redis_client.set(
+            f"idempotency:order:{user_id}:checkout-1", json.dumps({"fingerprint": fingerprint})
+        )
+
+        response = client.post(
+            "/orders/", json={}, headers={**buyer_headers, "Idempotency-Key": "checkout-1"}
+        )
+
+        assert_error_response(response, status_code=409, error_code="ORDER_REQUEST_IN_PROGRESS")
+
+    def test_failed_request_can_be_retried(self, client, buyer_headers, created_book):
+        """주문 생성이 실패하면 같은 키로 다시 시도 가능"""
+        headers = {**buyer_headers, "Idempotency-Key": "checkout-1"}
+        failed = client.post("/orders/", json={}, headers=headers)
+        assert_error_response(failed, status_code=400, error_code="CART_EMPTY")
+
+        client.post("/carts/", json={"book_id": created_book["id"], "quantity": 1}, headers=buyer_headers)
+        response = client.post("/orders/", json={}, headers=headers)
+
+        assert_success_response(response, status_code=201)
 
 
 class TestGetOrders:
@@ -139,6 +254,77 @@ class TestGetOrders:
         data = assert_success_response(response, status_code=200)
         assert data["data"]["total"] == 1
 
+    def test_get_orders_total_updates_after_order(self, client, buyer_headers, cart_with_item):
+        """주문 생성 후 캐시된 total 무효화"""
+        assert client.get("/orders/", headers=buyer_headers).json()["data"]["total"] == 0
+
+        client.post("/orders/", json={}, headers=buyer_headers)
+
+        response = client.get("/orders/", headers=buyer_headers)
+        data = assert_success_response(response, status_code=200)
+        assert data["data"]["total"] == 1
+
+    def test_get_orders_without_total(self, client, buyer_headers, cart_with_item):
+        """include_total=false이면 개수 집계 생략"""
+        client.post("/orders/", json={}, headers=buyer_headers)
+
+        response = client.get("/orders/", params={"include_total": "false"}, headers=buyer_headers)
+
+        data = assert_success_response(response, status_code=200)
+        assert data["data"]["total"] is None
+        assert len(data["data"]["orders"]) == 1
+
+    def test_get_orders_with_cursor(self, client, buyer_headers, created_book):
+        """next_cursor로 모든 주문을 최신순으로 중복 없이 순회"""
+        order_ids = []
+        for _ in range(5):
+            client.post(
+                "/carts/", json={"book_id": created_book["id"], "quantity": 1}, headers=buyer_headers
+            )
+            order_ids.append(client.post("/orders/", json={}, headers=buyer_headers).json()["data"]["id"])
+
+        seen = []
+        params = {"size": 2}
+        while True:
+            data = client.get("/orders/", params=params, headers=buyer_headers).json()["data"]
+            seen.extend(o["id"] for o in data["orders"])
+            assert all(len(o["items"]) == 1 for o in data["orders"])
+            if not data["next_cursor"]:
+                break
+            params = {"size": 2, "cursor": data["next_cursor"]}
+
+        assert seen == list(reversed(order_ids))
+
+    def test_get_orders_invalid_cursor(self, client, buyer_headers):
+        """잘못된 커서는 400"""
+        response = client.get("/orders/", params={"cursor": "not-a-cursor"}, headers=buyer_headers)
+
+        assert_error_response(response, status_code=400, error_code="INVALID_CURSOR")
+
+    def test_get_orders_page_query_does_not_join_items(self, client, buyer_headers, cart_with_item):
+        """주문 id 페이지 조회와 아이템/도서 로딩이 분리되어 있어야 함"""
+        from sqlalchemy import event
+
+        from tests.conftest import engine
+
+        client.post("/orders/", json={}, headers=buyer_headers)
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            response = client.get("/orders/", params={"include_total": "false"}, headers=buyer_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert len(assert_success_response(response)["data"]["orders"][0]["items"]) == 1
+        paged = [s for s in statements if "LIMIT" in s]
+        assert len(paged) == 1
+        assert '"orderItem"' not in paged[0] and "JOIN" not in paged[0]
+        assert any('FROM "orderItem"' in s for s in statements)
+
 
 class TestGetOrderDetail:
     """주문 상세 조회 테스트"""
@@ -176,6 +362,17 @@ class TestCancelOrder:
         data = assert_success_response(response, status_code=200)
         assert data["data"]["status"] == "REFUND"
 
+    def test_order_updates_cached_book_detail(self, client, buyer_headers, cart_with_item):
+        """주문 생성/취소 후 도서 상세의 판매량이 갱신됨 (상세 캐시 무효화)"""
+        book_id = cart_with_item["id"]
+        assert client.get(f"/books/{book_id}").json()["data"]["purchase_count"] == 0
+
+        order_id = client.post("/orders/", json={}, headers=buyer_headers).json()["data"]["id"]
+        assert client.get(f"/books/{book_id}").json()["data"]["purchase_count"] == 2
+
+        client.post(f"/orders/{order_id}/cancel", headers=buyer_headers)
+        assert client.get(f"/books/{book_id}").json()["data"]["purchase_count"] == 0
+
     def test_cancel_order_not_found(self, client, buyer_headers):
         """존재하지 않는 주문 취소"""
         response = client.post("/orders/99999/cancel", headers=buyer_headers)
@@ -196,8 +393,449 @@ class TestAdminOrders:
         data = assert_success_response(response, status_code=200)
         assert data["data"]["total"] == 1
 
+    def test_get_all_orders_with_cursor(self, client, admin_headers, buyer_headers, created_book):
+        """관리자 주문 목록 keyset 페이지네이션 (상태 필터 포함)"""
+        order_ids = []
+        for _ in range(3):
+            client.post(
+                "/carts/", json={"book_id": created_book["id"], "quantity": 1}, headers=buyer_headers
+            )
+            order_ids.append(client.post("/orders/", json={}, headers=buyer_headers).json()["data"]["id"])
+        client.post(f"/orders/{order_ids[1]}/cancel", headers=buyer_headers)
+
+        params = {"size": 1, "status": "CREATED"}
+        first = client.get("/admin/orders", params=params, headers=admin_headers).json()["data"]
+        second = client.get(
+            "/admin/orders", params={**params, "cursor": first["next_cursor"]}, headers=admin_headers
+        ).json()["data"]
+
+        assert [o["id"] for o in first["orders"] + second["orders"]] == [order_ids[2], order_ids[0]]
+        assert second["total"] == 2
+
     def test_get_all_orders_not_admin(self, client, buyer_headers):
         """일반 사용자로 관리자 API 접근"""
         response = client.get("/admin/orders", headers=buyer_headers)
 
         assert_error_response(response, status_code=403)
+
+
+class TestOrderListingIndexes:
+    """주문 목록 조회 경로별 인덱스 사용 검증 (EXPLAIN QUERY PLAN)"""
+
+    @staticmethod
+    def _explain_listing(db_session, method, *args, **kwargs):
+        """OrderRepository 목록 메서드가 실행하는 주문 id 페이지 쿼리의 실행 계획 반환"""
+        from sqlalchemy import event
+
+        from app.repositories.order_repository import OrderRepository
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT") and "LIMIT" in statement:
+                statements.append((statement, parameters))
+
+        bind = db_session.get_bind()
+        event.listen(bind, "before_cursor_execute", capture)
+        try:
+            getattr(OrderRepository(db_session), method)(*args, include_total=False, **kwargs)
+        finally:
+            event.remove(bind, "before_cursor_execute", capture)
+
+        statement, parameters = statements[-1]
+        rows = db_session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).fetchall()
+        return " | ".join(row[-1] for row in rows)
+
+    @pytest.mark.parametrize("after", [None, (datetime(2026, 1, 1), 100)])
+    def test_user_orders_use_index(self, db_session, after):
+        """내 주문 목록은 (userId, createdAt, id) 인덱스로 필터+정렬"""
+        plan = self._explain_listing(db_session, "get_by_user_id", 1, after=after)
+
+        assert "ixOrderUserIdCreatedAt" in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.parametrize("after", [None, (datetime(2026, 1, 1), 100)])
+    def test_status_orders_use_index(self, db_session, after):
+        """상태별 관리자 목록은 (status, createdAt, id) 인덱스로 필터+정렬"""
+        plan = self._explain_listing(db_session, "get_all", status="CREATED", after=after)
+
+        assert "ixOrderStatusCreatedAt" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_all_orders_use_index(self, db_session):
+        """상태 필터 없는 관리자 목록도 정렬 인덱스를 사용 (전체 스캔 + 정렬 없음)"""
+        plan = self._explain_listing(db_session, "get_all")
+
+        assert "ixOrderCreatedAt" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestOrderEvents:
+    """주문 이벤트 배치 처리 (queue / Redis Streams 백엔드)"""
+
+    @staticmethod
+    def _events(book_id):
+        from app.services.order_events import OrderCancelled, OrderCreated
+
+        return [
+            OrderCreated(1, 1, {book_id: 2}),
+            OrderCreated(2, 1, {book_id: 3}),
+            OrderCancelled(1, 1, {book_id: 2}),
+        ]
+
+    @staticmethod
+    def _purchase_count(book_id):
+        from app.models.book import Book
+        from tests.conftest import TestingSessionLocal
+
+        with TestingSessionLocal() as db:
+            return db.get(Book, book_id).purchase_count
+
+    def test_queue_backend_applies_batch(self, created_book, monkeypatch):
+        """로컬 큐에 쌓인 이벤트를 도서별 합계 UPDATE 한 번으로 반영"""
+        from app.repositories.book_repository import BookRepository
+        from app.services.order_events import OrderEventBus
+        from tests.conftest import TestingSessionLocal
+
+        calls = []
+        original = BookRepository.increment_purchase_counts
+
+        def spy(self, quantities, **kwargs):
+            calls.append(dict(quantities))
+            return original(self, quantities, **kwargs)
+
+        monkeypatch.setattr(BookRepository, "increment_purchase_counts", spy)
+        bus = OrderEventBus("queue", TestingSessionLocal, flush_seconds=0.05)
+        for event in self._events(created_book["id"]):
+            bus.publish(event)
+        assert self._purchase_count(created_book["id"]) == 0  # 요청 경로에서는 미반영
+
+        bus.start()
+        bus.stop()
+
+        assert calls == [{created_book["id"]: 3}]
+        assert self._purchase_count(created_book["id"]) == 3
+
+    def test_cancel_applied_before_create(self, created_book):
+        """다른 배치의 취소가 생성보다 먼저 반영되어도 최종 판매량이 맞음 (0 하한 없음)"""
+        from app.services.order_events import OrderCancelled, OrderCreated, apply_order_events
+        from tests.conftest import TestingSessionLocal
+
+        book_id = created_book["id"]
+        with TestingSessionLocal() as db:
+            apply_order_events(db, [OrderCancelled(1, 1, {book_id: 2})])
+        with TestingSessionLocal() as db:
+            apply_order_events(db, [OrderCreated(1, 1, {book_id: 2})])
+
+        assert self._purchase_count(book_id) == 0
+
+    def test_queue_backend_retries_failed_batch(self, created_book, monkeypatch):
+        """반영에 실패한 배치는 버리지 않고 큐에 되돌려 재시도"""
+        import time
+
+        from app.services import order_events
+        from app.services.order_events import OrderEventBus
+        from tests.conftest import TestingSessionLocal
+
+        failures = []
+        original = order_events.apply_order_events
+
+        def flaky(db, events):
+            if not failures:
+                failures.append(len(events))
+                raise RuntimeError("database is locked")
+            return original(db, events)
+
+        monkeypatch.setattr(order_events, "apply_order_events", flaky)
+        monkeypatch.setattr(order_events, "WORKER_RETRY_SECONDS", 0.01)
+        bus = OrderEventBus("queue", TestingSessionLocal, flush_seconds=0.05)
+        for event in self._events(created_book["id"]):
+            bus.publish(event)
+
+        bus.start()
+        try:
+            deadline = time.monotonic() + 5
+            while self._purchase_count(created_book["id"]) != 3 and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            bus.stop()
+
+        assert failures == [3]
+        assert self._purchase_count(created_book["id"]) == 3
+
+    def test_redis_backend_consumes_stream(self, created_book, mock_sync_redis_client, monkeypatch):
+        """Redis Streams 소비자 그룹으로 반영 후 ACK (종료된 워커가 ACK하지 못한 항목 회수 포함)"""
+        import time
+
+        from app.core.redis import RedisKeys
+        from app.services import order_events
+        from app.services.order_events import OrderEventBus
+        from tests.conftest import TestingSessionLocal
+
+        monkeypatch.setattr(order_events, "ORDER_EVENT_CLAIM_IDLE_MS", 0)
+        # 폴링과 워커가 같은 인메모리 DB 연결을 공유하므로 반영 실패 시 빠르게 재시도
+        monkeypatch.setattr(order_events, "WORKER_RETRY_SECONDS", 0.01)
+        stream, group = RedisKeys.ORDER_EVENT_STREAM, RedisKeys.ORDER_EVENT_GROUP
+        bus = OrderEventBus("redis", TestingSessionLocal, flush_seconds=0.05)
+        first, *rest = self._events(created_book["id"])
+        bus.publish(first)
+        # 이전 프로세스(다른 pid의 소비자)가 받았지만 반영/ACK하지 못한 항목
+        mock_sync_redis_client.xgroup_create(stream, group, id="0")
+        mock_sync_redis_client.xreadgroup(group, "crashed-worker-1", {stream: ">"})
+        for event in rest:
+            bus.publish(event)
+
+        bus.start()
+        try:
+            deadline = time.monotonic() + 5
+            while self._purchase_count(created_book["id"]) != 3 and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            bus.stop()
+
+        assert self._purchase_count(created_book["id"]) == 3
+        assert mock_sync_redis_client.get(stream)["groups"][group]["pending"] == {}
+
+
+class TestPurchaseCountWriteBehind:
+    """판매량 write-behind 모드 (Redis 누적 후 주기 반영)"""
+
+    @pytest.fixture(autouse=True)
+    def write_behind(self, monkeypatch, mock_sync_redis_client):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "PURCHASE_COUNT_WRITE_BEHIND", True)
+        return mock_sync_redis_client
+
+    def test_reads_merge_pending_count(self, client, buyer_headers, cart_with_item, db_session):
+        """주문 시 DB는 그대로, 도서 조회 응답에는 미반영 수량이 더해짐"""
+        from app.models.book import Book
+
+        book_id = cart_with_item["id"]
+        client.post("/orders/", json={}, headers=buyer_headers)
+
+        assert db_session.get(Book, book_id).purchase_count == 0
+        assert client.get(f"/books/{book_id}").json()["data"]["purchase_count"] == 2
+        books = client.get("/books/").json()["data"]["books"]
+        assert [b["purchase_count"] for b in books if b["id"] == book_id] == [2]
+
+    def test_flush_applies_pending_counts(self, client, buyer_headers, cart_with_item, write_behind):
+        """주기 작업이 누적 수량을 DB에 반영하고 해시를 비움"""
+        from app.core.redis import RedisKeys
+        from app.models.book import Book
+        from app.services.purchase_counter import PurchaseCounter
+        from tests.conftest import TestingSessionLocal
+
+        book_id = cart_with_item["id"]
+        client.post("/orders/", json={}, headers=buyer_headers)
+
+        with TestingSessionLocal() as db:
+            assert PurchaseCounter.flush(db) == 1
+            assert db.get(Book, book_id).purchase_count == 2
+
+        assert not write_behind.exists(RedisKeys.PURCHASE_COUNT_PENDING)
+        assert not write_behind.exists(RedisKeys.PURCHASE_COUNT_FLUSHING)
+        assert not write_behind.exists(RedisKeys.PURCHASE_COUNT_FLUSH_LOCK)
+        assert client.get(f"/books/{book_id}").json()["data"]["purchase_count"] == 2
+        with TestingSessionLocal() as db:
+            assert PurchaseCounter.flush(db) == 0  # 누적된 항목 없음
+
+    def test_flush_keeps_lock_taken_over_by_another_worker(
+        self, client, buyer_headers, cart_with_item, write_behind, monkeypatch
+    ):
+        """잠금 TTL을 넘긴 반영 작업은 다른 워커가 새로 건 잠금을 지우지 않음"""
+        from app.core.redis import RedisKeys
+        from app.repositories.book_repository import BookRepository
+        from app.services.purchase_counter import PurchaseCounter
+        from tests.conftest import TestingSessionLocal
+
+        client.post("/orders/", json={}, headers=buyer_headers)
+        original = BookRepository.increment_purchase_counts
+
+        def slow_update(self, quantities, **kwargs):
+            # 반영 중 잠금이 만료되고 다른 워커가 잠금을 획득
+            write_behind.delete(RedisKeys.PURCHASE_COUNT_FLUSH_LOCK)
+            write_behind.set(RedisKeys.PURCHASE_COUNT_FLUSH_LOCK, "other-worker", nx=True)
+            return original(self, quantities, **kwargs)
+
+        monkeypatch.setattr(BookRepository, "increment_purchase_counts", slow_update)
+        with TestingSessionLocal() as db:
+            assert PurchaseCounter.flush(db) == 1
+
+        assert write_behind.get(RedisKeys.PURCHASE_COUNT_FLUSH_LOCK) == "other-worker"
+
+    def test_batch_committed_before_hash_delete_not_counted_twice(
+        self, client, buyer_headers, cart_with_item, write_behind, monkeypatch
+    ):
+        """커밋 후 해시 삭제 전에 중단된 배치는 조회/재반영 시 중복 합산되지 않음"""
+        from app.core.redis import RedisKeys
+        from app.models.book import Book
+        from app.services.purchase_counter import PurchaseCounter
+        from tests.conftest import TestingSessionLocal
+
+        book_id = cart_with_item["id"]
+        client.post("/orders/", json={}, headers=buyer_headers)
+        original_delete = write_behind.delete
+
+        def crash_on_flushing_delete(*keys):
+            if RedisKeys.PURCHASE_COUNT_FLUSHING in keys:
+                raise ConnectionError("worker stopped")
+            return original_delete(*keys)
+
+        monkeypatch.setattr(write_behind, "delete", crash_on_flushing_delete)
+        with TestingSessionLocal() as db:
+            with pytest.raises(ConnectionError):
+                PurchaseCounter.flush(db)
+        monkeypatch.setattr(write_behind, "delete", original_delete)
+
+        assert write_behind.exists(RedisKeys.PURCHASE_COUNT_FLUSHING)
+        assert client.get(f"/books/{book_id}").json()["data"]["purchase_count"] == 2
+
+        with TestingSessionLocal() as db:
+            assert PurchaseCounter.flush(db) == 0  # 이미 반영된 배치
+            assert db.get(Book, book_id).purchase_count == 2
+        assert not write_behind.exists(RedisKeys.PURCHASE_COUNT_FLUSHING)
+
+    def test_cancel_after_flush(self, client, buyer_headers, cart_with_item):
+        """반영된 주문을 취소하면 음수 증감이 누적되어 조회/반영에 반영됨"""
+        from app.models.book import Book
+        from app.services.purchase_counter import PurchaseCounter
+        from tests.conftest import TestingSessionLocal
+
+        book_id = cart_with_item["id"]
+        order_id = client.post("/orders/", json={}, headers=buyer_headers).json()["data"]["id"]
+        with TestingSessionLocal() as db:
+            PurchaseCounter.flush(db)
+
+        client.post(f"/orders/{order_id}/cancel", headers=buyer_headers)
+        assert client.get(f"/books/{book_id}").json()["data"]["purchase_count"] == 0
+
+        with TestingSessionLocal() as db:
+            PurchaseCounter.flush(db)
+            assert db.get(Book, book_id).purchase_count == 0
+
+    def test_falls_back_to_update_without_redis(self, client, buyer_headers, cart_with_item, monkeypatch):
+        """Redis 장애 시 기존처럼 DB에 바로 반영"""
+        from app.models.book import Book
+        from app.services.purchase_counter import PurchaseCounter
+        from tests.conftest import TestingSessionLocal
+
+        def unavailable(deltas):
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(PurchaseCounter, "add", staticmethod(unavailable))
+        client.post("/orders/", json={}, headers=buyer_headers)
+
+        with TestingSessionLocal() as db:
+            assert db.get(Book, cart_with_item["id"]).purchase_count == 2
+
+
+class TestConcurrentOrders:
+    """동일 도서에 대한 동시 주문/취소 시 판매량 정합성"""
+
+    @pytest.fixture
+    def session_factory(self, tmp_path):
+        """동시 트랜잭션용 파일 DB 세션 팩토리.
+
+        테스트 공용 인메모리 DB(StaticPool)는 연결이 하나뿐이라 트랜잭션이
+        동시에 열릴 수 없으므로, 연결 풀을 쓰는 별도 파일 DB를 사용합니다.
+        """
+        from sqlalchemy import create_engine, event
+        from sqlalchemy.orm import sessionmaker
+
+        from app.core.database import Base
+
+        file_engine = create_engine(
+            f"sqlite:///{tmp_path / 'concurrency.db'}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+            pool_size=16,
+        )
+
+        @event.listens_for(file_engine, "connect")
+        def skip_fsync(dbapi_connection, connection_record):
+            dbapi_connection.execute("PRAGMA synchronous=OFF")
+
+        Base.metadata.create_all(bind=file_engine)
+        yield sessionmaker(autocommit=False, autoflush=False, bind=file_engine)
+        file_engine.dispose()
+
+    def test_parallel_orders_and_cancellations(self, session_factory, monkeypatch):
+        """수백 건의 동시 주문/취소 후에도 판매량 누락이 없어야 함"""
+        from concurrent.futures import ThreadPoolExecutor
+        from decimal import Decimal
+
+        from app.exceptions.order_exceptions import OrderCancelNotAllowedException
+        from app.models.book import Book
+        from app.models.cart import Cart
+        from app.models.seller_profile import SellerProfile
+        from app.models.user import User
+        from app.schemas.order import OrderCreate
+        from app.services.order_events import order_event_bus
+        from app.services.order_service import OrderService
+
+        # 주문 이벤트도 같은 파일 DB에 반영
+        monkeypatch.setattr(order_event_bus, "session_factory", session_factory)
+        order_count, quantity = 200, 2
+
+        with session_factory() as db:
+            seller = User(role="seller", email="seller@example.com", password="x", name="판매자")
+            db.add(seller)
+            db.flush()
+            profile = SellerProfile(
+                user_id=seller.id,
+                business_name="동시성 서점",
+                business_number="123-45-67890",
+                email="shop@example.com",
+            )
+            db.add(profile)
+            db.flush()
+            book = Book(
+                seller_id=profile.id,
+                status="ONSALE",
+                title="베스트셀러",
+                author="저자",
+                publisher="출판사",
+                summary="요약",
+                isbn="978-89-0000-001",
+                price=Decimal("10000"),
+            )
+            buyers = [
+                User(email=f"buyer{i}@example.com", password="x", name=f"구매자{i}")
+                for i in range(order_count)
+            ]
+            db.add_all([book, *buyers])
+            db.flush()
+            db.add_all(
+                Cart(user_id=buyer.id, book_id=book.id, quantity=quantity)
+                for buyer in buyers
+            )
+            db.commit()
+            book_id, buyer_ids = book.id, [buyer.id for buyer in buyers]
+
+        def order(user_id):
+            with session_factory() as db:
+                return OrderService(db).create_order(user_id, OrderCreate()).id
+
+        def cancel(user_id, order_id):
+            with session_factory() as db:
+                try:
+                    OrderService(db).cancel_order(user_id, order_id)
+                    return True
+                except OrderCancelNotAllowedException:
+                    return False
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            order_ids = list(pool.map(order, buyer_ids))
+
+            # 절반의 주문을 두 요청이 동시에 취소 (한 요청만 성공해야 함)
+            cancel_users = buyer_ids[::2] * 2
+            cancel_orders = order_ids[::2] * 2
+            results = list(pool.map(cancel, cancel_users, cancel_orders))
+
+        cancelled = len(order_ids[::2])
+        assert results.count(True) == cancelled
+        with session_factory() as db:
+            final_count = db.get(Book, book_id).purchase_count
+        assert final_count == (order_count - cancelled) * quantity
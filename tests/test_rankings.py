@@ -89,6 +89,15 @@ class TestGetRankings:
         data = assert_success_response(response, status_code=200)
         assert len(data["data"]["rankings"]) <= 3
 
+    def test_get_rankings_not_modified(self, client):
+        """If-None-Match가 현재 ETag와 일치하면 304"""
+        etag = client.get("/rankings/").headers["etag"]
+
+        response = client.get("/rankings/", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
     def test_get_rankings_invalid_type(self, client):
         """잘못된 랭킹 타입 (422 Validation Error)"""
         response = client.get("/rankings/?type=invalidType")
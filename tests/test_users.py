@@ -131,6 +131,73 @@ class TestAdminUserManagement:
         data = assert_success_response(response, status_code=200)
         assert data["data"]["role"] == "seller"
 
+    def test_update_user_role_applies_to_existing_token(self, client, admin_headers, auth_headers):
+        """권한 변경 시 인증 주체 캐시가 무효화되어 기존 토큰에 바로 반영"""
+        user_id = client.get("/users/me", headers=auth_headers).json()["data"]["id"]
+        assert client.get("/settlements/", headers=auth_headers).status_code == 403
+
+        client.patch(f"/users/{user_id}/role", json={"role": "seller"}, headers=admin_headers)
+
+        # 판매자 권한 검사는 통과 (판매자 프로필이 없어 404)
+        response = client.get("/settlements/", headers=auth_headers)
+        assert_error_response(response, status_code=404, error_code="SELLER_NOT_FOUND")
+
+
+class TestPrincipalCache:
+    """인증 주체 캐시 테스트"""
+
+    def test_authenticated_request_skips_user_query(self, client, auth_headers):
+        """캐시 적중 시 인증 과정에서 사용자 테이블을 조회하지 않음"""
+        from sqlalchemy import event
+
+        from tests.conftest import engine
+
+        client.get("/carts/", headers=auth_headers)
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            response = client.get("/carts/", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert_success_response(response, status_code=200)
+        assert not any('FROM "user"' in s or "FROM user" in s for s in statements)
+
+    def test_principal_served_from_cache(self, client, auth_headers, db_session):
+        """서비스를 거치지 않은 권한 변경은 캐시 TTL 동안 반영되지 않음"""
+        from app.models.user import User
+
+        user_id = client.get("/users/me", headers=auth_headers).json()["data"]["id"]
+
+        db_session.query(User).filter(User.id == user_id).update({"role": "admin"})
+        db_session.commit()
+
+        response = client.get("/users/", headers=auth_headers)
+        assert_error_response(response, status_code=403, error_code="AUTH_FORBIDDEN")
+
+    def test_invalidation_during_load_discards_stale_write(self, mock_sync_redis_client):
+        """DB 조회 중 invalidate()가 실행되면 조회한 이전 값은 다음 요청에서 사용되지 않음"""
+        from app.services.principal_cache import Principal, PrincipalCache
+
+        def load_then_deactivated(user_id):
+            principal = Principal(id=user_id, role="admin", is_active=True)
+            # 조회 직후 다른 요청이 비활성화를 커밋하고 캐시를 무효화
+            PrincipalCache.invalidate(user_id)
+            return principal
+
+        assert PrincipalCache.get_or_load(1, load_then_deactivated).is_active is True
+
+        PrincipalCache.clear_local()  # 다른 워커에서 조회
+        current = Principal(id=1, role="user", is_active=False)
+        assert PrincipalCache.get_or_load(1, lambda user_id: current) == current
+        PrincipalCache.clear_local()
+        assert PrincipalCache.get_or_load(1, lambda user_id: None) == current  # Redis 적중
+
 
 class TestUserDeactivation:
     """사용자 계정 비활성화 테스트"""